@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import unittest
+import numpy as np
+import wafamole.tokenizer.allowed_tokens as alt
+
+
+class AllowedTokensTest(unittest.TestCase):
+    def test_token_ids_match_first_occurrence(self):
+        for t in alt.TOKENS:
+            self.assertEqual(alt.TOKEN_IDS[t], alt.TOKENS.index(t))
+
+    def test_encode_tokens_ok(self):
+        tokens = ["WHERE", "STR", "EQ", "INT", "OR", "INT", "EQ", "INT"]
+        expected = np.array([alt.TOKENS.index(t) for t in tokens])
+        actual = alt.encode_tokens(tokens)
+        self.assertEqual(actual.dtype, alt.TOKEN_DTYPE)
+        self.assertTrue((actual == expected).all())
+
+    def test_encode_tokens_unknown_token_throws_exception(self):
+        self.assertRaises(KeyError, alt.encode_tokens, ["NOT_A_TOKEN"])
+
+    def test_precompiled_sys_def_matches_dictionary_files(self):
+        expected = [(t, list(f)) for t, f in alt.build_sys_def()]
+        actual = [(t, list(f)) for t, f in alt.SYS_DEF]
+        self.assertEqual(actual, expected)
+
+    def test_import_does_not_load_sys_def(self):
+        # Cold start benchmark: dependencies are imported first, so that only
+        # the cost of the module itself is measured.
+        script = (
+            "import sys, time, re, os, numpy, sqlparse\n"
+            "start = time.perf_counter()\n"
+            "import wafamole.tokenizer.allowed_tokens\n"
+            "elapsed = time.perf_counter() - start\n"
+            "print('wafamole.tokenizer._sys_def' in sys.modules, elapsed)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", script])
+        loaded, elapsed = output.decode().split()
+        self.assertEqual(loaded, "False")
+        self.assertLess(float(elapsed), 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
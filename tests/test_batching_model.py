@@ -0,0 +1,134 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.linear_model import LogisticRegression
+from wafamole.evasion import EvasionEngine
+from wafamole.models import Model, TokenClassifierWrapper
+from wafamole.models.batching import BatchingModel, WAIT_BUCKETS
+from wafamole.tokenizer import Tokenizer
+
+BENIGN = ["select a from b where c = {}".format(i) for i in range(20)]
+SQLIA = ["1 or {0} = {0} union select a from b -- ".format(i) for i in range(20)]
+
+
+class SlowModel(Model):
+    """Model with a fixed cost per call, recording the size of each batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def extract_features(self, value):
+        return value
+
+    def classify(self, value):
+        return self.classify_many([value])[0]
+
+    def classify_many(self, values, parent=None):
+        if any(not isinstance(v, str) for v in values):
+            raise ValueError("not a string")
+        self.batches.append((len(values), parent))
+        time.sleep(0.01)
+        return [float(len(v)) for v in values]
+
+
+class BatchingModelTest(unittest.TestCase):
+    def setUp(self):
+        tokenizer = Tokenizer()
+        X = [tokenizer.produce_feat_vector(q) for q in BENIGN + SQLIA]
+        y = [0] * len(BENIGN) + [1] * len(SQLIA)
+        self.model = TokenClassifierWrapper(LogisticRegression().fit(X, y))
+
+    def test_results_match_wrapped_model(self):
+        with BatchingModel(self.model) as model:
+            queries = BENIGN[:3] + SQLIA[:3]
+            self.assertEqual(model.classify_many(queries), self.model.classify_many(queries))
+            self.assertEqual(model.classify(SQLIA[0]), self.model.classify(SQLIA[0]))
+            self.assertEqual(model.classify_many([]), [])
+            self.assertEqual(
+                list(model.feature_gradient(SQLIA[0])), list(self.model.feature_gradient(SQLIA[0]))
+            )
+
+    def test_concurrent_calls_share_batches(self):
+        slow = SlowModel()
+        with BatchingModel(slow, max_batch_size=16, max_wait=0.05) as model:
+            with ThreadPoolExecutor(32) as executor:
+                results = list(executor.map(model.classify, SQLIA))
+            stats = model.stats
+        self.assertEqual(results, [float(len(q)) for q in SQLIA])
+        self.assertEqual(stats["values"], len(SQLIA))
+        self.assertEqual(stats["batches"], len(slow.batches))
+        self.assertLess(stats["batches"], len(SQLIA))
+        self.assertTrue(all(size <= 16 for size, _ in slow.batches))
+        self.assertEqual(sum(stats["batch_size"].values()), stats["batches"])
+        self.assertEqual(sum(stats["wait"].values()), len(SQLIA))
+        self.assertTrue(set(stats["wait"]) <= set(WAIT_BUCKETS))
+
+    def test_engines_in_threads_share_the_model(self):
+        # SlowModel never scores a payload below the threshold, so both evaluations time out
+        with BatchingModel(SlowModel(), max_wait=0.05) as model:
+            started = time.monotonic()
+            with ThreadPoolExecutor(2) as executor:
+                futures = [
+                    executor.submit(EvasionEngine(model).evaluate, query, 10 ** 6, 10, 1, 0.5)
+                    for query in SQLIA[:2]
+                ]
+                results = [future.result() for future in futures]
+            self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual([type(payload) for _, payload in results], [str, str])
+        self.assertTrue(all(confidence > 0.5 for confidence, _ in results))
+
+    def test_parent_kept_only_if_shared(self):
+        slow = SlowModel()
+        with BatchingModel(slow, max_wait=0.05) as model:
+            first = model.submit(["a", "b"], "p")
+            second = model.submit(["c"], "p")
+            self.assertEqual(first.result() + second.result(), [1.0, 1.0, 1.0])
+            first = model.submit(["a"], "p")
+            second = model.submit(["c"], "q")
+            first.result(), second.result()
+        self.assertEqual(slow.batches, [(3, "p"), (2, None)])
+
+    def test_errors_are_raised_to_the_faulty_call(self):
+        with BatchingModel(SlowModel(), max_wait=0.05) as model:
+            bad = model.submit([1])
+            good = model.submit(["a"])
+            self.assertRaises(ValueError, bad.result)
+            self.assertEqual(good.result(), [1.0])
+            self.assertEqual(model.classify("ab"), 2.0)
+
+    def test_close_flushes_queued_calls(self):
+        model = BatchingModel(SlowModel(), max_wait=10.0)
+        future = model.submit(["abc"])
+        started = time.monotonic()
+        model.close()
+        self.assertEqual(future.result(), [3.0])
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_closed_model_throws_exception(self):
+        model = BatchingModel(SlowModel())
+        model.close()
+        self.assertRaises(RuntimeError, model.submit, ["a"])
+        self.assertRaises(RuntimeError, model.classify, "a")
+        model.close()
+
+    def test_stats_do_not_wait_for_batches(self):
+        slow = SlowModel()
+        slow.classify_many = lambda values, parent=None: time.sleep(1) or [0.0] * len(values)
+        with BatchingModel(slow, max_wait=0.0) as model:
+            future = model.submit(["a"])
+            time.sleep(0.1)
+            started = time.monotonic()
+            self.assertEqual(model.stats["batches"], 0)
+            self.assertLess(time.monotonic() - started, 0.5)
+            future.result()
+            self.assertEqual(model.stats["batches"], 1)
+
+    def test_wrong_arguments_throw_exception(self):
+        self.assertRaises(TypeError, BatchingModel, object())
+        self.assertRaises(ValueError, BatchingModel, self.model, 0)
+        with BatchingModel(self.model) as model:
+            self.assertRaises(TypeError, model.submit, "not a list")
+
+
+if __name__ == "__main__":
+    unittest.main()
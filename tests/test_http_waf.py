@@ -0,0 +1,146 @@
+import json
+import random
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs, unquote
+from wafamole.evasion import EvasionEngine
+from wafamole.models.http_waf import HttpWafModel, LOCATIONS
+
+
+class StandInWafHandler(BaseHTTPRequestHandler):
+    """Blocks the requests carrying "or 1=1" in parameter, header or cookie q."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body in the same segment, or delayed ACKs stall keep-alive connections
+    wbufsize = -1
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def payload(self):
+        parts = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type") == "application/json":
+            return json.loads(body)["q"]
+        if body:
+            return parse_qs(body.decode())["q"][0]
+        if "q" in self.headers:
+            return self.headers["q"]
+        if "Cookie" in self.headers:
+            return unquote(self.headers["Cookie"].partition("=")[2])
+        return parse_qs(parts.query).get("q", [""])[0]
+
+    def respond(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self):
+        payload = self.payload()
+        path = urlsplit(self.path).path
+        blocked = "or 1=1" in payload.lower()
+        if path == "/slow":
+            time.sleep(1)
+        if path == "/flaky":
+            with self.server.lock:
+                self.server.failures += 1
+                if self.server.failures % 2:
+                    return self.respond(503)
+        if path == "/soft":
+            # Blocked requests are answered with 200 and a block page
+            return self.respond(200, b"<h1>Request blocked</h1>" if blocked else b"ok", {"X-Waf": "block" if blocked else "pass"})
+        self.respond(403 if blocked else 200, b"blocked" if blocked else b"ok")
+
+    do_GET = handle_request
+    do_POST = handle_request
+
+
+class HttpWafModelTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInWafHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.failures = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_address[1])
+        self.payloads = ["admin' or 1=1#", "admin", "1 OR 1=1", "x" * 10] * 5
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_injection_locations(self):
+        expected = [1.0, 0.0, 1.0, 0.0] * 5
+        for location in LOCATIONS:
+            with HttpWafModel(self.url + "/login", location=location) as model:
+                self.assertEqual(model.classify_many(self.payloads), expected, location)
+                self.assertEqual(model.classify("admin' or 1=1#"), 1.0)
+                self.assertEqual(model.classify_many([]), [])
+
+    def test_connections_are_kept_alive(self):
+        with HttpWafModel(self.url, concurrency=4) as model:
+            for _ in range(3):
+                model.classify_many(self.payloads)
+            stats = model.stats
+        self.assertEqual(stats["requests"], 3 * len(self.payloads))
+        self.assertLessEqual(stats["connections"], 4)
+        self.assertEqual(self.server.connections, stats["connections"])
+
+    def test_block_page_and_header(self):
+        with HttpWafModel(self.url + "/soft", blocked_body="Request blocked") as model:
+            self.assertEqual(model.classify_many(self.payloads[:4]), [1.0, 0.0, 1.0, 0.0])
+        with HttpWafModel(self.url + "/soft", blocked_header=("X-Waf", "^block$")) as model:
+            self.assertEqual(model.classify_many(self.payloads[:4]), [1.0, 0.0, 1.0, 0.0])
+
+    def test_retries(self):
+        with HttpWafModel(self.url + "/flaky", concurrency=1) as model:
+            self.assertEqual(model.classify_many(self.payloads[:4]), [1.0, 0.0, 1.0, 0.0])
+            self.assertEqual(model.stats["retries"], 4)
+
+    def test_timeout(self):
+        with HttpWafModel(self.url + "/slow", retries=0, timeout=0.2) as model:
+            self.assertRaises(TimeoutError, model.classify, "admin")
+        with HttpWafModel(self.url + "/slow", retries=0, timeout=5.0) as model:
+            self.assertEqual(model.classify("admin"), 0.0)
+
+    def test_rate_limit(self):
+        with HttpWafModel(self.url, rate=50.0) as model:
+            start = time.monotonic()
+            model.classify_many(self.payloads)
+            self.assertGreaterEqual(time.monotonic() - start, (len(self.payloads) - 1) / 50.0 - 0.01)
+
+    def test_engine_evades_stand_in_waf(self):
+        random.seed(0)
+        with HttpWafModel(self.url) as model:
+            confidence, payload = EvasionEngine(model).evaluate("admin' or 1=1#", 50, 10, 60, 0.5)
+            self.assertEqual(confidence, 0.0)
+            self.assertEqual(model.classify(payload), 0.0)
+
+    def test_wrong_arguments_throw_exception(self):
+        self.assertRaises(ValueError, HttpWafModel, "ftp://127.0.0.1")
+        self.assertRaises(ValueError, HttpWafModel, self.url, location="body")
+        self.assertRaises(TypeError, HttpWafModel, self.url, concurrency="8")
+        self.assertRaises(ValueError, HttpWafModel, self.url, concurrency=0)
+        self.assertRaises(TypeError, HttpWafModel, self.url, rate="10")
+        self.assertRaises(ValueError, HttpWafModel, self.url, rate=-1.0)
+        self.assertRaises(ValueError, HttpWafModel, self.url, rate=0.0)
+        self.assertRaises(TypeError, HttpWafModel, self.url, blocked_status=403)
+        self.assertRaises(TypeError, HttpWafModel, self.url, blocked_header="X-Waf: block")
+        self.assertRaises(ValueError, HttpWafModel, self.url, blocked_header=("X-Waf",))
+        self.assertRaises(TypeError, HttpWafModel, self.url, blocked_body=b"blocked")
+        self.assertRaises(TypeError, HttpWafModel, self.url, headers=[("X-Test", "1")])
+
+
+if __name__ == "__main__":
+    unittest.main()
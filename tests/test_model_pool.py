@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from wafamole.models import Model, TokenClassifierWrapper
+from wafamole.models.pool import ModelPool, process_memory
+from wafamole.tokenizer import Tokenizer
+
+QUERIES = ["select a from b where c = {}".format(i) for i in range(10)] + [
+    "1 or {0} = {0} union select a from b -- ".format(i) for i in range(10)
+]
+
+
+class PidModel(Model):
+    def extract_features(self, value):
+        return value
+
+    def classify(self, value):
+        return float(os.getpid())
+
+
+class ModelPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        tokenizer = Tokenizer()
+        X = [tokenizer.produce_feat_vector(q) for q in QUERIES]
+        y = [0] * 10 + [1] * 10
+        cls.classifier = RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.model_path = os.path.join(cls.directory.name, "forest.dump")
+        joblib.dump(cls.classifier, cls.model_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_load_mmap_matches_load(self):
+        model = TokenClassifierWrapper().load(self.model_path)
+        mapped = TokenClassifierWrapper().load(self.model_path, mmap_mode="r")
+        self.assertEqual(mapped.classify_many(QUERIES), model.classify_many(QUERIES))
+
+    def test_pool_matches_model(self):
+        model = TokenClassifierWrapper().load(self.model_path)
+        with ModelPool(model, 2) as pool:
+            self.assertEqual(pool.classify_many(QUERIES), model.classify_many(QUERIES))
+            self.assertEqual(pool.classify(QUERIES[-1]), model.classify(QUERIES[-1]))
+            self.assertEqual(pool.classify_many([]), [])
+
+    def test_pool_scores_in_workers(self):
+        with ModelPool(PidModel(), 2) as pool:
+            pids = set(pool.classify_many(list(range(10))))
+        self.assertNotIn(float(os.getpid()), pids)
+
+    def test_pool_wrong_model_throws_exception(self):
+        self.assertRaises(TypeError, ModelPool, "model")
+
+    @unittest.skipUnless(os.path.exists("/proc/self/smaps_rollup"), "needs /proc smaps_rollup")
+    def test_memory_usage(self):
+        usage = process_memory()
+        self.assertEqual(usage["pid"], os.getpid())
+        self.assertGreater(usage["rss"], 0)
+        self.assertGreaterEqual(usage["rss"], usage["pss"])
+        with ModelPool(TokenClassifierWrapper().load(self.model_path), 2) as pool:
+            workers = pool.memory_usage()
+        self.assertEqual(len(workers), 2)
+        with ModelPool(PidModel(), 2) as pool:
+            scored_by = set(pool.classify_many(list(range(20))))
+            self.assertTrue(scored_by <= {float(worker["pid"]) for worker in pool.memory_usage()})
+        for worker in workers:
+            self.assertGreater(worker["shared"], 0)
+            self.assertLess(worker["pss"], worker["rss"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from wafamole.models.modsec_wrapper import PyModSecurityWrapper, crs_setup, rule_table, _anomaly_threshold
+except ImportError:
+    PyModSecurityWrapper = None
+
+CRS_SETUP = """SecAction \\
+    "id:900000,\\
+    phase:1,\\
+    pass,\\
+    t:none,\\
+    nolog,\\
+    setvar:tx.blocking_paranoia_level=1"
+"""
+
+RULES = """# SecRule ARGS "@rx x" "id:1,severity:'CRITICAL'"
+SecRule ARGS "@rx a" \\
+    "id:942100,\\
+    phase:2,\\
+    block,\\
+    severity:'CRITICAL',\\
+    tag:'paranoia-level/1',\\
+    chain"
+    SecRule ARGS "@rx b" "t:none"
+SecRule ARGS "@rx c" \\
+    "id:942200,\\
+    severity:'WARNING',\\
+    tag:'paranoia-level/3'"
+SecRule TX:DETECTION_PARANOIA_LEVEL "@lt 2" "id:942013,phase:2,pass,nolog,skipAfter:END"
+"""
+
+
+@unittest.skipIf(PyModSecurityWrapper is None, "ModSecurity is not installed")
+class CrsSetupTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "crs-setup.conf")
+        with open(self.path, "w") as f:
+            f.write(CRS_SETUP)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_paranoia_level_is_patched_in_memory(self):
+        for pl in range(1, 5):
+            self.assertIn("setvar:tx.blocking_paranoia_level={}".format(pl), crs_setup(self.directory.name, pl))
+        with open(self.path) as f:
+            self.assertEqual(f.read(), CRS_SETUP)
+
+    def test_modified_file_is_read_again(self):
+        crs_setup(self.directory.name, 2)
+        with open(self.path, "w") as f:
+            f.write(CRS_SETUP.replace("nolog", "log"))
+        os.utime(self.path, ns=(0, 0))
+        self.assertIn("    log,", crs_setup(self.directory.name, 2))
+
+    def test_rule_table(self):
+        path = os.path.join(self.directory.name, "REQUEST-942-APPLICATION-ATTACK-SQLI.conf")
+        with open(path, "w") as f:
+            f.write(RULES)
+        self.assertEqual(rule_table([path]), {942100: (5, 1), 942200: (3, 3), 942013: (0, 1)})
+
+    def test_anomaly_threshold(self):
+        self.assertEqual(_anomaly_threshold(CRS_SETUP), 5)
+        threshold = '#SecAction \\\n#  "id:900110,\\\n#  setvar:tx.inbound_anomaly_score_threshold=10"\n'
+        self.assertEqual(_anomaly_threshold(threshold), 5)
+        self.assertEqual(_anomaly_threshold(threshold.replace("#", "")), 10)
+
+
+MODSECURITY_CONF = """SecRuleEngine DetectionOnly
+SecRequestBodyAccess On
+SecRule REQUEST_HEADERS:Content-Type "application/json" \\
+    "id:200001,phase:1,t:none,t:lowercase,pass,nolog,ctl:requestBodyProcessor=JSON"
+"""
+
+PACKED_RULES = """SecRule ARGS|REQUEST_COOKIES|REQUEST_HEADERS:User-Agent "@rx (?i)union" \\
+    "id:942100,phase:2,pass,log,capture,msg:'union',logdata:'Matched Data: %{TX.0} found within %{MATCHED_VAR_NAME}',\\
+    severity:'CRITICAL',tag:'paranoia-level/1',setvar:'tx.anomaly_score=+5'"
+SecRule ARGS|REQUEST_COOKIES|REQUEST_HEADERS:User-Agent "@rx (?i)select" \\
+    "id:942200,phase:2,pass,log,capture,msg:'select',logdata:'Matched Data: %{TX.0} found within %{MATCHED_VAR_NAME}',\\
+    severity:'WARNING',tag:'paranoia-level/2'"
+SecRule REQUEST_URI "@rx (?i)drop" \\
+    "id:942300,phase:2,pass,log,msg:'drop',severity:'NOTICE',tag:'paranoia-level/1'"
+SecRule TX:ANOMALY_SCORE "@ge 5" \\
+    "id:949110,phase:2,pass,log,msg:'Inbound Anomaly Score Exceeded',severity:'CRITICAL'"
+"""
+
+
+@unittest.skipIf(PyModSecurityWrapper is None, "ModSecurity is not installed")
+class PackedClassifyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self.directory.name, "rules"))
+        for name, content in [
+            ("modsecurity.conf", MODSECURITY_CONF),
+            ("crs-setup.conf", CRS_SETUP),
+            (os.path.join("rules", "REQUEST-942-APPLICATION-ATTACK-SQLI.conf"), PACKED_RULES),
+        ]:
+            with open(os.path.join(self.directory.name, name), "w") as f:
+                f.write(content)
+        self.values = ["1 union select 2", "select 1", "1", "union", "1 union 2"]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_packed_scores_match_single_scores(self):
+        for pl in (1, 2):
+            model = PyModSecurityWrapper(self.directory.name, pl, pack_size=3)
+            self.assertEqual(model.packing_parity(self.values), [])
+            self.assertEqual(model.classify_many(self.values), [model.classify(v) for v in self.values])
+        self.assertEqual(model.classify_many(self.values), [13, 3, 0, 10, 10])
+
+    def test_injection_locations(self):
+        for location in ("query", "urlencoded", "json", "header", "cookie"):
+            model = PyModSecurityWrapper(self.directory.name, 2, pack_size=3, location=location)
+            self.assertEqual(model.classify_many(self.values), [13, 3, 0, 10, 10], location)
+            self.assertEqual(model.packing_parity(self.values), [], location)
+
+    def test_rules_above_paranoia_level_are_not_scored(self):
+        model = PyModSecurityWrapper(self.directory.name, 1)
+        self.assertEqual(model.classify_many(self.values), [10, 0, 0, 10, 10])
+
+    def test_rule_report(self):
+        model = PyModSecurityWrapper(self.directory.name, 2, pack_size=5, instrument=True)
+        self.assertEqual(model.pack_size, 1)
+        model.classify_many(self.values)
+        report = model.report()
+        self.assertEqual(report["transactions"], len(self.values))
+        self.assertEqual(set(report["time"]), {"uri", "request_headers", "request_body"})
+        self.assertEqual(
+            [(rule["id"], rule["hits"], rule["score"], rule["paranoia_level"]) for rule in report["rules"]],
+            [(942100, 3, 15, 1), (949110, 3, 15, 1), (942200, 2, 6, 2)],
+        )
+        model.attribution(self.values[0])
+        self.assertEqual(model.report(), report)
+        model.reset_report()
+        self.assertEqual(model.report()["rules"], [])
+
+    def test_attribution_locates_matched_data(self):
+        model = PyModSecurityWrapper(self.directory.name, 2)
+        influence = model.attribution("1 UNION select 2")
+        self.assertEqual(list(influence[2:7]), [1.0] * 5)
+        self.assertEqual(list(influence[8:14]), [0.6] * 6)
+        self.assertEqual(influence[0], 0.0)
+        self.assertEqual(list(model.attribution("1")), [0.0])
+
+    def test_anomaly_evaluation_rules_do_not_prevent_packing(self):
+        model = PyModSecurityWrapper(self.directory.name, 2, pack_size=5)
+        with mock.patch.object(model, "classify", wraps=model.classify) as classify:
+            self.assertEqual(model.classify_many(self.values), [13, 3, 0, 10, 10])
+            classify.assert_not_called()
+
+    def test_unattributed_rules_fall_back_to_single_scoring(self):
+        model = PyModSecurityWrapper(self.directory.name, 1, pack_size=3)
+        values = ["drop union", "1", "union"]
+        self.assertEqual(model.classify_many(values), [12, 0, 10])
+        self.assertEqual(model.classify_many([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import random
+import socket
+import tempfile
+import threading
+import unittest
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from wafamole.evasion import EvasionEngine
+from wafamole.models import TokenClassifierWrapper
+from wafamole.models.remote import ModelServer, RemoteModel
+from wafamole.tokenizer import Tokenizer
+
+BENIGN = ["select a from b where c = {}".format(i) for i in range(20)]
+SQLIA = ["1 or {0} = {0} union select a from b -- ".format(i) for i in range(20)]
+
+
+class RemoteModelTest(unittest.TestCase):
+    def setUp(self):
+        tokenizer = Tokenizer()
+        X = [tokenizer.produce_feat_vector(q) for q in BENIGN + SQLIA]
+        y = [0] * len(BENIGN) + [1] * len(SQLIA)
+        self.model = TokenClassifierWrapper(LogisticRegression().fit(X, y))
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, "model.sock")
+        self.server = ModelServer(self.model, self.socket_path, max_batch_size=64, max_wait=0.05).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.directory.cleanup()
+
+    def test_remote_matches_local(self):
+        remote = RemoteModel(self.socket_path)
+        queries = BENIGN[:3] + SQLIA[:3]
+        self.assertEqual(remote.classify_many(queries), self.model.classify_many(queries))
+        self.assertEqual(remote.classify(SQLIA[0]), self.model.classify(SQLIA[0]))
+        self.assertEqual(remote.classify_many([]), [])
+        self.assertTrue((remote.extract_features(SQLIA[0]) == self.model.extract_features(SQLIA[0])).all())
+        self.assertTrue(np.allclose(remote.feature_gradient(SQLIA[0]), self.model.feature_gradient(SQLIA[0])))
+        self.assertIsNone(remote.attribution(SQLIA[0]))
+        remote.close()
+
+    def test_concurrent_clients_share_batches(self):
+        clients = [RemoteModel(self.socket_path) for _ in range(8)]
+        results = [None] * len(clients)
+        barrier = threading.Barrier(len(clients))
+
+        def run(i):
+            barrier.wait()
+            results[i] = clients[i].classify_many(SQLIA[i : i + 2])
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(len(clients))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for i, result in enumerate(results):
+            self.assertEqual(result, self.model.classify_many(SQLIA[i : i + 2]))
+        self.assertEqual(self.server.stats["values"], 2 * len(clients))
+        self.assertLess(self.server.stats["batches"], len(clients))
+        for client in clients:
+            client.close()
+
+    def test_server_errors_are_raised(self):
+        remote = RemoteModel(self.socket_path)
+        self.assertRaises(RuntimeError, remote._call, {"op": "unknown"})
+        self.assertRaises(RuntimeError, remote.classify_many, [1])
+        # The connection survives errors
+        self.assertEqual(remote.classify(SQLIA[0]), self.model.classify(SQLIA[0]))
+        remote.close()
+
+    def test_missing_socket_throws_exception(self):
+        self.assertRaises(FileNotFoundError, RemoteModel, os.path.join(self.directory.name, "missing"))
+
+    def test_only_stale_sockets_are_replaced(self):
+        # A live server keeps its socket
+        self.assertRaises(FileExistsError, ModelServer, self.model, self.socket_path)
+        remote = RemoteModel(self.socket_path)
+        self.assertEqual(remote.classify(SQLIA[0]), self.model.classify(SQLIA[0]))
+        remote.close()
+        # A regular file is not removed
+        path = os.path.join(self.directory.name, "model.dump")
+        with open(path, "w") as f:
+            f.write("model")
+        self.assertRaises(FileExistsError, ModelServer, self.model, path)
+        self.assertTrue(os.path.isfile(path))
+        # The socket of a server that is not running anymore is replaced
+        path = os.path.join(self.directory.name, "stale.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(path)
+        server = ModelServer(self.model, path).start()
+        remote = RemoteModel(path)
+        self.assertEqual(remote.classify(SQLIA[0]), self.model.classify(SQLIA[0]))
+        remote.close()
+        server.shutdown()
+
+    def test_engine_with_remote_model(self):
+        random.seed(0)
+        remote = RemoteModel(self.socket_path)
+        confidence, payload = EvasionEngine(remote).evaluate(SQLIA[0], 5, 5, 60, 0.5)
+        self.assertEqual(confidence, self.model.classify(payload))
+        remote.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
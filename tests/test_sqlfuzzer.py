@@ -0,0 +1,150 @@
+import random
+import threading
+import unittest
+import numpy as np
+from wafamole.evasion import EvasionEngine
+from wafamole.models import Model
+from wafamole.payloadfuzzer.fuzz_utils import (
+    choose_span,
+    edit_span,
+    position_weights,
+    realign_weights,
+)
+from wafamole.payloadfuzzer.sqlfuzzer import (
+    SqlFuzzer,
+    spaces_to_comments,
+    strategy_weights,
+)
+from wafamole.tokenizer import Tokenizer
+
+PAYLOAD = "1 OR 1=1 UNION SELECT a FROM b WHERE c=2"
+
+
+class SpacesModel(Model):
+    """Malicious as long as the spaces after position 20 are kept."""
+
+    def __init__(self):
+        self.attributions = 0
+
+    def extract_features(self, value: str):
+        return value
+
+    def classify(self, value: str):
+        return value[20:].count(" ") / 10.0
+
+    def attribution(self, value: str):
+        self.attributions += 1
+        return [1.0 if i >= 20 else 0.0 for i in range(len(value))]
+
+
+class FuzzUtilsTest(unittest.TestCase):
+    def test_choose_span_without_weights_is_uniform(self):
+        random.seed(0)
+        choices = [choose_span(["a", "b"], [(0, 1), (1, 2)]) for _ in range(1000)]
+        self.assertGreater(choices.count("a"), 400)
+        self.assertGreater(choices.count("b"), 400)
+
+    def test_choose_span_follows_weights(self):
+        random.seed(0)
+        with position_weights([0.0, 0.0, 1.0, 1.0]):
+            choices = [choose_span(["a", "b"], [(0, 2), (2, 4)]) for _ in range(1000)]
+        self.assertGreater(choices.count("b"), 900)
+        self.assertGreater(choices.count("a"), 0)
+
+    def test_position_weights_are_restored(self):
+        random.seed(0)
+        with position_weights([0.0, 1.0]):
+            pass
+        choices = [choose_span(["a", "b"], [(0, 1), (1, 2)]) for _ in range(1000)]
+        self.assertGreater(choices.count("a"), 400)
+
+    def test_position_weights_are_thread_local(self):
+        random.seed(0)
+        choices = []
+        with position_weights([0.0, 1.0]):
+            thread = threading.Thread(
+                target=lambda: choices.extend(choose_span(["a", "b"], [(0, 1), (1, 2)]) for _ in range(1000))
+            )
+            thread.start()
+            thread.join()
+        self.assertGreater(choices.count("a"), 400)
+
+    def test_edit_span(self):
+        self.assertEqual(edit_span("abcdef", "abXdef"), (2, 3))
+        self.assertEqual(edit_span("abcdef", "abcdef"), (6, 0))
+        self.assertEqual(edit_span("aaaa", "aaaaaa"), (4, 0))
+        self.assertEqual(edit_span("abc", "xbc"), (0, 2))
+        self.assertEqual(edit_span("abc", ""), (0, 0))
+
+    def test_realign_weights(self):
+        weights = [0.0, 1.0, 2.0, 3.0]
+        self.assertEqual(realign_weights(weights, "abcd", "abcd"), weights)
+        self.assertEqual(realign_weights(weights, "abcd", "aXYd"), [0.0, 1.5, 1.5, 3.0])
+        self.assertEqual(realign_weights(weights, "abcd", "ab/**/cd"), [0.0, 1.0, 1.5, 1.5, 1.5, 1.5, 2.0, 3.0])
+        self.assertEqual(realign_weights(weights, "abcd", "ad"), [0.0, 3.0])
+
+
+class SqlFuzzerTest(unittest.TestCase):
+    def test_wrong_influence_length_throws_exception(self):
+        self.assertRaises(ValueError, SqlFuzzer, PAYLOAD, [1.0])
+
+    def test_influence_follows_mutations(self):
+        random.seed(0)
+        fuzzer = SqlFuzzer(PAYLOAD, [1.0] * len(PAYLOAD))
+        for _ in range(20):
+            payload = fuzzer.fuzz()
+            self.assertEqual(len(fuzzer.influence), len(payload))
+        fuzzer.reset()
+        self.assertEqual(fuzzer.influence, [1.0] * len(PAYLOAD))
+
+    def test_guided_strategy_edits_influent_positions(self):
+        random.seed(0)
+        influence = [1.0 if i >= 20 else 0.0 for i in range(len(PAYLOAD))]
+        edits = []
+        for _ in range(500):
+            with position_weights(influence):
+                prefix, _ = edit_span(PAYLOAD, spaces_to_comments(PAYLOAD))
+            edits.append(prefix >= 20)
+        self.assertGreater(sum(edits), 450)
+
+    def test_wrong_weights_length_throws_exception(self):
+        self.assertRaises(ValueError, SqlFuzzer, PAYLOAD, None, [1.0])
+
+    def test_weights_select_strategies(self):
+        random.seed(0)
+        weights = [1.0 if s is spaces_to_comments else 0.0 for s in SqlFuzzer.strategies]
+        fuzzer = SqlFuzzer(PAYLOAD, weights=weights)
+        payload = fuzzer.fuzz()
+        self.assertIn("/**/", payload)
+        self.assertEqual(payload.replace("/**/", " "), PAYLOAD)
+
+    def test_strategy_weights_follow_gradient(self):
+        random.seed(0)
+        extract_features = Tokenizer().produce_feat_vector
+        # Multi-line comments lower the confidence
+        gradient = -np.eye(12)[10]
+        weights = strategy_weights(PAYLOAD, extract_features, gradient)
+        self.assertAlmostEqual(sum(weights), 1.0)
+        best = SqlFuzzer.strategies[int(np.argmax(weights))]
+        self.assertIs(best, spaces_to_comments)
+
+    def test_strategy_weights_without_gradient_are_uniform(self):
+        extract_features = Tokenizer().produce_feat_vector
+        weights = strategy_weights(PAYLOAD, extract_features, np.zeros(12))
+        self.assertEqual(len(set(weights)), 1)
+
+    def test_guided_engine_asks_attribution(self):
+        random.seed(0)
+        model = SpacesModel()
+        EvasionEngine(model, guided=True).evaluate(PAYLOAD, 5, 5, 60, 0.0)
+        self.assertGreater(model.attributions, 0)
+
+    def test_unguided_engine_ignores_attribution(self):
+        random.seed(0)
+        model = SpacesModel()
+        EvasionEngine(model).evaluate(PAYLOAD, 5, 5, 60, 0.0)
+        self.assertEqual(model.attributions, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
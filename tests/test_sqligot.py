@@ -0,0 +1,312 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+import scipy.sparse as sp
+import wafamole.tokenizer.allowed_tokens as alt
+from wafamole.models import SQLiGoTWrapper
+from sklearn.exceptions import NotFittedError
+from wafamole.models.custom.graph.sqligot import SQLiGoT, FrozenSQLiGoT, memory_usage
+
+BENIGN = [
+    "select * from users where id={}",
+    "select name from users where id={} and age>18",
+    "select * from t where a='x{}'",
+    "select a, b from t where b like 'y{}' order by a",
+]
+SQLIA = [
+    "select * from users where id={} or 1=1",
+    "select * from users where id='{}' or 'a'='a' -- ",
+    "select * from t where a={} union select 1, null, null from users",
+    "select * from t where a={} and 1=0 union select password from mysql.user",
+]
+
+
+def _expected(values):
+    """Builds a feature vector from a {token: (first, second)} dictionary."""
+    feature_vector = np.zeros(2 * len(alt.TOKENS))
+    for i, t in enumerate(alt.TOKENS):
+        if t in values:
+            feature_vector[2 * i : 2 * i + 2] = values[t]
+    return feature_vector
+
+
+class SQLiGoTTest(unittest.TestCase):
+    def setUp(self):
+        self.sqligot = SQLiGoT()
+        # Tokens after WHERE: CHR EQ INT
+        self.query = "select * from t where a=1"
+
+    def test_preprocess_single_query_directed_proportional_ok(self):
+        actual = self.sqligot.preprocess_single_query(
+            self.query, undirected=False, proportional=True
+        )
+        expected = _expected({"CHR": (0, 1), "EQ": (1, 0), "INT": (4 / 5, 0)})
+        self.assertTrue((actual == expected).all())
+
+    def test_preprocess_single_query_directed_unprop_ok(self):
+        actual = self.sqligot.preprocess_single_query(
+            self.query, undirected=False, proportional=False
+        )
+        expected = _expected({"CHR": (0, 1), "EQ": (1, 0), "INT": (1, 0)})
+        self.assertTrue((actual == expected).all())
+
+    def test_preprocess_single_query_undirected_proportional_ok(self):
+        actual = self.sqligot.preprocess_single_query(
+            self.query, undirected=True, proportional=True
+        )
+        # INT is duplicated inside TOKENS: like the original networkx node
+        # attributes, its count is the one of the last (unused) occurrence.
+        expected = _expected({"CHR": (1, 1), "EQ": (1, 5 / 9), "INT": (0, 4 / 9)})
+        self.assertTrue((actual == expected).all())
+
+    def test_preprocess_single_query_duplicated_tokens_share_degree(self):
+        actual = self.sqligot.preprocess_single_query(
+            "select * from t where a=1 or b=2", undirected=False, proportional=False
+        )
+        positions = [i for i, t in enumerate(alt.TOKENS) if t == "OR"]
+        self.assertEqual(len(positions), 2)
+        self.assertNotEqual(actual[2 * positions[0]], 0)
+        self.assertTrue(
+            (
+                actual[2 * positions[0] : 2 * positions[0] + 2]
+                == actual[2 * positions[1] : 2 * positions[1] + 2]
+            ).all()
+        )
+
+    def test_preprocess_single_query_no_where_returns_none(self):
+        self.assertIsNone(self.sqligot.preprocess_single_query("admin' OR 1=1#"))
+
+    def test_preprocess_single_query_no_str_throws_exception(self):
+        self.assertRaises(TypeError, self.sqligot.preprocess_single_query, 12)
+
+    def test_preprocess_many_ok(self):
+        queries = [self.query, "admin' OR 1=1#", "select * from t where a=1 or b=2"]
+        X, mask = self.sqligot.preprocess_many(queries)
+        self.assertTrue((mask == np.array([True, False, True])).all())
+        self.assertEqual(X.shape, (2, 2 * len(alt.TOKENS)))
+        self.assertTrue((X[0] == self.sqligot.preprocess_single_query(queries[0])).all())
+        self.assertTrue((X[1] == self.sqligot.preprocess_single_query(queries[2])).all())
+
+    def test_preprocess_many_sparse_ok(self):
+        queries = [self.query, "admin' OR 1=1#", "select * from t where a=1 or b=2"]
+        expected, expected_mask = self.sqligot.preprocess_many(queries)
+        actual, actual_mask = self.sqligot.preprocess_many(queries, sparse=True)
+        self.assertTrue(sp.isspmatrix_csr(actual))
+        self.assertTrue((actual_mask == expected_mask).all())
+        self.assertTrue((actual.toarray() == expected).all())
+
+    def test_preprocess_many_no_list_throws_exception(self):
+        self.assertRaises(TypeError, self.sqligot.preprocess_many, self.query)
+
+
+class SQLiGoTDatasetTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.benign_path = os.path.join(self.tmp_dir.name, "benign")
+        self.sqlia_path = os.path.join(self.tmp_dir.name, "sqlia")
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        for path, queries in ((self.benign_path, BENIGN), (self.sqlia_path, SQLIA)):
+            with open(path, "w") as f:
+                f.writelines(q.format(i) + "\n" for q in queries for i in range(5))
+                f.write("admin' OR 1=1#\n")
+        self.sqligot = SQLiGoT()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_create_dataset_ok(self):
+        X, y = self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, cache_dir=self.cache_dir
+        )
+        self.assertEqual(X.shape[1], 2 * len(alt.TOKENS))
+        self.assertEqual((y == -1).sum(), (y == 1).sum())
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_create_dataset_loads_cached_features(self):
+        expected_X, expected_y = self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, cache_dir=self.cache_dir
+        )
+        with mock.patch.object(
+            SQLiGoT, "_create_feature_vectors_from_file"
+        ) as create_feature_vectors:
+            actual_X, actual_y = self.sqligot.create_dataset(
+                self.benign_path, self.sqlia_path, cache_dir=self.cache_dir
+            )
+        create_feature_vectors.assert_not_called()
+        self.assertTrue((actual_X == expected_X).all())
+        self.assertTrue((actual_y == expected_y).all())
+
+    def test_create_dataset_parameters_change_cache_key(self):
+        self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, cache_dir=self.cache_dir
+        )
+        self.sqligot.create_dataset(
+            self.benign_path,
+            self.sqlia_path,
+            proportional=False,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+
+    def test_create_feature_vectors_limit_samples_ok(self):
+        X = self.sqligot._create_feature_vectors_from_file(
+            self.benign_path, limit_samples=2
+        )
+        self.assertEqual(len(X), 3)
+
+    def test_create_dataset_no_dump_ok(self):
+        self.sqligot.create_dataset(
+            self.benign_path,
+            self.sqlia_path,
+            dump_to_file=False,
+            cache_dir=self.cache_dir,
+        )
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_create_dataset_parallel_ok(self):
+        expected_X, _ = self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, dump_to_file=False, check_cache=False
+        )
+        actual_X, _ = self.sqligot.create_dataset(
+            self.benign_path,
+            self.sqlia_path,
+            dump_to_file=False,
+            check_cache=False,
+            n_jobs=2,
+        )
+        self.assertTrue((actual_X == expected_X).all())
+
+    def test_create_dataset_sparse_ok(self):
+        expected_X, expected_y = self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, cache_dir=self.cache_dir
+        )
+        for _ in range(2):
+            # First from the dense store entries, then from the sparse ones.
+            actual_X, actual_y = self.sqligot.create_dataset(
+                self.benign_path,
+                self.sqlia_path,
+                cache_dir=self.cache_dir,
+                sparse=True,
+            )
+            self.assertTrue(sp.isspmatrix_csr(actual_X))
+            self.assertTrue((actual_X.toarray() == expected_X).all())
+            self.assertTrue((actual_y == expected_y).all())
+            self.cache_dir = os.path.join(self.tmp_dir.name, "sparse_cache")
+
+    def test_memory_usage_ok(self):
+        X, _ = self.sqligot.create_dataset(
+            self.benign_path, self.sqlia_path, dump_to_file=False, sparse=True
+        )
+        sparse_usage = memory_usage(X)
+        dense_usage = memory_usage(X.toarray())
+        self.assertEqual(sparse_usage["dense_bytes"], dense_usage["bytes"])
+        self.assertLess(sparse_usage["bytes"], dense_usage["bytes"])
+        self.assertEqual(sparse_usage["density"], dense_usage["density"])
+
+    def test_create_dataset_no_regular_filepath_throws_exception(self):
+        self.assertRaises(
+            FileNotFoundError, self.sqligot.create_dataset, "not exists", self.sqlia_path
+        )
+
+
+class SQLiGoTWrapperTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        benign = [q.format(i) for q in BENIGN for i in range(5)]
+        sqlia = [q.format(i) for q in SQLIA for i in range(5)]
+        cls.training_queries = benign + sqlia
+        cls.training_labels = np.array([-1] * len(benign) + [1] * len(sqlia))
+        sqligot = SQLiGoT(random_state=0)
+        X, mask = sqligot.preprocess_many(cls.training_queries)
+        cls.sqligot = sqligot.fit(X, cls.training_labels[mask])
+
+    def test_classify_many_matches_classify(self):
+        wrapper = SQLiGoTWrapper(self.sqligot, undirected=False, proportional=True)
+        queries = ["select * from t where a=7 or 2=2", "admin' OR 1=1#", "select * from t where a=7"]
+        expected = [wrapper.classify(q) for q in queries]
+        actual = wrapper.classify_many(queries)
+        self.assertEqual(actual[1], 1)
+        np.testing.assert_allclose(actual, expected)
+
+    def test_classify_many_sparse_model_ok(self):
+        wrapper = SQLiGoTWrapper(self.sqligot, undirected=False, proportional=True)
+        queries = ["select * from t where a=7 or 2=2", "admin' OR 1=1#", "select * from t where a=7"]
+        X, mask = self.sqligot.preprocess_many(self.training_queries, sparse=True)
+        sparse_sqligot = SQLiGoT(random_state=0).fit(X, self.training_labels[mask])
+        sparse_wrapper = SQLiGoTWrapper(sparse_sqligot, undirected=False, proportional=True)
+        np.testing.assert_allclose(
+            sparse_wrapper.classify_many(queries), wrapper.classify_many(queries)
+        )
+
+    def test_classify_many_caches_equivalent_queries(self):
+        wrapper = SQLiGoTWrapper(self.sqligot, undirected=False, proportional=True)
+        queries = ["select * from t where a=7 or 2=2", "select * from t where a=7 OR 2=2", "select * from t\twhere a=7 or 2=2"]
+        confidences = wrapper.classify_many(queries)
+        self.assertEqual(len(set(confidences)), 1)
+        self.assertEqual(wrapper.cache_info["misses"], 1)
+        self.assertEqual(wrapper.cache_info["hits"], 2)
+
+    def test_classify_many_fast_inference_ok(self):
+        wrapper = SQLiGoTWrapper(self.sqligot, undirected=False, proportional=True)
+        fast_wrapper = SQLiGoTWrapper(
+            self.sqligot, undirected=False, proportional=True, fast_inference=True
+        )
+        queries = ["select * from t where a=7 or 2=2", "admin' OR 1=1#", "select * from t where a=7"]
+        np.testing.assert_allclose(
+            fast_wrapper.classify_many(queries), wrapper.classify_many(queries), atol=1e-12
+        )
+        self.assertAlmostEqual(
+            fast_wrapper.classify(queries[0]), wrapper.classify(queries[0]), places=12
+        )
+
+    def test_classify_many_no_str_throws_exception(self):
+        wrapper = SQLiGoTWrapper(self.sqligot, undirected=False, proportional=True)
+        self.assertRaises(TypeError, wrapper.classify_many, ["select 1", 12])
+
+
+class FrozenSQLiGoTTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        queries = [q.format(i) for q in BENIGN + SQLIA for i in range(5)]
+        labels = np.array([-1] * 5 * len(BENIGN) + [1] * 5 * len(SQLIA))
+        sqligot = SQLiGoT(random_state=0)
+        cls.X, mask = sqligot.preprocess_many(queries)
+        cls.X_sparse, _ = sqligot.preprocess_many(queries, sparse=True)
+        cls.y = labels[mask]
+        cls.sqligot = sqligot.fit(cls.X, cls.y)
+
+    def test_predict_proba_matches_sqligot(self):
+        frozen = self.sqligot.freeze()
+        np.testing.assert_allclose(
+            frozen.predict_proba(self.X), self.sqligot.predict_proba(self.X), atol=1e-12
+        )
+        np.testing.assert_allclose(
+            frozen.decision_function(self.X),
+            self.sqligot.decision_function(self.X),
+            atol=1e-12,
+        )
+
+    def test_predict_proba_sparse_matches_sqligot(self):
+        sqligot = SQLiGoT(random_state=0).fit(self.X_sparse, self.y)
+        frozen = sqligot.freeze()
+        np.testing.assert_allclose(
+            frozen.predict_proba(self.X_sparse),
+            sqligot.predict_proba(self.X_sparse),
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            frozen.predict_proba(self.X), sqligot.predict_proba(self.X), atol=1e-12
+        )
+
+    def test_not_trained_throws_exception(self):
+        self.assertRaises(NotFittedError, FrozenSQLiGoT, SQLiGoT())
+
+    def test_no_probability_throws_exception(self):
+        sqligot = SQLiGoT(probability=False).fit(self.X, self.y)
+        self.assertRaises(ValueError, FrozenSQLiGoT, sqligot)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from wafamole.evasion.surrogate import SurrogateModel
+from wafamole.models import Model
+
+
+class LengthModel(Model):
+    """Scores payloads by their length, counting the queries it receives."""
+
+    def __init__(self):
+        self.queries = 0
+
+    def extract_features(self, value: str):
+        return len(value)
+
+    def classify(self, value: str):
+        self.queries += 1
+        return min(1.0, len(value) / 100.0)
+
+
+PAYLOADS = ["a" * n for n in range(1, 100, 3)]
+
+
+class SurrogateModelTest(unittest.TestCase):
+    def test_wrong_fraction_throws_exception(self):
+        self.assertRaises(ValueError, SurrogateModel, fraction=0.0)
+        self.assertRaises(ValueError, SurrogateModel, fraction=1.5)
+
+    def test_wrong_audit_rate_throws_exception(self):
+        self.assertRaises(ValueError, SurrogateModel, audit_rate=-0.1)
+
+    def test_wrong_model_throws_exception(self):
+        self.assertRaises(TypeError, SurrogateModel().screen, None, PAYLOADS)
+
+    def test_screen_before_warmup_queries_every_candidate(self):
+        model = LengthModel()
+        surrogate = SurrogateModel(warmup=len(PAYLOADS) + 1)
+        confidences, payloads = surrogate.screen(model, PAYLOADS)
+        self.assertEqual(payloads, PAYLOADS)
+        self.assertEqual(confidences, [model.classify(p) for p in PAYLOADS])
+        self.assertEqual(surrogate.stats["oracle_queries"], len(PAYLOADS))
+        self.assertFalse(surrogate.trusted)
+
+    def test_screen_after_warmup_queries_top_fraction(self):
+        model = LengthModel()
+        surrogate = SurrogateModel(fraction=0.25, warmup=1, audit_rate=0.0, random_state=0)
+        for _ in range(20):
+            surrogate.update(PAYLOADS, [model.classify(p) for p in PAYLOADS])
+        model.queries = 0
+        confidences, payloads = surrogate.screen(model, PAYLOADS)
+        self.assertEqual(len(payloads), 9)
+        self.assertEqual(model.queries, 9)
+        self.assertIn(PAYLOADS[0], payloads)
+        self.assertEqual(surrogate.stats["screened_out"], len(PAYLOADS) - 9)
+
+    def test_audits_are_counted(self):
+        model = LengthModel()
+        surrogate = SurrogateModel(fraction=0.1, warmup=1, audit_rate=1.0, random_state=0)
+        surrogate.update(PAYLOADS, [model.classify(p) for p in PAYLOADS])
+        confidences, payloads = surrogate.screen(model, PAYLOADS)
+        stats = surrogate.stats
+        self.assertEqual(sorted(payloads), sorted(PAYLOADS))
+        self.assertEqual(stats["audits"], len(PAYLOADS) - 4)
+        self.assertEqual(stats["screened_out"], 0)
+        self.assertLessEqual(stats["audit_misses"], stats["audits"])
+        self.assertEqual(stats["miss_rate"], stats["audit_misses"] / stats["audits"])
+
+
+if __name__ == "__main__":
+    unittest.main()
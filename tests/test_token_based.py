@@ -1,6 +1,20 @@
 import unittest
 import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from wafamole.exceptions.models_exceptions import ModelNotLoadedError
 from wafamole.models import TokenClassifierWrapper
+from wafamole.tokenizer import Tokenizer
+
+BENIGN = ["select a from b where c = {}".format(i) for i in range(20)]
+SQLIA = ["1 or {0} = {0} union select a from b -- ".format(i) for i in range(20)]
+
+
+def train(classifier):
+    tokenizer = Tokenizer()
+    X = [tokenizer.produce_feat_vector(q) for q in BENIGN + SQLIA]
+    y = [0] * len(BENIGN) + [1] * len(SQLIA)
+    return TokenClassifierWrapper(classifier.fit(X, y))
 
 
 class TokenClassifierTest(unittest.TestCase):
@@ -28,3 +42,65 @@ class TokenClassifierTest(unittest.TestCase):
 
         clf = TokenClassifierWrapper(test_object())
         self.assertRaises(TypeError, clf.extract_features, 21)
+
+    def test_feature_gradient_logistic_regression(self):
+        clf = train(LogisticRegression())
+        query = SQLIA[0]
+        gradient = clf.feature_gradient(query)
+        p = clf.classify(query)
+        expected = p * (1 - p) * clf._sklearn_classifier.coef_[0]
+        self.assertTrue(np.allclose(gradient, expected))
+
+    def test_feature_gradient_finite_differences(self):
+        clf = train(RandomForestClassifier(n_estimators=10, random_state=0))
+        query = SQLIA[0]
+        gradient = clf.feature_gradient(query)
+        features = clf.extract_features(query)
+        self.assertEqual(gradient.shape, features.shape)
+        classifier = clf._sklearn_classifier
+        for j in range(len(features)):
+            step = np.eye(len(features))[j]
+            backward = min(1, features[j])
+            up, down = classifier.predict_proba([features + step, features - backward * step])[:, 1]
+            self.assertAlmostEqual(gradient[j], (up - down) / (1 + backward))
+
+    def test_feature_gradient_not_loaded_throws_exception(self):
+        self.assertRaises(ModelNotLoadedError, TokenClassifierWrapper().feature_gradient, "select 1")
+
+    def test_feature_cache_skips_equivalent_mutants(self):
+        clf = train(LogisticRegression())
+        queries = ["1 OR 1=1 UNION SELECT a", "1 or 1=1 union select a", "1 Or 1=1 UnIoN SeLeCt a"]
+        confidences = clf.classify_many(queries)
+        self.assertEqual(len(set(confidences)), 1)
+        self.assertEqual(clf.cache_info["misses"], 1)
+        self.assertEqual(clf.cache_info["hits"], 2)
+        self.assertEqual(clf.classify(queries[0]), confidences[0])
+        self.assertEqual(clf.cache_info["hits"], 3)
+
+    def test_feature_cache_matches_predict_proba(self):
+        clf = train(LogisticRegression())
+        queries = BENIGN[:5] + SQLIA[:5] + BENIGN[:5]
+        X = np.array([clf.extract_features(q) for q in queries])
+        expected = clf._sklearn_classifier.predict_proba(X)[:, 1]
+        self.assertTrue(np.allclose(clf.classify_many(queries), expected))
+        self.assertTrue(np.allclose([clf.classify(q) for q in queries], expected))
+
+    def test_feature_cache_is_bounded(self):
+        clf = TokenClassifierWrapper(train(LogisticRegression())._sklearn_classifier, cache_size=2)
+        clf.classify_many(["select 1", "select a", "select 'a'", "select a from b"])
+        self.assertEqual(clf.cache_info["misses"], 4)
+        self.assertEqual(clf.cache_info["size"], 2)
+
+    def test_feature_cache_disabled(self):
+        clf = TokenClassifierWrapper(train(LogisticRegression())._sklearn_classifier, cache_size=0)
+        clf.classify_many(BENIGN[:5] + BENIGN[:5])
+        self.assertEqual(clf.cache_info["size"], 0)
+        self.assertEqual(clf.cache_info["hits"], 0)
+
+    def test_feature_cache_cleared_on_new_classifier(self):
+        clf = train(LogisticRegression())
+        clf.classify(SQLIA[0])
+        clf._sklearn_classifier = train(RandomForestClassifier(n_estimators=5, random_state=0))._sklearn_classifier
+        expected = clf._sklearn_classifier.predict_proba([clf.extract_features(SQLIA[0])])[0, 1]
+        self.assertEqual(clf.classify(SQLIA[0]), expected)
+        self.assertEqual(clf.cache_info["misses"], 1)
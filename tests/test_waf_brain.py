@@ -0,0 +1,265 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import keras
+import numpy as np
+from wafamole.models import WafBrainWrapper
+from wafamole.models.custom.rnn.numpy_net import NumpyNet, export_model
+from wafamole.payloadfuzzer.sqlfuzzer import SqlFuzzer
+from wafamole.models.custom.rnn.waf_brain import (
+    VOCABULARY,
+    IncrementalScorer,
+    character_weights,
+    encode_payload,
+    encode_payloads,
+    feature_vector,
+    process_payload,
+    score_payloads,
+)
+
+PAYLOADS = [
+    "a",
+    "abcd",
+    "abcde",
+    "admin' OR 1=1#",
+    "1 UNION SELECT\tpassword FROM users WHERE id=\xa01 -- ",
+]
+
+
+class WafBrainEncodingTest(unittest.TestCase):
+    def test_encode_payload_matches_feature_vector(self):
+        for payload in PAYLOADS:
+            x, y = encode_payload(payload)
+            expected_x, expected_y = feature_vector(payload)
+            self.assertEqual(x.shape, (len(payload), 5, 101))
+            self.assertTrue(np.array_equal(x, np.array(expected_x)))
+            self.assertTrue(np.array_equal(y, np.array(expected_y)))
+
+    def test_encode_payload_whole_vocabulary(self):
+        x, y = encode_payload(VOCABULARY)
+        expected_x, expected_y = feature_vector(VOCABULARY)
+        self.assertTrue(np.array_equal(x, np.array(expected_x)))
+        self.assertTrue(np.array_equal(y, np.array(expected_y)))
+
+    def test_encode_empty_payload(self):
+        x, y = encode_payload("")
+        self.assertEqual(x.shape, (0, 5, 101))
+        self.assertEqual(y.shape, (0, 101))
+
+    def test_encode_unknown_character_throws_exception(self):
+        self.assertRaises(ValueError, encode_payload, "caf\xe9")
+        self.assertRaises(ValueError, encode_payload, "☃")
+
+
+
+def build_waf_brain(units=16, seed=0, recurrent_activation="hard_sigmoid", reset_after=False):
+    """Small network with the WAF-Brain architecture."""
+    keras.utils.set_random_seed(seed)
+    model = keras.Sequential(
+        [
+            keras.Input((5, 101)),
+            keras.layers.GRU(
+                units,
+                recurrent_activation=recurrent_activation,
+                reset_after=reset_after,
+            ),
+            keras.layers.Dense(units),
+            keras.layers.Dropout(0.2),
+            keras.layers.Dense(101, activation="softmax"),
+        ]
+    )
+    model.compile(
+        optimizer=keras.optimizers.Adam(0.01),
+        loss="categorical_crossentropy",
+        metrics=["accuracy"],
+    )
+    # A few training steps make the predictions less uniform
+    x, y = encode_payloads(PAYLOADS * 4)[:2]
+    model.fit(x, y, epochs=20, verbose=0)
+    return model
+
+
+class WafBrainScoringTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = build_waf_brain()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.model_path = os.path.join(cls.directory.name, "waf-brain.keras")
+        cls.model.save(cls.model_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_encode_payloads_offsets(self):
+        x, y, offsets = encode_payloads(PAYLOADS)
+        self.assertEqual(offsets.tolist(), np.cumsum([0] + [len(p) for p in PAYLOADS]).tolist())
+        for payload, start, end in zip(PAYLOADS, offsets[:-1], offsets[1:]):
+            expected_x, expected_y = encode_payload(payload)
+            self.assertTrue(np.array_equal(x[start:end], expected_x))
+            self.assertTrue(np.array_equal(y[start:end], expected_y))
+
+    def test_score_payloads_matches_evaluate(self):
+        scores, losses = score_payloads(self.model, PAYLOADS)
+        for payload, score, loss in zip(PAYLOADS, scores, losses):
+            expected_loss, expected_score = self.model.evaluate(
+                *encode_payload(payload), verbose=0
+            )
+            self.assertAlmostEqual(score, expected_score, places=5)
+            self.assertAlmostEqual(loss, expected_loss, places=4)
+
+    def test_score_empty_payload_throws_exception(self):
+        self.assertRaises(ValueError, score_payloads, self.model, ["a", ""])
+
+    def test_score_no_payloads(self):
+        scores, losses = score_payloads(self.model, [])
+        self.assertEqual(len(scores), 0)
+        self.assertEqual(len(losses), 0)
+
+    def test_classify_many_matches_classify(self):
+        wrapper = WafBrainWrapper(self.model_path)
+        expected = [wrapper.classify(payload) for payload in PAYLOADS]
+        for actual, score in zip(wrapper.classify_many(PAYLOADS), expected):
+            self.assertAlmostEqual(actual, score, places=5)
+
+    def test_classify_many_wrong_values_throws_exception(self):
+        wrapper = WafBrainWrapper(self.model_path)
+        self.assertRaises(TypeError, wrapper.classify_many, "payload")
+        self.assertRaises(TypeError, wrapper.classify_many, [1])
+
+    def test_check_weights_match_evaluate(self):
+        payload = PAYLOADS[-1]
+        weights = process_payload(self.model, "q", [payload], check_weights=True)["weights"]
+        x, y = encode_payload(payload)
+        self.assertEqual([w["letter"] for w in weights], list(payload))
+        for i, weight in enumerate(weights):
+            loss, accuracy = self.model.evaluate(x[i : i + 1], y[i : i + 1], verbose=0)
+            self.assertAlmostEqual(weight["weight"], loss, places=4)
+            self.assertEqual(weight["szie"], accuracy)
+
+    def test_attribution(self):
+        wrapper = WafBrainWrapper(self.model_path)
+        payload = PAYLOADS[-1]
+        attribution = wrapper.attribution(payload)
+        _, losses = character_weights(self.model, payload)
+        self.assertEqual(attribution.shape, (len(payload),))
+        self.assertTrue(((attribution > 0) & (attribution <= 1)).all())
+        self.assertTrue(np.allclose(attribution, np.exp(-losses)))
+        self.assertRaises(TypeError, wrapper.attribution, 1)
+
+    def test_incremental_scores_match_full_scores(self):
+        parent = "1 UNION SELECT password FROM users WHERE id=1 OR 1=1 -- " * 3
+        fuzzer = SqlFuzzer(parent)
+        children = list({fuzzer.fuzz() for _ in range(20)})
+        children += [parent, parent + "x", "x" + parent, parent[:-1], parent[1:]]
+        scorer = IncrementalScorer(self.model)
+        scores, losses = scorer.score(children, parent)
+        expected_scores, expected_losses = score_payloads(self.model, children)
+        for actual, expected in zip(scores, expected_scores):
+            self.assertAlmostEqual(actual, expected, places=5)
+        for actual, expected in zip(losses, expected_losses):
+            self.assertAlmostEqual(actual, expected, places=4)
+        self.assertLess(
+            scorer.computed_windows, len(parent) + sum(len(c) for c in children)
+        )
+
+    def test_incremental_scorer_reuses_cached_payloads(self):
+        scorer = IncrementalScorer(self.model)
+        scorer.score(PAYLOADS)
+        computed = scorer.computed_windows
+        scorer.score(PAYLOADS[::-1])
+        self.assertEqual(scorer.computed_windows, computed)
+
+    def test_incremental_scorer_cache_is_bounded(self):
+        scorer = IncrementalScorer(self.model, cache_size=2)
+        scores, _ = scorer.score(PAYLOADS, PAYLOADS[-1])
+        expected, _ = score_payloads(self.model, PAYLOADS)
+        for actual, score in zip(scores, expected):
+            self.assertAlmostEqual(actual, score, places=5)
+        self.assertEqual(len(scorer._cache), 2)
+
+    def test_incremental_classify_many_matches_classify_many(self):
+        parent = PAYLOADS[-1]
+        fuzzer = SqlFuzzer(parent)
+        children = list({fuzzer.fuzz() for _ in range(10)})
+        expected = WafBrainWrapper(self.model_path).classify_many(children)
+        wrapper = WafBrainWrapper(self.model_path, incremental=True)
+        for actual, score in zip(wrapper.classify_many(children, parent), expected):
+            self.assertAlmostEqual(actual, score, places=5)
+
+
+class NumpyNetTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.model = build_waf_brain()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.model_path = os.path.join(cls.directory.name, "waf-brain.keras")
+        cls.export_path = os.path.join(cls.directory.name, "waf-brain.npz")
+        cls.model.save(cls.model_path)
+        export_model(cls.model, cls.export_path)
+        cls.x, cls.y, _ = encode_payloads(PAYLOADS)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_predict_matches_keras(self):
+        expected = self.model.predict(self.x, verbose=0)
+        actual = NumpyNet.load(self.export_path).predict(self.x)
+        self.assertTrue(np.allclose(actual, expected, atol=1e-5))
+
+    def test_predict_in_batches(self):
+        net = NumpyNet.load(self.export_path)
+        self.assertTrue(np.allclose(net.predict(self.x, batch_size=7), net.predict(self.x)))
+
+    def test_evaluate_matches_keras(self):
+        net = NumpyNet.load(self.export_path)
+        for payload in PAYLOADS:
+            x, y = encode_payload(payload)
+            expected_loss, expected_accuracy = self.model.evaluate(x, y, verbose=0)
+            loss, accuracy = net.evaluate(x, y)
+            self.assertAlmostEqual(loss, expected_loss, places=4)
+            self.assertAlmostEqual(accuracy, expected_accuracy, places=5)
+
+    def test_gru_variants_match_keras(self):
+        for recurrent_activation, reset_after in [("sigmoid", False), ("sigmoid", True), ("hard_sigmoid", True)]:
+            model = build_waf_brain(recurrent_activation=recurrent_activation, reset_after=reset_after)
+            expected = model.predict(self.x, verbose=0)
+            actual = export_model(model).predict(self.x)
+            self.assertTrue(np.allclose(actual, expected, atol=1e-5))
+
+    def test_unsupported_layer_throws_exception(self):
+        model = keras.Sequential([keras.Input((5, 101)), keras.layers.LSTM(4)])
+        self.assertRaises(ValueError, export_model, model)
+
+    def test_wrapper_engines_agree(self):
+        keras_wrapper = WafBrainWrapper(self.model_path)
+        numpy_wrapper = WafBrainWrapper(self.export_path)
+        converted_wrapper = WafBrainWrapper(self.model_path, engine="numpy")
+        self.assertEqual(keras_wrapper.engine, "keras")
+        self.assertEqual(numpy_wrapper.engine, "numpy")
+        expected = keras_wrapper.classify_many(PAYLOADS)
+        for wrapper in (numpy_wrapper, converted_wrapper):
+            for actual, score in zip(wrapper.classify_many(PAYLOADS), expected):
+                self.assertAlmostEqual(actual, score, places=5)
+            self.assertAlmostEqual(wrapper.classify(PAYLOADS[-1]), expected[-1], places=5)
+
+    def test_wrapper_wrong_engine_throws_exception(self):
+        self.assertRaises(ValueError, WafBrainWrapper, self.model_path, engine="torch")
+        self.assertRaises(ValueError, WafBrainWrapper, self.export_path, engine="keras")
+
+    def test_numpy_engine_does_not_import_tensorflow(self):
+        script = (
+            "import sys\n"
+            "from wafamole.models import WafBrainWrapper\n"
+            "WafBrainWrapper(sys.argv[1]).classify_many(['admin OR 1=1#'])\n"
+            "print('tensorflow' in sys.modules, 'keras' in sys.modules)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", script, self.export_path])
+        self.assertEqual(output.decode().split(), ["False", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
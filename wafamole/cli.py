@@ -3,21 +3,56 @@ import pickle
 import re
 from wafamole.evasion import EvasionEngine
 from wafamole.evasion.random import RandomEvasionEngine
+from wafamole.evasion.surrogate import SurrogateModel
 from wafamole.exceptions.models_exceptions import UnknownModelError
 from wafamole.models import TokenClassifierWrapper, WafBrainWrapper, SQLiGoTWrapper, MLBasedWAFWrapper
+from wafamole.models.http_waf import HttpWafModel
+from wafamole.models.pool import ModelPool
+from wafamole.models.remote import ModelServer, RemoteModel
 try:
     from wafamole.models.modsec_wrapper import PyModSecurityWrapper
 except ImportError:
     # ModSecurity module is not available
     pass
 
+def _load_model(model_type, model_path, mmap_mode=None, location="query", instrument=False):
+    if model_type == "token":
+        model = TokenClassifierWrapper().load(model_path, mmap_mode)
+    elif model_type == "mlbasedwaf":
+        model = MLBasedWAFWrapper().load(model_path, mmap_mode)
+    elif model_type == "UU":
+        model = SQLiGoTWrapper(undirected=True, proportional=False).load(model_path, mmap_mode)
+    elif model_type == "UP":
+        model = SQLiGoTWrapper(undirected=True, proportional=True).load(model_path, mmap_mode)
+    elif model_type == "DU":
+        model = SQLiGoTWrapper(undirected=False, proportional=False).load(model_path, mmap_mode)
+    elif model_type == "DP":
+        model = SQLiGoTWrapper(undirected=False, proportional=True).load(model_path, mmap_mode)
+    elif model_type == "waf-brain":
+        model = WafBrainWrapper(model_path)
+    elif model_type == "remote":
+        model = RemoteModel(model_path)
+    elif model_type == "http":
+        model = HttpWafModel(model_path, location=location)
+    elif re.match(r"modsecurity_pl[1-4]", model_type):
+        pl = int(model_type[-1])
+        try:
+            model = PyModSecurityWrapper(model_path, pl, location=location, instrument=instrument)
+        except Exception:
+            print("ModSecurity wrapper is not installed, see https://github.com/AvalZ/pymodsecurity to install")
+            exit()
+    else:
+        raise UnknownModelError("Unsupported model type")
+    return model
+
+
 @click.group()
 def wafamole():
     pass
 
 
 @wafamole.command()
-@click.option("--model-type", "-T", default="token", help="Type of classifier to load")
+@click.option("--model-type", "-T", default="token", help="Type of classifier to load, remote to use a model server listening on MODEL_PATH, or http to send payloads to the URL MODEL_PATH")
 @click.option("--timeout", "-t", default=14400, help="Timeout when evading the model")
 @click.option(
     "--max-rounds", "-r", default=1000, help="Maximum number of fuzzing rounds. Default: 1000"
@@ -41,6 +76,45 @@ def wafamole():
     default=None,
     help="Location were to save the results of the random engine. NOT USED WITH REGULAR EVOLUTION ENGINE",
 )
+@click.option(
+    "--surrogate-fraction",
+    default=None,
+    type=float,
+    help="Screen each round with an online surrogate model, sending only this fraction of the candidates to the target WAF",
+)
+@click.option(
+    "--surrogate-warmup",
+    default=50,
+    help="Target verdicts collected before trusting the surrogate. Default: 50",
+)
+@click.option(
+    "--guided",
+    is_flag=True,
+    help="Guide mutations with the model: towards the characters it finds most malicious, for models with attribution "
+    "(waf-brain, modsecurity), and towards the strategies lowering its confidence, for models with feature gradients (token)",
+)
+@click.option(
+    "--workers",
+    default=None,
+    type=int,
+    help="Score each round in this many forked worker processes, sharing the model loaded once",
+)
+@click.option(
+    "--mmap",
+    is_flag=True,
+    help="Memory-map the arrays of scikit-learn models instead of reading them",
+)
+@click.option(
+    "--location",
+    default="query",
+    type=click.Choice(["query", "urlencoded", "json", "header", "cookie"]),
+    help="Where payloads are injected in the requests to ModSecurity or to a http WAF. Default: query",
+)
+@click.option(
+    "--rule-report",
+    is_flag=True,
+    help="Print hits, scores and timings of the ModSecurity rules at the end (without --workers)",
+)
 @click.argument("model-path", default="")
 @click.argument("payload")
 def evade(
@@ -52,33 +126,28 @@ def evade(
     timeout,
     threshold,
     random_engine,
-    output_path
+    output_path,
+    surrogate_fraction,
+    surrogate_warmup,
+    guided,
+    workers,
+    mmap,
+    location,
+    rule_report,
 ):
-    if model_type == "token":
-        model = TokenClassifierWrapper().load(model_path)
-    elif model_type == "mlbasedwaf":
-        model = MLBasedWAFWrapper().load(model_path)
-    elif model_type == "UU":
-        model = SQLiGoTWrapper(undirected=True, proportional=False).load(model_path)
-    elif model_type == "UP":
-        model = SQLiGoTWrapper(undirected=True, proportional=True).load(model_path)
-    elif model_type == "DU":
-        model = SQLiGoTWrapper(undirected=False, proportional=False).load(model_path)
-    elif model_type == "DP":
-        model = SQLiGoTWrapper(undirected=False, proportional=True).load(model_path)
-    elif model_type == "waf-brain":
-        model = WafBrainWrapper(model_path)
-    elif re.match(r"modsecurity_pl[1-4]", model_type):
-        pl = int(model_type[-1])
-        try:
-            model = PyModSecurityWrapper(model_path, pl)
-        except Exception:
-            print("ModSecurity wrapper is not installed, see https://github.com/AvalZ/pymodsecurity to install")
-            exit()
-    else:
-        raise UnknownModelError("Unsupported model type")
+    model = _load_model(model_type, model_path, "r" if mmap else None, location, rule_report)
+    target = model
+
+    if workers is not None:
+        model = ModelPool(model, workers)
 
-    engine = RandomEvasionEngine(model) if random_engine is not None else EvasionEngine(model)
+    if random_engine is not None:
+        engine = RandomEvasionEngine(model)
+    else:
+        surrogate = None
+        if surrogate_fraction is not None:
+            surrogate = SurrogateModel(surrogate_fraction, surrogate_warmup)
+        engine = EvasionEngine(model, surrogate, guided)
     query_body = payload
     if random_engine is not None:
         random_results = []
@@ -91,3 +160,55 @@ def evade(
                 pickle.dump(random_results, out_file)
     else:
         engine.evaluate(query_body, max_rounds, round_size, timeout, threshold)
+
+    if workers is not None:
+        for usage in model.memory_usage():
+            if usage is not None:
+                print(
+                    "[*] Worker {pid}: RSS {rss} bytes, PSS {pss} bytes, {shared} bytes shared".format(**usage)
+                )
+        model.close()
+
+    if rule_report and hasattr(target, "report"):
+        report = target.report()
+        print("[*] {} transactions, seconds per step: {}".format(report["transactions"], report["time"]))
+        for rule in report["rules"][:20]:
+            print(
+                "[*] Rule {id} (phase {phase}, PL {paranoia_level}): {hits} hits, {score} total score".format(**rule)
+            )
+
+
+@wafamole.command("export-waf-brain")
+@click.argument("model-path")
+@click.argument("output-path")
+def export_waf_brain(model_path, output_path):
+    """Export a WAF-Brain net, to evade it without TensorFlow."""
+    from wafamole.models.custom.rnn.numpy_net import export_model
+
+    model = WafBrainWrapper(model_path)
+    export_model(model._keras_classifier, output_path)
+    print("[+] Exported to {}".format(output_path))
+
+
+@wafamole.command("serve-model")
+@click.option("--model-type", "-T", default="token", help="Type of classifier to load")
+@click.option("--socket", "socket_path", default="/tmp/wafamole.sock", help="Unix socket to listen on. Default: /tmp/wafamole.sock")
+@click.option("--max-batch-size", default=64, help="Maximum number of payloads scored together. Default: 64")
+@click.option("--max-wait", default=0.005, help="Seconds a request waits for others to join its batch. Default: 0.005")
+@click.option("--mmap", is_flag=True, help="Memory-map the arrays of scikit-learn models instead of reading them")
+@click.argument("model-path", default="")
+def serve_model(model_type, socket_path, max_batch_size, max_wait, mmap, model_path):
+    """Load a model once and serve it to evade -T remote."""
+    model = _load_model(model_type, model_path, "r" if mmap else None)
+    server = ModelServer(model, socket_path, max_batch_size, max_wait)
+    print("[+] Serving {} on {}".format(model_type, socket_path))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        stats = server.stats
+        print("[*] Scored {values} payloads in {batches} batches".format(**stats))
+        print("[*] Batch sizes: {}".format(stats["batch_size"]))
+        print("[*] Wait times: {}".format(stats["wait"]))
@@ -1,20 +1,37 @@
 from abc import ABCMeta, abstractmethod
-from wafamole.payloadfuzzer.sqlfuzzer import SqlFuzzer
+from wafamole.payloadfuzzer.sqlfuzzer import SqlFuzzer, strategy_weights
 from wafamole.models import Model
 
 
 class CoreEngine(object, metaclass=ABCMeta):
 
-	def __init__(self, model: Model):
+	def __init__(self, model: Model, surrogate=None, guided=False):
 		self._model = model
+		self._surrogate = surrogate
+		self._guided = guided
+
+	@property
+	def surrogate(self):
+		return self._surrogate
 
 	def _mutation_round(self, payload, round_size):
-		fuzzer = SqlFuzzer(payload)
+		influence, weights = None, None
+		if self._guided:
+			# Bias mutations towards the characters the model finds most malicious,
+			# and towards the strategies moving the features against the gradient
+			influence = self._model.attribution(payload)
+			gradient = self._model.feature_gradient(payload)
+			if gradient is not None:
+				weights = strategy_weights(payload, self._model.extract_features, gradient)
+		fuzzer = SqlFuzzer(payload, influence, weights)
 
 		# Some mutations do not apply to some payloads
 		# This removes duplicate payloads
-		payloads = {fuzzer.fuzz() for _ in range(round_size)}
-		results = map(self._model.classify, payloads)
+		payloads = list({fuzzer.fuzz() for _ in range(round_size)})
+		if self._surrogate is None:
+			results = self._model.classify_many(payloads, payload)
+		else:
+			results, payloads = self._surrogate.screen(self._model, payloads, payload)
 		confidence, payload = min(zip(results, payloads))
 		return confidence, payload
 
@@ -1,30 +1,36 @@
 """The main class of WAF-A-MoLE"""
 import signal
-
-from multiprocessing import Pool
+import threading
+import time
 
 from wafamole.evasion.engine import CoreEngine
+from wafamole.evasion.surrogate import SurrogateModel
 from wafamole.models import Model
 from wafamole.payloadfuzzer.sqlfuzzer import SqlFuzzer
 from wafamole.utils.check import type_check
 
-map = Pool().map
-
 
 class EvasionEngine(CoreEngine):
     """Evasion engine object.
     """
 
-    def __init__(self, model: Model):
+    def __init__(self, model: Model, surrogate: SurrogateModel = None, guided: bool = False):
         """Initialize an evasion object.
         Arguments:
             model: the input model to evaluate
 
+        Keyword Arguments:
+            surrogate: screens the candidates of each round before they reach model (default: (None))
+            guided: edit the positions the attribution of model points at more often (default: (False))
+
         Raises:
-            TypeError: model is not Model
+            TypeError: model is not Model, or surrogate is not SurrogateModel
         """
         type_check(model, Model, "model")
-        super(EvasionEngine, self).__init__(model)
+        if surrogate is not None:
+            type_check(surrogate, SurrogateModel, "surrogate")
+        type_check(guided, bool, "guided")
+        super(EvasionEngine, self).__init__(model, surrogate, guided)
 
     # def _mutation_round(self, payload, round_size):
     #
@@ -71,9 +77,14 @@ class EvasionEngine(CoreEngine):
         def _signal_handler(signum, frame):
             raise TimeoutError()
 
-        # Timeout setup
-        signal.signal(signal.SIGALRM, _signal_handler)
-        signal.alarm(timeout)
+        # Timeout setup, signals can only be handled in the main thread:
+        # evaluations running in other threads check a deadline every round
+        deadline = None
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGALRM, _signal_handler)
+            signal.alarm(timeout)
+        else:
+            deadline = time.monotonic() + timeout
 
         evaluation_results = []
         min_confidence, min_payload = self._mutation_round(payload, round_size)
@@ -85,6 +96,8 @@ class EvasionEngine(CoreEngine):
                     evaluation_results
                 ):
                     max_rounds -= 1
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise TimeoutError()
 
                     confidence, payload = self._mutation_round(
                         candidate_payload, round_size
@@ -107,5 +120,15 @@ class EvasionEngine(CoreEngine):
                 min_confidence, repr(min_payload)
             )
         )
+        if self._surrogate is not None:
+            stats = self._surrogate.stats
+            print(
+                "[*] Surrogate: {} oracle queries for {} candidates, {} audit misses over {} audits".format(
+                    stats["oracle_queries"],
+                    stats["candidates"],
+                    stats["audit_misses"],
+                    stats["audits"],
+                )
+            )
 
         return min_confidence, min_payload
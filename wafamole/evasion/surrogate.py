@@ -0,0 +1,152 @@
+"""Surrogate pre-screening of the candidates of a mutation round."""
+import math
+import random
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDRegressor
+
+from wafamole.models import Model
+from wafamole.utils.check import type_check
+
+
+class SurrogateModel(object):
+    """Cheap regressor of the target confidence, trained online from the verdicts of the target.
+    Once trained, it ranks the candidates of each round and only the most promising
+    fraction of them is classified by the (slow) target model.
+    """
+
+    def __init__(
+        self,
+        fraction: float = 0.5,
+        warmup: int = 50,
+        audit_rate: float = 0.1,
+        n_features: int = 2 ** 12,
+        random_state: int = None,
+    ):
+        """Constructs a surrogate model.
+
+        Keyword Arguments:
+            fraction (float) : fraction of each round classified by the target, 1.0 to never trust the surrogate (default: (0.5))
+            warmup (int) : verdicts collected before the surrogate is trusted (default: (50))
+            audit_rate (float) : probability of classifying a discarded candidate anyway, to measure surrogate errors (default: (0.1))
+            n_features (int) : size of the hashed character n-gram feature space (default: (4096))
+            random_state (int) : seed of the audits and of the regressor (default: (None))
+
+        Raises:
+            TypeError: arguments are mistyped
+            ValueError: fraction or audit_rate out of range
+        """
+        type_check(fraction, float, "fraction")
+        type_check(warmup, int, "warmup")
+        type_check(audit_rate, float, "audit_rate")
+        type_check(n_features, int, "n_features")
+        if not 0.0 < fraction <= 1.0:
+            raise ValueError("fraction must be in (0, 1]")
+        if not 0.0 <= audit_rate <= 1.0:
+            raise ValueError("audit_rate must be in [0, 1]")
+
+        self._fraction = fraction
+        self._warmup = warmup
+        self._audit_rate = audit_rate
+        self._random = random.Random(random_state)
+        self._vectorizer = HashingVectorizer(
+            analyzer="char",
+            ngram_range=(1, 3),
+            n_features=n_features,
+            alternate_sign=False,
+            lowercase=False,
+        )
+        self._regressor = SGDRegressor(random_state=random_state)
+        self._verdicts = 0
+        self._stats = {
+            "rounds": 0,
+            "candidates": 0,
+            "oracle_queries": 0,
+            "screened_out": 0,
+            "audits": 0,
+            "audit_misses": 0,
+        }
+
+    @property
+    def trusted(self):
+        """True once the surrogate has seen enough verdicts to screen candidates."""
+        return self._verdicts > 0 and self._verdicts >= self._warmup
+
+    @property
+    def stats(self):
+        """Screening statistics.
+        An audit miss is a discarded candidate that the target scored better
+        than every candidate the surrogate selected in the same round.
+
+        Returns:
+            dict : counters, plus the audit miss rate
+        """
+        stats = dict(self._stats)
+        stats["miss_rate"] = (
+            stats["audit_misses"] / stats["audits"] if stats["audits"] else 0.0
+        )
+        return stats
+
+    def predict(self, payloads: list):
+        """Estimates the target confidence of each payload.
+
+        Arguments:
+            payloads (list) : the payloads
+
+        Returns:
+            numpy ndarray : the estimated confidences
+        """
+        return self._regressor.predict(self._vectorizer.transform(payloads))
+
+    def update(self, payloads: list, confidences: list):
+        """Trains the surrogate on new verdicts of the target.
+
+        Arguments:
+            payloads (list) : the classified payloads
+            confidences (list) : the confidence of the target on each payload
+        """
+        if not payloads:
+            return
+        self._regressor.partial_fit(
+            self._vectorizer.transform(payloads), np.asarray(confidences, dtype=float)
+        )
+        self._verdicts += len(payloads)
+
+    def screen(self, model: Model, payloads: list, parent: str = None):
+        """Classifies the most promising payloads with the target model.
+
+        Arguments:
+            model (Model) : the target model
+            payloads (list) : the candidates of a mutation round
+
+        Keyword Arguments:
+            parent (str) : the payload the candidates were mutated from (default: (None))
+
+        Returns:
+            (list, list) : confidences of the target, and the corresponding classified payloads
+        """
+        type_check(model, Model, "model")
+        self._stats["rounds"] += 1
+        self._stats["candidates"] += len(payloads)
+
+        selected, audited = payloads, []
+        if self.trusted and len(payloads) > 1:
+            ranking = np.argsort(self.predict(payloads), kind="stable")
+            keep = max(1, int(math.ceil(self._fraction * len(payloads))))
+            selected = [payloads[i] for i in ranking[:keep]]
+            discarded = [payloads[i] for i in ranking[keep:]]
+            audited = [p for p in discarded if self._random.random() < self._audit_rate]
+            self._stats["screened_out"] += len(discarded) - len(audited)
+
+        evaluated = selected + audited
+        confidences = list(model.classify_many(evaluated, parent))
+        self._stats["oracle_queries"] += len(evaluated)
+        if audited:
+            best_selected = min(confidences[: len(selected)])
+            self._stats["audits"] += len(audited)
+            self._stats["audit_misses"] += sum(
+                c < best_selected for c in confidences[len(selected) :]
+            )
+        self.update(evaluated, confidences)
+        return confidences, evaluated
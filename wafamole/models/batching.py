@@ -0,0 +1,214 @@
+"""Dynamic batching of concurrent classify calls.
+
+A BatchingModel is shared by many evaluations running in threads (or asyncio
+tasks, through asyncio.wrap_future) of the same process. Their calls are
+queued and flushed to the batch path of the wrapped model, classify_many, as
+soon as a batch is full or its oldest call has waited long enough.
+"""
+import bisect
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from wafamole.models import Model
+from wafamole.utils.check import type_check
+
+# Upper bounds of the buckets of the wait time histogram, in seconds
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+
+
+class _Request(object):
+    def __init__(self, values, parent):
+        self.values = values
+        self.parent = parent
+        self.future = Future()
+        self.queued = time.monotonic()
+
+
+class BatchingModel(Model):
+    """Model grouping the concurrent calls of many threads in batches."""
+
+    def __init__(self, model: Model, max_batch_size: int = 64, max_wait: float = 0.005):
+        """Starts the thread flushing the batches.
+
+        Arguments:
+            model (Model) : the wrapped model
+
+        Keyword Arguments:
+            max_batch_size (int) : number of values that flushes a batch (default: (64))
+            max_wait (float) : seconds the first call of a batch waits for others to join it (default: (0.005))
+
+        Raises:
+            TypeError: arguments are mistyped
+            ValueError: max_batch_size is not positive
+        """
+        type_check(model, Model, "model")
+        type_check(max_batch_size, int, "max_batch_size")
+        type_check(max_wait, float, "max_wait")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        # Serializes the calls to the wrapped model, which need not be thread safe
+        self._lock = threading.Lock()
+        # Guards the counters and the closed flag, so that reading stats does not wait for a batch
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._queue = queue.Queue()
+        self._batches = 0
+        self._values = 0
+        self._batch_sizes = {}
+        self._waits = [0] * len(WAIT_BUCKETS)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def stats(self):
+        """Number of batches and values scored so far, and their histograms.
+        Batch sizes are counted in power of two buckets, keyed by their upper bound.
+        Wait times, from the call to the flush of its batch, are keyed by the
+        upper bounds in WAIT_BUCKETS.
+
+        Returns:
+            dict : batches, values, batch_size and wait
+        """
+        with self._stats_lock:
+            return {
+                "batches": self._batches,
+                "values": self._values,
+                "batch_size": dict(sorted(self._batch_sizes.items())),
+                "wait": {bound: count for bound, count in zip(WAIT_BUCKETS, self._waits) if count},
+            }
+
+    def submit(self, values: list, parent: object = None):
+        """Queues values for the next batch.
+
+        Arguments:
+            values (list) : input values
+
+        Keyword Arguments:
+            parent (object) : the value all the inputs were mutated from, kept if the whole batch shares it (default: (None))
+
+        Raises:
+            TypeError: values is not list
+            RuntimeError: the model is closed
+
+        Returns:
+            concurrent.futures.Future : resolved with the confidence of each value
+        """
+        type_check(values, list, "values")
+        request = _Request(values, parent)
+        if not values:
+            request.future.set_result([])
+            return request.future
+        with self._stats_lock:
+            if self._closed:
+                raise RuntimeError("BatchingModel is closed")
+            self._queue.put(request)
+        return request.future
+
+    def extract_features(self, value: object):
+        with self._lock:
+            return self._model.extract_features(value)
+
+    def classify(self, value: object):
+        return self.submit([value]).result()[0]
+
+    def classify_many(self, values: list, parent: object = None):
+        """Scores values in a batch shared with the concurrent callers.
+
+        Arguments:
+            values (list) : input values
+
+        Keyword Arguments:
+            parent (object) : the value all the inputs were mutated from (default: (None))
+
+        Returns:
+            list : the confidence of the malicious class, one for each value.
+        """
+        return self.submit(values, parent).result()
+
+    def attribution(self, value: object):
+        with self._lock:
+            return self._model.attribution(value)
+
+    def feature_gradient(self, value: object):
+        with self._lock:
+            return self._model.feature_gradient(value)
+
+    def close(self):
+        """Flushes the queued calls and stops the batching thread.
+        Further calls raise RuntimeError.
+        """
+        with self._stats_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            size = len(first.values)
+            deadline = first.queued + self._max_wait
+            while size < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+                size += len(request.values)
+            self._flush(batch)
+
+    def _flush(self, batch):
+        values = [value for request in batch for value in request.values]
+        parent = batch[0].parent
+        if any(request.parent != parent for request in batch):
+            parent = None
+        with self._lock:
+            flushed = time.monotonic()
+            try:
+                results = list(self._model.classify_many(values, parent))
+            except Exception:
+                # Scores each call on its own, so that a faulty call does not fail the others
+                results = None
+                outcomes = []
+                for request in batch:
+                    try:
+                        outcomes.append(list(self._model.classify_many(request.values, request.parent)))
+                    except Exception as e:
+                        outcomes.append(e)
+        with self._stats_lock:
+            self._batches += 1
+            self._values += len(values)
+            bucket = 1 << (len(values) - 1).bit_length()
+            self._batch_sizes[bucket] = self._batch_sizes.get(bucket, 0) + 1
+            for request in batch:
+                self._waits[bisect.bisect_left(WAIT_BUCKETS, flushed - request.queued)] += 1
+        if results is None:
+            for request, outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    request.future.set_exception(outcome)
+                else:
+                    request.future.set_result(outcome)
+            return
+        start = 0
+        for request in batch:
+            request.future.set_result(results[start : start + len(request.values)])
+            start += len(request.values)
@@ -0,0 +1,104 @@
+"""Content-addressed store of SQLiGoT feature matrices.
+
+Each entry is keyed by a hash of the input corpus together with the parameters
+of the feature extractor, so that a matrix is recomputed only when the corpus
+or the extraction changes.
+"""
+import hashlib
+import json
+import os
+import numpy as np
+import scipy.sparse as sp
+from wafamole.utils.check import type_check, file_exists
+
+
+class FeatureStore:
+    """Directory of feature matrices, addressed by content hash."""
+
+    def __init__(self, directory: str):
+        """Constructs a store rooted in directory, created on first save.
+
+        Arguments:
+            directory (str) : where feature matrices are stored
+
+        Raises:
+            TypeError: directory is not string
+        """
+        type_check(directory, str, "directory")
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def key(self, filepath: str, **params):
+        """Computes the key of the features extracted from filepath with params.
+
+        Arguments:
+            filepath (str) : path of the input corpus
+
+        Keyword Arguments:
+            params : parameters of the feature extractor, JSON serializable
+
+        Raises:
+            TypeError: filepath is not string
+            FileNotFoundError: filepath not pointing to any file
+
+        Returns:
+            str : the hexadecimal key
+        """
+        type_check(filepath, str, "filepath")
+        file_exists(filepath)
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(json.dumps(params, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _path(self, key, part="dense"):
+        return os.path.join(self._directory, "{}.{}.npy".format(key, part))
+
+    def _write(self, path, array):
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    def load(self, key: str):
+        """Loads a feature matrix backed by read-only memory maps.
+
+        Arguments:
+            key (str) : the key of the matrix
+
+        Returns:
+            numpy ndarray or scipy CSR matrix : the stored matrix, None if the key is not stored
+        """
+        if os.path.isfile(self._path(key)):
+            return np.load(self._path(key), mmap_mode="r")
+        if os.path.isfile(self._path(key, "shape")):
+            data, indices, indptr = [
+                np.load(self._path(key, part), mmap_mode="r")
+                for part in ("data", "indices", "indptr")
+            ]
+            shape = tuple(np.load(self._path(key, "shape")))
+            return sp.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+        return None
+
+    def save(self, key: str, X):
+        """Stores a feature matrix, dense or sparse. Files are written atomically,
+        the last one marking the entry as complete, so that concurrent trainings
+        never read a partial entry.
+
+        Arguments:
+            key (str) : the key of the matrix
+            X (numpy ndarray or scipy sparse matrix) : the matrix to store
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        if not sp.issparse(X):
+            self._write(self._path(key), np.asarray(X))
+            return
+        X = X.tocsr()
+        for part in ("data", "indices", "indptr"):
+            self._write(self._path(key, part), getattr(X, part))
+        self._write(self._path(key, "shape"), np.array(X.shape))
@@ -1,3 +1,5 @@
+import numpy as np
+import scipy.sparse as sp
 from wafamole.models.custom.graph.sqligot import SQLiGoT
 from wafamole.models import SklearnModelWrapper
 from wafamole.utils.check import type_check
@@ -11,7 +13,12 @@ class SQLiGoTWrapper(SklearnModelWrapper):
     """SQLiGoT wrapper"""
 
     def __init__(
-        self, sqligot_classifier: SQLiGoT = None, undirected=True, proportional=True
+        self,
+        sqligot_classifier: SQLiGoT = None,
+        undirected=True,
+        proportional=True,
+        fast_inference=False,
+        cache_size=4096,
     ):
         """Constructs the wrapper.
         
@@ -21,6 +28,8 @@ class SQLiGoTWrapper(SklearnModelWrapper):
             sqligot_classifier (SQLiGoT) : SQLiGoT object (default: None)
             undirected (bool) : set undirection for feature extraction (default: (True))
             proportional (bool) : set weights for edges in graph (default: (True))
+            fast_inference (bool) : score with a FrozenSQLiGoT built from the classifier (default: (False))
+            cache_size (int) : number of feature vectors whose prediction is kept, 0 to disable the cache (default: (4096))
 
         Raises:
             TypeError: wrong input types
@@ -32,10 +41,21 @@ class SQLiGoTWrapper(SklearnModelWrapper):
             type_check(sqligot_classifier, SQLiGoT, "sqligot_classifier")
         type_check(undirected, bool, "undirected")
         type_check(proportional, bool, "proportional")
+        type_check(fast_inference, bool, "fast_inference")
 
         self._undirected = undirected
         self._proportional = proportional
-        return super(SQLiGoTWrapper, self).__init__(sqligot_classifier)
+        self._fast_inference = fast_inference
+        self._frozen = None
+        return super(SQLiGoTWrapper, self).__init__(sqligot_classifier, cache_size)
+
+    def _predictor(self):
+        """Returns the object whose predict_proba scores the feature vectors."""
+        if not self._fast_inference:
+            return self._sklearn_classifier
+        if self._frozen is None or self._frozen[0] is not self._sklearn_classifier:
+            self._frozen = (self._sklearn_classifier, self._sklearn_classifier.freeze())
+        return self._frozen[1]
 
     def extract_features(self, value: str):
         """Extract feature vector using SQLiGoT extractor.
@@ -78,8 +98,47 @@ class SQLiGoTWrapper(SklearnModelWrapper):
         if feature_vector is None:
             return 1
         try:
-            y_pred = self._sklearn_classifier.predict_proba([feature_vector])
+            y_pred = self._predict_proba([feature_vector], self._predictor())
             return y_pred[0, 1]
         except Exception as e:
             raise SklearnInternalError("Internal sklearn error.") from e
         return super(SQLiGoTWrapper, self).classify(value)[0, 1]
+
+    def classify_many(self, values: list, parent: str = None):
+        """Computes the probability of being a sql injection of many queries,
+        with a single predict_proba call on the valid ones.
+
+        Arguments:
+            values (list) : the input queries
+
+        Keyword Arguments:
+            parent (str) : unused (default: (None))
+
+        Raises:
+            TypeError: values is not a list of strings
+            ModuleNotLoadedError: calling function without having loaded or passed model as arg
+            SklearnInternalError: internal sklearn exception has been thrown
+
+        Returns:
+            list : probability of being a sql injection of each query.
+        """
+        if self._sklearn_classifier is None:
+            raise ModelNotLoadedError()
+        type_check(values, list, "values")
+        for value in values:
+            type_check(value, str, "value")
+        # Sparse inputs are only accepted by SVMs trained on sparse data.
+        sparse = sp.issparse(getattr(self._sklearn_classifier, "support_vectors_", None))
+        X, mask = self._sklearn_classifier.preprocess_many(
+            values,
+            undirected=self._undirected,
+            proportional=self._proportional,
+            sparse=sparse,
+        )
+        confidence = np.ones(len(values))
+        if mask.any():
+            try:
+                confidence[mask] = self._predict_proba(X, self._predictor())[:, 1]
+            except Exception as e:
+                raise SklearnInternalError("Internal sklearn error.") from e
+        return confidence.tolist()
@@ -4,27 +4,120 @@ SQLiGoT: Detecting SQL injection attacks using graph of tokens and SVM
 
 Implementation of graph SVM classifier
 """
-import networkx as nx
 import numpy as np
 import re
-import os
+from collections import namedtuple
+from functools import partial
+from multiprocessing import Pool
+import scipy.sparse as sp
 from sklearn.svm import SVC
+from sklearn.utils.validation import check_is_fitted
 import wafamole.tokenizer.allowed_tokens as alt
-from wafamole.utils.check import type_check
+from wafamole.models.custom.graph.feature_store import FeatureStore
+from wafamole.utils.check import type_check, file_exists
 
+# Version of the feature extraction, part of the feature store keys:
+# increase it whenever extracted feature vectors change.
+FEATURES_VERSION = 1
 
-def _histogram_of_tokens(tokens):
-    total_length = len(alt.TOKENS)
-    hist = [0 for _ in range(total_length)]
-    for t in tokens:
-        hist[alt.TOKENS.index(t)] = tokens.count(t)
-    return hist
+# Graph of tokens of a query: the nodes are the distinct token ids found in the
+# query, adjacency[a, b] is the weight of the edge going from nodes[a] to nodes[b].
+GraphOfTokens = namedtuple("GraphOfTokens", ["token_ids", "nodes", "adjacency", "undirected"])
+
+# TOKENS contains a few duplicated entries (e.g. AND, OR): every position of a
+# duplicated token shares the node of its first occurrence.
+_FIRST_IDS = np.array([alt.TOKEN_IDS[t] for t in alt.TOKENS])
+# Node counts were stored as graph attributes, overwritten by the last
+# occurrence of a duplicated token: this index keeps the same values.
+_LAST_IDS = np.array(
+    [len(alt.TOKENS) - 1 - alt.TOKENS[::-1].index(t) for t in alt.TOKENS]
+)
+
+
+def _histogram_of_tokens(token_ids):
+    return np.bincount(token_ids, minlength=len(alt.TOKENS))
 
 
 def _get_allowed_tokens():
     return alt.TOKENS
 
 
+def _sliding_window_edges(length, sliding_window_length, proportional):
+    """Returns source positions, destination positions and weights of the edges
+    produced by sliding the window over a sequence of tokens."""
+    last_start = max(0, length - sliding_window_length)
+    start = np.arange(last_start + 1)[:, None]
+    offset = np.arange(1, sliding_window_length)[None, :]
+    mask = start + offset < length
+    src, dst = np.broadcast_to(start, mask.shape)[mask], (start + offset)[mask]
+    if proportional:
+        weights = (start - offset + 1 + sliding_window_length)[mask]
+    else:
+        weights = np.ones(len(src), dtype=np.int64)
+    return src, dst, weights
+
+
+def _degrees(graph):
+    """Returns the weighted in and out degree of every token of the vocabulary."""
+    in_degree = np.zeros(len(alt.TOKENS), dtype=np.int64)
+    out_degree = np.zeros(len(alt.TOKENS), dtype=np.int64)
+    in_degree[graph.nodes] = graph.adjacency.sum(axis=0)
+    out_degree[graph.nodes] = graph.adjacency.sum(axis=1)
+    return in_degree[_FIRST_IDS], out_degree[_FIRST_IDS]
+
+
+def _interleave(a, b):
+    feature_vector = np.empty(len(a) + len(b))
+    feature_vector[0::2] = a
+    feature_vector[1::2] = b
+    return feature_vector
+
+
+def _unique_rows(X):
+    """Sorted unique rows, like np.unique(X, axis=0), also for CSR matrices."""
+    if not sp.issparse(X):
+        return np.unique(X, axis=0)
+    X = X.tocsr()
+    X.sort_indices()
+
+    # Features are non negative: the first different column of two sparse
+    # rows decides their order exactly like the dense lexicographic order.
+    def _row_key(i):
+        start, end = X.indptr[i], X.indptr[i + 1]
+        return tuple(zip(-X.indices[start:end], X.data[start:end]))
+
+    keys = [_row_key(i) for i in range(X.shape[0])]
+    rows = sorted(range(len(keys)), key=keys.__getitem__)
+    rows = [r for i, r in enumerate(rows) if i == 0 or keys[r] != keys[rows[i - 1]]]
+    return X[rows]
+
+
+def memory_usage(X):
+    """Returns the memory used by a feature matrix, next to the memory used by
+    the same matrix in dense form.
+
+    Arguments:
+        X (numpy ndarray or scipy sparse matrix) : the feature matrix
+
+    Returns:
+        dict : bytes used by X, bytes of the dense equivalent and density of X
+    """
+    dense_bytes = X.shape[0] * X.shape[1] * X.dtype.itemsize
+    if sp.issparse(X):
+        X = X.tocsr()
+        nbytes = X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+        nnz = X.nnz
+    else:
+        nbytes = X.nbytes
+        nnz = np.count_nonzero(X)
+    size = X.shape[0] * X.shape[1]
+    return {
+        "bytes": nbytes,
+        "dense_bytes": dense_bytes,
+        "density": float(nnz / size) if size else 0.0,
+    }
+
+
 class SQLiGoT(SVC):
     """SQLiGoT implementation."""
 
@@ -66,6 +159,11 @@ class SQLiGoT(SVC):
             random_state=random_state,
         )
 
+    @property
+    def sliding_window_length(self):
+        # Exposed for sklearn get_params/clone.
+        return self._sliding_window_length
+
     def _preprocess_input_query(self, query):
         query = query.strip().upper()
         query = re.sub(r"( |\t|\n|\r|/\*\*/|`)+", " ", query)
@@ -77,91 +175,67 @@ class SQLiGoT(SVC):
         splitted_string = query.split(" ")
         tokens = []
         for t in splitted_string:
-            if t in _get_allowed_tokens():
+            if t in alt.TOKEN_IDS:
                 tokens.append(t)
             else:
                 if len(t) > 1:
                     tokens.append("STR")
                 else:
                     tokens.append("CHR")
-        if "WHERE" not in tokens:
+        token_ids = alt.encode_tokens(tokens)
+        where = np.flatnonzero(token_ids == alt.TOKEN_IDS["WHERE"])
+        if where.size == 0:
             return None
-        tokens = tokens[tokens.index("WHERE") + 1 :]
-        if not tokens:
+        token_ids = token_ids[where[0] + 1 :]
+        if token_ids.size == 0:
             return None
-        return tokens
+        return token_ids
 
     def _create_graph_from_sql_query(
         self, sql_query, proportional=False, undirected=False
     ):
-        token_sequence = self._preprocess_input_query(sql_query)
-        if token_sequence is None:
+        token_ids = self._preprocess_input_query(sql_query)
+        if token_ids is None:
             return None
-        graph = nx.Graph() if undirected else nx.DiGraph()
-        token_count = _histogram_of_tokens(token_sequence)
-        [
-            graph.add_node(t, count=token_count[i])
-            for i, t in enumerate(_get_allowed_tokens())
-        ]
-        for i, token in enumerate(token_sequence):
-            stop_slide = (
-                i + self._sliding_window_length
-                if i + self._sliding_window_length < len(token_sequence)
-                else len(token_sequence)
-            )
-            window = token_sequence[i + 1 : stop_slide]
-            for j, slide_token in enumerate(window):
-                additive_weight = (
-                    i - j + self._sliding_window_length if proportional else 1
-                )
-                if graph.has_edge(token, slide_token):
-                    graph[token][slide_token]["weight"] += additive_weight
-                else:
-                    graph.add_edge(token, slide_token, weight=additive_weight)
-            if stop_slide == len(token_sequence):
-                break
-        return graph
+        nodes, local_ids = np.unique(token_ids, return_inverse=True)
+        src, dst, weights = _sliding_window_edges(
+            len(token_ids), self._sliding_window_length, proportional
+        )
+        adjacency = np.zeros((len(nodes), len(nodes)), dtype=np.int64)
+        np.add.at(adjacency, (local_ids[src], local_ids[dst]), weights)
+        return GraphOfTokens(token_ids, nodes, adjacency, undirected)
 
     @staticmethod
     def _extract_feature_vector_from_directed_graph(graph, normalize=True):
-        if not isinstance(graph, nx.DiGraph):
+        if graph.undirected:
             raise ValueError()
-        allowed = _get_allowed_tokens()
-        in_degree_dict = [graph.in_degree(t, "weight") for t in allowed]
-        max_in_degree = max(in_degree_dict) if normalize else 1
-        out_degree_dict = [graph.out_degree(t, "weight") for t in allowed]
-        max_out_degree = max(out_degree_dict) if normalize else 1
+        in_degree, out_degree = _degrees(graph)
+        max_in_degree = in_degree.max() if normalize else 1
+        max_out_degree = out_degree.max() if normalize else 1
         if max_in_degree == 0 or max_out_degree == 0:
             return None
-        feature_vector = []
-        [
-            feature_vector.extend((a / max_in_degree, b / max_out_degree))
-            for (a, b) in zip(in_degree_dict, out_degree_dict)
-        ]
-        feature_vector = np.array(feature_vector)
-        return feature_vector
+        return _interleave(in_degree / max_in_degree, out_degree / max_out_degree)
 
     @staticmethod
     def _extract_feature_vector_from_undirected_graph(graph):
-        if not isinstance(graph, nx.Graph):
+        if not graph.undirected:
             raise ValueError()
-        allowed = _get_allowed_tokens()
-        degree = [graph.degree(t, "weight") for t in allowed]
-        max_degree = max(degree)
-        count = [graph.node[t]["count"] for t in allowed]
-        max_count = max(count)
+        # Undirected degree counts both directions, self loops twice.
+        in_degree, out_degree = _degrees(graph)
+        degree = in_degree + out_degree
+        max_degree = degree.max()
+        count = _histogram_of_tokens(graph.token_ids)[_LAST_IDS]
+        max_count = count.max()
         if max_count == 0 or max_degree == 0:
             return None
-        feature_vector = []
-        [
-            feature_vector.extend((a / max_count, b / max_degree))
-            for (a, b) in zip(count, degree)
-        ]
-        feature_vector = np.array(feature_vector)
-        return feature_vector
+        return _interleave(count / max_count, degree / max_degree)
 
     def preprocess_single_query(
-        self, sql_query: str, undirected: bool = False, proportional: bool = True
+        self,
+        sql_query: str,
+        undirected: bool = False,
+        proportional: bool = True,
+        normalize: bool = True,
     ):
         """Create feature vector from input query.
         
@@ -171,6 +245,7 @@ class SQLiGoT(SVC):
         Keyword Arguments:
             undirected (bool) : create undirected graph if true (default: (False))
             proportional (bool) : create weighted graph if true (default: (True))
+            normalize (bool) : normalize the degrees of directed graphs (default: (True))
 
         Raises:
             TypeError: arguments are not typed correctly
@@ -181,48 +256,176 @@ class SQLiGoT(SVC):
         type_check(sql_query, str, "sql_query")
         type_check(undirected, bool, "undirected")
         type_check(proportional, bool, "proportional")
+        type_check(normalize, bool, "normalize")
 
         graph = self._create_graph_from_sql_query(
             sql_query, proportional=proportional, undirected=undirected
         )
         if graph is None:
             return None
-        extract_feat = (
-            self._extract_feature_vector_from_undirected_graph
-            if undirected
-            else self._extract_feature_vector_from_directed_graph
-        )
-        feature_vector = extract_feat(graph)
+        if undirected:
+            feature_vector = self._extract_feature_vector_from_undirected_graph(graph)
+        else:
+            feature_vector = self._extract_feature_vector_from_directed_graph(
+                graph, normalize=normalize
+            )
         if feature_vector is None:
             return None
         return feature_vector
 
+    def preprocess_many(
+        self,
+        sql_queries: list,
+        undirected: bool = False,
+        proportional: bool = True,
+        normalize: bool = True,
+        sparse: bool = False,
+    ):
+        """Create the feature matrix of many input queries.
+        Queries without a feature vector (e.g. without WHERE) have no row in the matrix.
+
+        Arguments:
+            sql_queries (list) : input sql queries
+
+        Keyword Arguments:
+            undirected (bool) : create undirected graph if true (default: (False))
+            proportional (bool) : create weighted graph if true (default: (True))
+            normalize (bool) : normalize the degrees of directed graphs (default: (True))
+            sparse (bool) : return a scipy CSR matrix (default: (False))
+
+        Raises:
+            TypeError: arguments are not typed correctly
+
+        Returns:
+            (numpy ndarray or scipy CSR matrix, numpy ndarray) : the feature matrix of the
+                valid queries and the boolean mask of the valid queries
+        """
+        type_check(sql_queries, list, "sql_queries")
+        type_check(sparse, bool, "sparse")
+        feature_vectors = [
+            self.preprocess_single_query(
+                q, undirected=undirected, proportional=proportional, normalize=normalize
+            )
+            for q in sql_queries
+        ]
+        mask = np.array([fv is not None for fv in feature_vectors], dtype=bool)
+        feature_vectors = [fv for fv in feature_vectors if fv is not None]
+        shape = (len(feature_vectors), 2 * len(alt.TOKENS))
+        if sparse:
+            indices = [np.flatnonzero(fv) for fv in feature_vectors]
+            indptr = np.zeros(shape[0] + 1, dtype=np.int32)
+            np.cumsum([len(i) for i in indices], out=indptr[1:])
+            data = np.concatenate(
+                [fv[i] for fv, i in zip(feature_vectors, indices)] or [np.empty(0)]
+            )
+            indices = np.concatenate(indices or [np.empty(0, dtype=np.int32)])
+            X = sp.csr_matrix((data, indices.astype(np.int32), indptr), shape=shape)
+            return X, mask
+        X = np.empty(shape)
+        for i, fv in enumerate(feature_vectors):
+            X[i] = fv
+        return X, mask
+
     def _create_feature_vectors_from_file(
-        self, filepath, undirected=False, proportional=True, limit_samples=10000
+        self,
+        filepath,
+        undirected=False,
+        proportional=True,
+        normalize=True,
+        limit_samples=10000,
+        n_jobs=1,
+        chunk_size=1000,
+        sparse=False,
     ):
-        X = []
         with open(filepath, "r") as f:
             sql_queries = f.readlines()
-        for i, sql_query in enumerate(sql_queries):
-            if limit_samples is not None and i > limit_samples:
-                break
-            feature_vector = self.preprocess_single_query(
-                sql_query, undirected=undirected, proportional=proportional
-            )
-            if feature_vector is None:
-                if limit_samples is not None:
-                    limit_samples += 1
-                continue
-            X.append(feature_vector)
-        X = np.array(X)
-        return X
+        chunks = [
+            sql_queries[i : i + chunk_size]
+            for i in range(0, len(sql_queries), chunk_size)
+        ]
+        extract = partial(
+            self.preprocess_many,
+            undirected=undirected,
+            proportional=proportional,
+            normalize=normalize,
+            sparse=sparse,
+        )
+        # Queries without feature vector do not count: the first
+        # limit_samples + 1 valid feature vectors are kept.
+        wanted = None if limit_samples is None else limit_samples + 1
+        X = []
+        found = 0
+        pool = Pool(n_jobs) if n_jobs > 1 else None
+        try:
+            results = pool.imap(extract, chunks) if pool is not None else map(extract, chunks)
+            for X_chunk, _ in results:
+                X.append(X_chunk)
+                found += X_chunk.shape[0]
+                if wanted is not None and found >= wanted:
+                    break
+        finally:
+            if pool is not None:
+                pool.terminate()
+        if not X:
+            X, _ = extract([])
+            return X
+        X = sp.vstack(X, format="csr") if sparse else np.vstack(X)
+        return X[:wanted]
 
     def _balance_data(self, X_a, X_b):
-        max_lenght = min(len(X_a), len(X_b))
+        max_lenght = min(X_a.shape[0], X_b.shape[0])
         X_a = X_a[:max_lenght]
         X_b = X_b[:max_lenght]
         return X_a, X_b
 
+    def _features_of_file(
+        self,
+        filepath,
+        store,
+        check_cache,
+        dump_to_file,
+        undirected,
+        proportional,
+        normalize,
+        limit_samples,
+        n_jobs,
+        sparse,
+    ):
+        if filepath.endswith(".npy"):
+            # Precomputed feature matrix.
+            X = np.load(filepath, mmap_mode="r")
+            return sp.csr_matrix(X) if sparse else X
+        key = store.key(
+            filepath,
+            version=FEATURES_VERSION,
+            undirected=undirected,
+            proportional=proportional,
+            normalize=normalize,
+            sliding_window_length=self._sliding_window_length,
+            limit_samples=limit_samples,
+        )
+        X = store.load(key) if check_cache else None
+        if X is not None:
+            # Stored rows are the same in both formats.
+            if sparse and not sp.issparse(X):
+                X = sp.csr_matrix(X)
+            elif not sparse and sp.issparse(X):
+                X = X.toarray()
+            return X
+        X = self._create_feature_vectors_from_file(
+            filepath,
+            undirected=undirected,
+            proportional=proportional,
+            normalize=normalize,
+            limit_samples=limit_samples,
+            n_jobs=n_jobs,
+            sparse=sparse,
+        )
+        X = _unique_rows(X)
+        if dump_to_file:
+            store.save(key, X)
+        return X
+
     def create_dataset(
         self,
         benign_filepath: str,
@@ -235,9 +438,15 @@ class SQLiGoT(SVC):
         dump_to_file=True,
         check_cache=True,
         save_keyword_append="",
+        cache_dir=None,
+        n_jobs=1,
+        sparse=False,
     ):
         """Create dataset of both sqli and sane queries, using the input paths.
-        If check_cache is true, it tries to load previously computed dataset.
+        Feature matrices are kept in a feature store, addressed by the content of the
+        input file and by the parameters of the extraction: if check_cache is true,
+        previously computed matrices are loaded (memory mapped) instead of being extracted again.
+        Paths ending in .npy are loaded as precomputed feature matrices.
         
         Arguments:
             benign_filepath (str) : path to sane queries
@@ -245,6 +454,7 @@ class SQLiGoT(SVC):
 
         Raises:
             TypeError: arguments are not typed correctly
+            FileNotFoundError: input paths not pointing to any file
 
         Keyword Arguments:
             undirected (bool) : true for undirected graphs (default: (False))
@@ -252,63 +462,191 @@ class SQLiGoT(SVC):
             normalize (bool) : true for normalizing weights of edges (default: (True))
             limit_samples (int) : if not None, how many queries per file to consider (default: (10000))
             balance (bool) : true for balancing the number of sane and sqli queries (default: (True))
-            dump_to_file (bool) : true for storing the computed queries to file (default: (True))
-            check_cache (bool) : enable dump load (default: (True))
-            save_keyword_append (str) : append this string to both paths when saving results (default: (''))
+            dump_to_file (bool) : true for storing the computed features in the feature store (default: (True))
+            check_cache (bool) : enable feature store lookup (default: (True))
+            save_keyword_append (str) : prefix of the default feature store directory (default: (''))
+            cache_dir (str) : feature store directory (default: (save_keyword_append + 'sqligot_features'))
+            n_jobs (int) : number of processes used to extract features (default: (1))
+            sparse (bool) : build X as a scipy CSR matrix (default: (False))
         
         Returns:
-            (numpy ndarray, numpy ndarray) : X and y
+            (numpy ndarray or scipy CSR matrix, numpy ndarray) : X and y
         """
 
         type_check(benign_filepath, str, "benign_path")
+        type_check(sqlia_filepath, str, "sqlia_path")
         type_check(undirected, bool, "undirected")
         type_check(proportional, bool, "proportional")
         type_check(normalize, bool, "normalize")
         type_check(balance, bool, "balance")
         type_check(dump_to_file, bool, "dump_to_file")
+        type_check(check_cache, bool, "check_cache")
         type_check(save_keyword_append, str, "save_keyword_append")
+        type_check(n_jobs, int, "n_jobs")
+        type_check(sparse, bool, "sparse")
+        if limit_samples is not None:
+            type_check(limit_samples, int, "limit_samples")
+        if cache_dir is None:
+            cache_dir = "{}sqligot_features".format(save_keyword_append)
+        type_check(cache_dir, str, "cache_dir")
+        file_exists(benign_filepath)
+        file_exists(sqlia_filepath)
 
-        kind = "undirected" if undirected else "directed"
-        prop = "proportional" if proportional else "unprop"
-        if (
-            check_cache
-            and os.path.isfile(benign_filepath)
-            and os.path.isfile(sqlia_filepath)
-        ):
-            X_benign = np.load(benign_filepath)
-            X_sqlia = np.load(sqlia_filepath)
-            if balance:
-                X_benign, X_sqlia = self._balance_data(X_benign, X_sqlia)
-            X = np.vstack((X_benign, X_sqlia))
-            y = np.ones(len(X_benign) + len(X_sqlia))
-            y[: len(X_benign)] = -1
-            return X, y
-        else:
-            X_benign = self._create_feature_vectors_from_file(
-                benign_filepath,
-                undirected=undirected,
-                proportional=proportional,
-                normalize=normalize,
-                limit_samples=limit_samples,
-            )
-            X_sqlia = self._create_feature_vectors_from_file(
-                sqlia_filepath,
+        store = FeatureStore(cache_dir)
+        X_benign, X_sqlia = [
+            self._features_of_file(
+                filepath,
+                store,
+                check_cache,
+                dump_to_file,
                 undirected=undirected,
                 proportional=proportional,
                 normalize=normalize,
                 limit_samples=limit_samples,
+                n_jobs=n_jobs,
+                sparse=sparse,
             )
-        X_benign = np.unique(X_benign, axis=0)
-        X_sqlia = np.unique(X_sqlia, axis=0)
-        np.save(
-            "{}graph_{}_{}_sane.npy".format(save_keyword_append, kind, prop), X_benign
-        )
-        np.save(
-            "{}graph_{}_{}_sqlia.npy".format(save_keyword_append, kind, prop), X_sqlia
-        )
+            for filepath in (benign_filepath, sqlia_filepath)
+        ]
         if balance:
             X_benign, X_sqlia = self._balance_data(X_benign, X_sqlia)
-        X = np.vstack((X_benign, X_sqlia))
-        y = np.ones(len(X_benign) + len(X_sqlia))
-        y[: len(X_benign)] = -1
+        if sparse:
+            X = sp.vstack((X_benign, X_sqlia), format="csr")
+        else:
+            X = np.vstack((X_benign, X_sqlia))
+        y = np.ones(X_benign.shape[0] + X_sqlia.shape[0])
+        y[: X_benign.shape[0]] = -1
+        if self.verbose:
+            usage = memory_usage(X)
+            print(
+                "[*] Dataset uses {} bytes ({} bytes if dense, density {:.4f})".format(
+                    usage["bytes"], usage["dense_bytes"], usage["density"]
+                )
+            )
         return X, y
+
+    def freeze(self):
+        """Returns an inference-only copy of this trained classifier, see FrozenSQLiGoT.
+
+        Returns:
+            FrozenSQLiGoT : the frozen classifier
+        """
+        return FrozenSQLiGoT(self)
+
+
+def _binary_multiclass_probability(r):
+    """libsvm multiclass_probability for two classes, one problem per element of r,
+    where r is the pairwise probability of the first class.
+    The iterative solution is reproduced step by step, since it stops as soon as
+    it is accurate enough and therefore is not exactly r."""
+    r = np.asarray(r, dtype=np.float64)
+    q = np.empty((len(r), 2, 2))
+    q[:, 0, 0] = (1 - r) * (1 - r)
+    q[:, 0, 1] = q[:, 1, 0] = -(1 - r) * r
+    q[:, 1, 1] = r * r
+    p = np.full((len(r), 2), 0.5)
+    active = np.arange(len(r))
+    for _ in range(100):
+        qa, pa = q[active], p[active]
+        qp = qa[:, :, 0] * pa[:, :1] + qa[:, :, 1] * pa[:, 1:]
+        pqp = pa[:, 0] * qp[:, 0] + pa[:, 1] * qp[:, 1]
+        converged = np.abs(qp - pqp[:, None]).max(axis=1) < 0.005 / 2
+        active, qa, pa, qp, pqp = [
+            v[~converged] for v in (active, qa, pa, qp, pqp)
+        ]
+        if len(active) == 0:
+            break
+        for t in range(2):
+            diff = (-qp[:, t] + pqp) / qa[:, t, t]
+            pa[:, t] += diff
+            pqp = (pqp + diff * (diff * qa[:, t, t] + 2 * qp[:, t])) / (1 + diff) / (1 + diff)
+            qp = (qp + diff[:, None] * qa[:, t, :]) / (1 + diff[:, None])
+            pa /= (1 + diff[:, None])
+        p[active] = pa
+    return p
+
+
+class FrozenSQLiGoT:
+    """Inference-only SQLiGoT for batches of feature vectors.
+    The RBF kernel of a whole batch is computed with a single matrix product
+    against the support vectors, whose norms are precomputed, and the Platt
+    scaling coefficients are applied as libsvm does: probabilities are
+    numerically equal to SQLiGoT.predict_proba."""
+
+    def __init__(self, sqligot: SQLiGoT):
+        """Constructs the frozen classifier.
+
+        Arguments:
+            sqligot (SQLiGoT) : a trained binary SQLiGoT, with rbf kernel and probability estimates
+
+        Raises:
+            TypeError: sqligot is not a SQLiGoT
+            NotFittedError: sqligot is not trained
+            ValueError: sqligot is not a binary rbf classifier with probability estimates
+        """
+        type_check(sqligot, SQLiGoT, "sqligot")
+        check_is_fitted(sqligot)
+        if sqligot.kernel != "rbf":
+            raise ValueError("only rbf kernels are supported")
+        if len(sqligot.classes_) != 2:
+            raise ValueError("only binary classifiers are supported")
+        if np.size(sqligot.probA_) == 0:
+            raise ValueError("classifier trained without probability estimates")
+        support_vectors = sqligot.support_vectors_
+        if sp.issparse(support_vectors):
+            support_vectors = support_vectors.toarray()
+        self._support_vectors = np.ascontiguousarray(support_vectors, dtype=np.float64)
+        self._support_norms = np.einsum(
+            "ij,ij->i", self._support_vectors, self._support_vectors
+        )
+        dual_coef = sqligot.dual_coef_
+        if sp.issparse(dual_coef):
+            dual_coef = dual_coef.toarray()
+        self._dual_coef = np.array(dual_coef[0], dtype=np.float64)
+        self._intercept = float(sqligot.intercept_[0])
+        self._gamma = float(sqligot._gamma)
+        self._prob_a = float(sqligot.probA_[0])
+        self._prob_b = float(sqligot.probB_[0])
+        self.classes_ = np.array(sqligot.classes_)
+
+    def _kernel(self, X):
+        if sp.issparse(X):
+            X = X.tocsr()
+            norms = np.asarray(X.multiply(X).sum(axis=1)).ravel()
+            dots = np.asarray(X @ self._support_vectors.T)
+        else:
+            X = np.asarray(X, dtype=np.float64)
+            norms = np.einsum("ij,ij->i", X, X)
+            dots = X @ self._support_vectors.T
+        distances = norms[:, None] + self._support_norms[None, :] - 2 * dots
+        np.maximum(distances, 0, out=distances)
+        return np.exp(-self._gamma * distances, out=distances)
+
+    def decision_function(self, X):
+        """Distance of the samples from the separating hyperplane, like SVC.decision_function.
+
+        Arguments:
+            X (numpy ndarray or scipy sparse matrix) : feature vectors, one per row
+
+        Returns:
+            numpy ndarray : the decision value of each sample
+        """
+        return self._kernel(X) @ self._dual_coef + self._intercept
+
+    def predict_proba(self, X):
+        """Probability estimates, equal to SQLiGoT.predict_proba.
+
+        Arguments:
+            X (numpy ndarray or scipy sparse matrix) : feature vectors, one per row
+
+        Returns:
+            numpy ndarray : the probability of each class (columns ordered as classes_)
+        """
+        # libsvm works with decision values of opposite sign for binary problems.
+        f = -self.decision_function(X) * self._prob_a + self._prob_b
+        with np.errstate(over="ignore"):
+            r = np.where(
+                f >= 0, np.exp(-f) / (1.0 + np.exp(-f)), 1.0 / (1 + np.exp(f))
+            )
+        r = np.clip(r, 1e-7, 1 - 1e-7)
+        return _binary_multiclass_probability(r)
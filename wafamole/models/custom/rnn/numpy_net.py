@@ -0,0 +1,239 @@
+"""NumPy forward pass of the WAF-Brain network, to run it without TensorFlow.
+
+The weights of a loaded Keras model are exported to a npz archive, together
+with the configuration of each layer. Supported layers are the ones WAF-Brain
+uses: GRU, Dense and Dropout (identity at inference time).
+"""
+import json
+import numpy as np
+from wafamole.utils.check import type_check, file_exists
+
+SUPPORTED_LAYERS = ("GRU", "Dense", "Dropout", "InputLayer")
+
+
+def _sigmoid(x):
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+def _softmax(x):
+    e = np.exp(x - np.max(x, axis=-1, keepdims=True))
+    return e / np.sum(e, axis=-1, keepdims=True)
+
+
+def _activation(name, hard_sigmoid):
+    slope, offset = hard_sigmoid
+    activations = {
+        "linear": lambda x: x,
+        "tanh": np.tanh,
+        "relu": lambda x: np.maximum(x, 0),
+        "sigmoid": _sigmoid,
+        "hard_sigmoid": lambda x: np.clip(slope * x + offset, 0.0, 1.0),
+        "softmax": _softmax,
+    }
+    if name not in activations:
+        raise ValueError("unsupported activation {}".format(name))
+    return activations[name]
+
+
+def _hard_sigmoid_coefficients(keras):
+    """Slope and offset of hard_sigmoid, which changed across Keras versions."""
+    y = np.asarray(keras.activations.hard_sigmoid(np.array([0.0, 1.0], dtype=np.float32)))
+    return float(y[1] - y[0]), float(y[0])
+
+
+def export_model(keras_model, filepath: str = None):
+    """Exports the weights of a loaded Keras model for NumpyNet.
+
+    Arguments:
+        keras_model : the loaded Keras model
+
+    Keyword Arguments:
+        filepath (str) : where to save the npz archive, if not None (default: (None))
+
+    Raises:
+        ValueError: the model contains an unsupported layer
+
+    Returns:
+        NumpyNet : the exported network
+    """
+    import keras
+
+    layers = []
+    arrays = {}
+    for i, layer in enumerate(keras_model.layers):
+        name = type(layer).__name__
+        if name not in SUPPORTED_LAYERS:
+            raise ValueError("unsupported layer {}".format(name))
+        config = layer.get_config()
+        spec = {"class_name": name}
+        if name == "GRU":
+            spec.update(
+                {
+                    k: config[k]
+                    for k in ("units", "activation", "recurrent_activation", "use_bias", "reset_after", "go_backwards", "return_sequences")
+                }
+            )
+        elif name == "Dense":
+            spec.update({k: config[k] for k in ("units", "activation", "use_bias")})
+        for j, weight in enumerate(layer.get_weights()):
+            arrays["{}/{}".format(i, j)] = np.asarray(weight)
+        layers.append(spec)
+
+    slope, offset = _hard_sigmoid_coefficients(keras)
+    net = NumpyNet(layers, arrays, (slope, offset))
+    if filepath is not None:
+        net.save(filepath)
+    return net
+
+
+class NumpyNet(object):
+    """Inference-only network, exposing the predict and evaluate functions of Keras models."""
+
+    def __init__(self, layers: list, arrays: dict, hard_sigmoid: tuple = (0.2, 0.5)):
+        """Constructs a network from its exported layers.
+
+        Arguments:
+            layers (list) : the configuration of each layer
+            arrays (dict) : the weights, keyed by "layer/index"
+
+        Keyword Arguments:
+            hard_sigmoid (tuple) : slope and offset of hard_sigmoid (default: ((0.2, 0.5)))
+        """
+        self._layers = layers
+        self._arrays = arrays
+        self._hard_sigmoid = tuple(hard_sigmoid)
+        self._forward = [
+            self._build_layer(i, spec) for i, spec in enumerate(layers)
+        ]
+
+    @classmethod
+    def load(cls, filepath: str):
+        """Loads a network exported by export_model.
+
+        Arguments:
+            filepath (str) : path of the npz archive
+
+        Raises:
+            TypeError: filepath is not string
+            FileNotFoundError: filepath not pointing to any file
+
+        Returns:
+            NumpyNet : the network
+        """
+        type_check(filepath, str, "filepath")
+        file_exists(filepath)
+        with np.load(filepath) as archive:
+            layers = json.loads(str(archive["layers"]))
+            hard_sigmoid = tuple(archive["hard_sigmoid"])
+            arrays = {k: archive[k] for k in archive.files if "/" in k}
+        return cls(layers, arrays, hard_sigmoid)
+
+    def save(self, filepath: str):
+        """Saves the network in a npz archive.
+
+        Arguments:
+            filepath (str) : where to save the network
+        """
+        type_check(filepath, str, "filepath")
+        with open(filepath, "wb") as f:
+            np.savez(
+                f,
+                layers=np.array(json.dumps(self._layers)),
+                hard_sigmoid=np.array(self._hard_sigmoid),
+                **self._arrays
+            )
+
+    def _weights(self, i):
+        weights = []
+        while "{}/{}".format(i, len(weights)) in self._arrays:
+            weights.append(self._arrays["{}/{}".format(i, len(weights))])
+        return weights
+
+    def _build_layer(self, i, spec):
+        name = spec["class_name"]
+        if name in ("Dropout", "InputLayer"):
+            return lambda x: x
+        weights = self._weights(i)
+        activation = _activation(spec["activation"], self._hard_sigmoid)
+        if name == "Dense":
+            kernel = weights[0]
+            bias = weights[1] if spec["use_bias"] else 0.0
+            return lambda x: activation(x @ kernel + bias)
+        if spec["return_sequences"] or spec["go_backwards"]:
+            raise ValueError("unsupported GRU configuration")
+        recurrent_activation = _activation(spec["recurrent_activation"], self._hard_sigmoid)
+        return self._gru(spec, weights, activation, recurrent_activation)
+
+    def _gru(self, spec, weights, activation, recurrent_activation):
+        units = spec["units"]
+        kernel, recurrent_kernel = weights[0], weights[1]
+        bias = weights[2] if spec["use_bias"] else np.zeros((2, 3 * units) if spec["reset_after"] else 3 * units)
+        input_bias, recurrent_bias = (bias[0], bias[1]) if spec["reset_after"] else (bias, np.zeros(3 * units))
+        recurrent_zr = recurrent_kernel[:, : 2 * units]
+        recurrent_h = recurrent_kernel[:, 2 * units :]
+
+        def forward(x):
+            # Input projections of every timestep at once: (batch, time, 3 * units)
+            projections = x @ kernel + input_bias
+            h = np.zeros((x.shape[0], units), dtype=projections.dtype)
+            for t in range(x.shape[1]):
+                x_zr = projections[:, t, : 2 * units]
+                x_h = projections[:, t, 2 * units :]
+                h_zr = h @ recurrent_zr + recurrent_bias[: 2 * units]
+                z = recurrent_activation(x_zr[:, :units] + h_zr[:, :units])
+                r = recurrent_activation(x_zr[:, units:] + h_zr[:, units:])
+                if spec["reset_after"]:
+                    h_h = r * (h @ recurrent_h + recurrent_bias[2 * units :])
+                else:
+                    h_h = (r * h) @ recurrent_h
+                h = z * h + (1 - z) * activation(x_h + h_h)
+            return h
+
+        return forward
+
+    def predict(self, x, batch_size: int = None, verbose: int = 0):
+        """Runs the forward pass.
+
+        Arguments:
+            x (numpy ndarray) : the inputs
+
+        Keyword Arguments:
+            batch_size (int) : number of inputs processed at once, all if None (default: (None))
+            verbose (int) : unused, for compatibility with Keras (default: (0))
+
+        Returns:
+            numpy ndarray : the outputs
+        """
+        x = np.asarray(x, dtype=np.float32)
+        if batch_size is None or batch_size >= len(x):
+            batches = [x]
+        else:
+            batches = [x[i : i + batch_size] for i in range(0, len(x), batch_size)]
+        outputs = []
+        for y in batches:
+            for forward in self._forward:
+                y = forward(y)
+            outputs.append(y)
+        return np.concatenate(outputs)
+
+    def evaluate(self, x, y, batch_size: int = None, verbose: int = 0, epsilon: float = 1e-7):
+        """Computes the categorical crossentropy and accuracy of the network, as Keras does.
+
+        Arguments:
+            x (numpy ndarray) : the inputs
+            y (numpy ndarray) : the one-hot expected outputs
+
+        Keyword Arguments:
+            batch_size (int) : number of inputs processed at once, all if None (default: (None))
+            verbose (int) : unused, for compatibility with Keras (default: (0))
+            epsilon (float) : clipping of the predicted probabilities (default: (1e-7))
+
+        Returns:
+            list : loss and accuracy
+        """
+        y_pred = self.predict(x, batch_size)
+        targets = np.argmax(y, axis=1)
+        accuracy = np.mean(np.argmax(y_pred, axis=1) == targets)
+        y_pred = y_pred / np.sum(y_pred, axis=1, keepdims=True)
+        likelihoods = np.clip(y_pred[np.arange(len(targets)), targets], epsilon, 1 - epsilon)
+        return [float(np.mean(-np.log(likelihoods))), float(accuracy)]
@@ -3,7 +3,10 @@
 
 import time
 import string
+from collections import OrderedDict
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from wafamole.payloadfuzzer.fuzz_utils import edit_span
 
 X_FEATURES = 5
 BATCH_SIZE = 100000
@@ -12,6 +15,12 @@ TRAIN_PERC = 0.7
 DEV_PERC = 0.25
 TEST_PERC = 0.05
 VOCABULARY = string.printable + '\xa0'
+PAD_INDEX = 100
+
+# Vocabulary index of each latin-1 code point, -1 if not in the vocabulary
+_CHAR_INDEX = np.full(256, -1, dtype=np.intp)
+for _index, _char in reversed(list(enumerate(VOCABULARY))):
+    _CHAR_INDEX[ord(_char)] = _index
 
 
 def row_parse(row):
@@ -95,19 +104,256 @@ def feature_vector(sample):
     return x_demo, y_demo
 
 
+def _window_indices(sample):
+    """Vocabulary indices of the windows of sample: 5 input characters and the expected one.
+
+    Arguments:
+        sample (str) : the payload
+
+    Raises:
+        ValueError: sample contains a character not in VOCABULARY
+
+    Returns:
+        numpy ndarray : the indices, of shape (len, 6)
+    """
+    codes = np.fromiter(map(ord, sample), dtype=np.intp, count=len(sample))
+    indices = _CHAR_INDEX[np.minimum(codes, 255)]
+    unknown = (indices < 0) | (codes > 255)
+    if unknown.any():
+        raise ValueError(
+            "{!r} not in vocabulary".format(sample[int(np.argmax(unknown))])
+        )
+    if not len(sample):
+        return np.empty((0, X_FEATURES + 1), dtype=np.intp)
+
+    padded = np.full(len(sample) + X_FEATURES, PAD_INDEX, dtype=np.intp)
+    padded[X_FEATURES - 1 : -1] = indices
+    return sliding_window_view(padded, X_FEATURES + 1)
+
+
+def _one_hot(windows):
+    rows = np.arange(len(windows))
+    x = np.zeros((len(windows), X_FEATURES, 101))
+    x[rows[:, None], np.arange(X_FEATURES), windows[:, :X_FEATURES]] = 1
+    y = np.zeros((len(windows), 101))
+    y[rows, windows[:, X_FEATURES]] = 1
+    return x, y
+
+
+def encode_payload(sample):
+    """Vectorized equivalent of feature_vector.
+    Each character is one-hot encoded together with the 4 preceding ones,
+    and the following character is the expected output.
+
+    Arguments:
+        sample (str) : the payload
+
+    Raises:
+        ValueError: sample contains a character not in VOCABULARY
+
+    Returns:
+        (numpy ndarray, numpy ndarray) : inputs of shape (len, 5, 101) and outputs of shape (len, 101)
+    """
+    return _one_hot(_window_indices(sample))
+
+
+def encode_payloads(payloads):
+    """Encodes many payloads into a single batch of windows.
+
+    Arguments:
+        payloads (list) : the payloads
+
+    Raises:
+        ValueError: a payload contains a character not in VOCABULARY
+
+    Returns:
+        (numpy ndarray, numpy ndarray, numpy ndarray) : inputs and outputs of all the windows,
+            and the offsets of the windows of each payload, of length len(payloads) + 1
+    """
+    windows = [np.empty((0, X_FEATURES + 1), dtype=np.intp)]
+    windows.extend(_window_indices(payload) for payload in payloads)
+    offsets = np.cumsum([len(w) for w in windows])
+    x, y = _one_hot(np.concatenate(windows))
+    return x, y, offsets
+
+
+def _window_terms(model, windows, epsilon):
+    """Accuracy and categorical crossentropy of each window, from a single predict call."""
+    if not len(windows):
+        return np.empty(0, dtype=bool), np.empty(0)
+    x, _ = _one_hot(windows)
+    targets = windows[:, X_FEATURES]
+    y_pred = np.asarray(model.predict(x, batch_size=BATCH_SIZE, verbose=0))
+    accuracies = np.argmax(y_pred, axis=1) == targets
+    y_pred = y_pred / np.sum(y_pred, axis=1, keepdims=True)
+    likelihoods = np.clip(y_pred[np.arange(len(targets)), targets], epsilon, 1 - epsilon)
+    return accuracies, -np.log(likelihoods).astype(np.float64)
+
+
+def score_payloads(model, payloads, epsilon=1e-7):
+    """Scores many payloads with a single inference call.
+    Per-window accuracies and categorical crossentropies are averaged over
+    the windows of each payload, as model.evaluate does for a single payload.
+
+    Arguments:
+        model : the keras model, or any object exposing the same predict
+        payloads (list) : the payloads
+
+    Keyword Arguments:
+        epsilon (float) : clipping of the predicted probabilities (default: (1e-7))
+
+    Raises:
+        ValueError: a payload is empty or contains a character not in VOCABULARY
+
+    Returns:
+        (numpy ndarray, numpy ndarray) : the score (accuracy) and the loss of each payload
+    """
+    windows = [np.empty((0, X_FEATURES + 1), dtype=np.intp)]
+    windows.extend(_window_indices(payload) for payload in payloads)
+    offsets = np.cumsum([len(w) for w in windows])
+    lengths = np.diff(offsets)
+    if (lengths == 0).any():
+        raise ValueError("can not score an empty payload")
+    if not len(payloads):
+        return np.empty(0), np.empty(0)
+
+    accuracies, losses = _window_terms(model, np.concatenate(windows), epsilon)
+    scores = np.add.reduceat(accuracies.astype(np.float64), offsets[:-1]) / lengths
+    losses = np.add.reduceat(losses, offsets[:-1]) / lengths
+    return scores, losses
+
+
+def character_weights(model, payload, epsilon=1e-7):
+    """Influence of each character of payload, from a single inference call.
+    The window of a character is scored as model.evaluate would score it alone.
+
+    Arguments:
+        model : the keras model, or any object exposing the same predict
+        payload (str) : the payload
+
+    Keyword Arguments:
+        epsilon (float) : clipping of the predicted probabilities (default: (1e-7))
+
+    Raises:
+        ValueError: payload contains a character not in VOCABULARY
+
+    Returns:
+        (numpy ndarray, numpy ndarray) : accuracy and loss of each character
+    """
+    accuracies, losses = _window_terms(model, _window_indices(payload), epsilon)
+    return accuracies.astype(np.float64), losses
+
+
+class IncrementalScorer(object):
+    """Scores payloads reusing the window terms of a previously scored parent.
+    A window covers 5 characters and the following one, so a child only needs
+    the windows overlapping its edit span: the others are taken from the parent.
+    """
+
+    def __init__(self, model, cache_size=4096, epsilon=1e-7):
+        """Constructs a scorer.
+
+        Arguments:
+            model : the keras model, or any object exposing the same predict
+
+        Keyword Arguments:
+            cache_size (int) : number of payloads whose window terms are kept (default: (4096))
+            epsilon (float) : clipping of the predicted probabilities (default: (1e-7))
+        """
+        self._model = model
+        self._cache_size = cache_size
+        self._epsilon = epsilon
+        self._cache = OrderedDict()
+        self.computed_windows = 0
+
+    def _cached(self, payload):
+        terms = self._cache.get(payload)
+        if terms is not None:
+            self._cache.move_to_end(payload)
+        return terms
+
+    def _store(self, payload, terms):
+        self._cache[payload] = terms
+        self._cache.move_to_end(payload)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def score(self, payloads, parent=None):
+        """Scores many payloads with a single inference call.
+
+        Arguments:
+            payloads (list) : the payloads
+
+        Keyword Arguments:
+            parent (str) : the payload the others were mutated from (default: (None))
+
+        Raises:
+            ValueError: a payload is empty or contains a character not in VOCABULARY
+
+        Returns:
+            (numpy ndarray, numpy ndarray) : the score (accuracy) and the loss of each payload
+        """
+        if any(not payload for payload in payloads):
+            raise ValueError("can not score an empty payload")
+        parent_terms = None
+        if parent:
+            if self._cached(parent) is None:
+                self.score([parent])
+            parent_terms = self._cached(parent)
+
+        # Window terms of each payload, and windows to compute for the others
+        terms = {}
+        plans = {}
+        for payload in payloads:
+            if payload in terms or payload in plans:
+                continue
+            terms[payload] = self._cached(payload)
+            if terms[payload] is not None:
+                continue
+            windows = _window_indices(payload)
+            start, end = 0, len(payload)
+            if parent_terms is not None:
+                prefix, suffix = edit_span(parent, payload)
+                start = max(0, prefix - 1)
+                end = min(len(payload), len(payload) - suffix + X_FEATURES - 1)
+            plans[payload] = (start, end, windows[start:end])
+
+        computed = [np.empty((0, X_FEATURES + 1), dtype=np.intp)]
+        computed.extend(plan[2] for plan in plans.values())
+        offsets = np.cumsum([len(w) for w in computed])
+        accuracies, losses = _window_terms(
+            self._model, np.concatenate(computed), self._epsilon
+        )
+        self.computed_windows += int(offsets[-1])
+
+        for (payload, (start, end, _)), lo, hi in zip(
+            plans.items(), offsets[:-1], offsets[1:]
+        ):
+            computed_terms = (accuracies[lo:hi], losses[lo:hi])
+            if parent_terms is not None:
+                shift = len(parent) - len(payload)
+                computed_terms = tuple(
+                    np.concatenate((cached[:start], new, cached[end + shift :]))
+                    for cached, new in zip(parent_terms, computed_terms)
+                )
+            terms[payload] = computed_terms
+            self._store(payload, computed_terms)
+
+        scores, losses = np.empty(len(payloads)), np.empty(len(payloads))
+        for i, payload in enumerate(payloads):
+            payload_accuracies, payload_losses = terms[payload]
+            scores[i] = np.mean(payload_accuracies)
+            losses[i] = np.mean(payload_losses)
+        return scores, losses
+
+
 def process_payload(model, param_name, payloads, check_weights=False):
     try:
         # Snapshot for time
         before_time = time.time()
-        elems = [reduce_dimension(row_parse(payloads[0]), X_FEATURES)]
-        x_demo = []
-        y_demo = []
-
-        # Passing a value
-        for elem in elems:
-            split_row(x_demo, y_demo, elem)
+        x_demo, y_demo = encode_payload(payloads[0])
 
-        nn_score = [model.evaluate(np.array(x_demo), np.array(y_demo), verbose=0)]
+        nn_score = [model.evaluate(x_demo, y_demo, verbose=0)]
         nn_score = nn_score[0][1]
 
         # Inference time
@@ -118,30 +364,10 @@ def process_payload(model, param_name, payloads, check_weights=False):
         # ---------------------------------------------------------------------
         weights = []
         if check_weights:
-
-            predict_chars = [
-                transform_predict(y_predict)
-                for y_predict in model.predict(np.array(x_demo))
-            ]
-            predict_texts = [[]]
-
-            for predict_char in predict_chars:
-                build_text(predict_char, predict_texts)
-
-            odor = [
-                [
-                    payloads[0][i],
-                    model.evaluate(
-                        np.expand_dims(x_demo[i], axis=0),
-                        np.expand_dims(y_demo[i], axis=0),
-                        batch_size=BATCH_SIZE,
-                        verbose=0,
-                    ),
-                ]
-                for i in range(len(payloads[0]))
-            ]
+            accuracies, losses = character_weights(model, payloads[0])
             weights = [
-                {"letter": o[0], "weight": o[1][0], "szie": o[1][1]} for o in odor
+                {"letter": letter, "weight": float(loss), "szie": float(accuracy)}
+                for letter, loss, accuracy in zip(payloads[0], losses, accuracies)
             ]
 
         return {
@@ -158,4 +384,4 @@ def process_payload(model, param_name, payloads, check_weights=False):
         # print("Exception here")
 
 
-__all__ = ("process_payload",)
+__all__ = ("process_payload", "score_payloads", "character_weights", "IncrementalScorer")
@@ -1,4 +1,11 @@
-from wafamole.models.custom.rnn.waf_brain import process_payload
+import numpy as np
+from wafamole.models.custom.rnn.waf_brain import (
+    IncrementalScorer,
+    character_weights,
+    process_payload,
+    score_payloads,
+)
+from wafamole.models.custom.rnn.numpy_net import NumpyNet, export_model
 from wafamole.models import KerasModelWrapper
 from wafamole.utils.check import type_check, file_exists
 
@@ -6,21 +13,46 @@ from wafamole.utils.check import type_check, file_exists
 class WafBrainWrapper(KerasModelWrapper):
     """WafBrain wrapper"""
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, incremental: bool = False, engine: str = None):
         """Constructs model by loading pretrained net.
         
         Arguments:
-            filepath (str) : the path to the pretrained h5 net
+            filepath (str) : the path to the pretrained h5 net, or to its npz export
+
+        Keyword Arguments:
+            incremental (bool) : rescore mutated payloads only on the windows touched by the mutation (default: (False))
+            engine (str) : "keras", or "numpy" to run the net without TensorFlow, inferred from filepath if None (default: (None))
 
         Raises:
         TypeError: filepath not  string
         FileNotFoundError: filepath not pointing to anything
         NotKerasModelError: filepath not pointing to h5 keras model
+        ValueError: unknown engine, or a npz export with the keras engine
         """
         type_check(filepath, str, "filepath")
         file_exists(filepath)
-        self.load(filepath)
+        type_check(incremental, bool, "incremental")
+        is_export = filepath.endswith(".npz")
+        if engine is None:
+            engine = "numpy" if is_export else "keras"
+        if engine not in ("keras", "numpy"):
+            raise ValueError("unknown engine {}".format(engine))
+        if is_export and engine == "keras":
+            raise ValueError("npz exports can only run on the numpy engine")
+
+        if is_export:
+            self._keras_classifier = NumpyNet.load(filepath)
+        else:
+            self.load(filepath)
+            if engine == "numpy":
+                self._keras_classifier = export_model(self._keras_classifier)
+        self._engine = engine
         super(WafBrainWrapper, self).__init__(self._keras_classifier)
+        self._scorer = IncrementalScorer(self._keras_classifier) if incremental else None
+
+    @property
+    def engine(self):
+        return self._engine
 
     def extract_features(self, value: str):
         """No feature extraction
@@ -52,3 +84,48 @@ class WafBrainWrapper(KerasModelWrapper):
         type_check(value, str, "value")
         malicious = process_payload(self._keras_classifier, "", [value])["score"]
         return malicious
+
+    def classify_many(self, values: list, parent: str = None):
+        """Produce probabilities of being sql injection, with a single inference call.
+        With incremental scoring, only the windows of each query that differ from parent are computed.
+
+        Arguments:
+            values (list) : input queries
+
+        Keyword Arguments:
+            parent (str) : the query all the inputs were mutated from (default: (None))
+
+        Raises:
+        TypeError: values is not a list of strings
+
+        Returns:
+           list : probability of being a sql injection, for each query
+        """
+        type_check(values, list, "values")
+        for value in values:
+            type_check(value, str, "value")
+        if self._scorer is not None:
+            scores, _ = self._scorer.score(values, parent)
+        else:
+            scores, _ = score_payloads(self._keras_classifier, values)
+        return scores.tolist()
+
+    def attribution(self, value: str):
+        """Computes how much each character makes the query look like an injection,
+        from a single inference call. Entry i is the likelihood the net assigns to
+        the character following position i, given the 5 characters ending at i, as in
+        the check_weights output of WAF-Brain. The net is trained on injections,
+        so well predicted characters are the ones driving the score up.
+
+        Arguments:
+            value (str) : input query
+
+        Raises:
+        TypeError: value is not string
+
+        Returns:
+           numpy ndarray : likelihood of each character of the query, in [0, 1]
+        """
+        type_check(value, str, "value")
+        _, losses = character_weights(self._keras_classifier, value)
+        return np.exp(-losses)
@@ -1,5 +1,11 @@
+import numpy as np
+from sklearn.linear_model import LogisticRegression
 from wafamole.tokenizer import Tokenizer
 from wafamole.models import SklearnModelWrapper
+from wafamole.exceptions.models_exceptions import (
+    ModelNotLoadedError,
+    SklearnInternalError,
+)
 from wafamole.utils.check import type_check
 
 
@@ -12,3 +18,68 @@ class TokenClassifierWrapper(SklearnModelWrapper):
 
     def classify(self, value):
         return super(TokenClassifierWrapper, self).classify(value)[0, 1]
+
+    def classify_many(self, values: list, parent: str = None):
+        """Computes the probability of being a sql injection of many queries,
+        with a single predict_proba call on the histograms not already in cache.
+
+        Arguments:
+            values (list) : the input queries
+
+        Keyword Arguments:
+            parent (str) : unused (default: (None))
+
+        Raises:
+            TypeError: values is not a list of strings
+            ModelNotLoadedError: calling function without having loaded or passed model as arg
+            SklearnInternalError: internal sklearn exception has been thrown
+
+        Returns:
+            list : probability of being a sql injection of each query.
+        """
+        if self._sklearn_classifier is None:
+            raise ModelNotLoadedError()
+        type_check(values, list, "values")
+        if not values:
+            return []
+        X = np.array([self.extract_features(value) for value in values])
+        try:
+            return self._predict_proba(X)[:, 1].tolist()
+        except Exception as e:
+            raise SklearnInternalError("Internal sklearn error.") from e
+
+    def feature_gradient(self, value: str):
+        """Estimates the gradient of the probability of being sql injection
+        with respect to the histogram of tokens of the query.
+        It is exact for logistic regressions, and computed with central finite
+        differences of one token otherwise, with a single predict_proba call.
+
+        Arguments:
+            value (str) : input query
+
+        Raises:
+            TypeError: value is not string
+            ModelNotLoadedError: calling function without having loaded or passed model as arg
+            SklearnInternalError: internal sklearn exception has been thrown
+
+        Returns:
+            numpy ndarray : the gradient, one entry for each token type
+        """
+        if self._sklearn_classifier is None:
+            raise ModelNotLoadedError()
+        features = self.extract_features(value).astype(float)
+        classifier = self._sklearn_classifier
+        if isinstance(classifier, LogisticRegression) and classifier.coef_.shape[0] == 1:
+            p = self.classify(value)
+            return p * (1 - p) * classifier.coef_[0]
+
+        steps = np.eye(len(features))
+        # Histograms are never negative: backward steps stop at zero
+        backward = np.minimum(steps, features[:, None])
+        X = np.vstack([features + steps, features - backward])
+        try:
+            probabilities = classifier.predict_proba(X)[:, 1]
+        except Exception as e:
+            raise SklearnInternalError("Internal sklearn error.") from e
+        n = len(features)
+        return (probabilities[:n] - probabilities[n:]) / (1 + backward.diagonal())
@@ -0,0 +1,332 @@
+"""Model of a WAF reached over HTTP, e.g. an appliance or a reverse proxy.
+
+Payloads are sent by an asyncio HTTP/1.1 client running in a background event
+loop, so that the synchronous Model interface can score a whole round
+concurrently. Connections are kept alive and reused across rounds, with a
+limit on concurrent requests, an optional rate limit, timeouts and retries.
+A response is mapped to confidence 1.0 if it looks blocked (status code,
+header or body pattern), 0.0 otherwise.
+"""
+import asyncio
+import json
+import re
+import ssl
+import threading
+import time
+from urllib.parse import urlsplit, urlencode, quote
+from wafamole.models import Model
+from wafamole.utils.check import type_check
+
+# Where payloads can be injected: query string, urlencoded or JSON body, header, cookie
+LOCATIONS = ("query", "urlencoded", "json", "header", "cookie")
+
+_CONTENT_TYPES = {
+    "urlencoded": "application/x-www-form-urlencoded",
+    "json": "application/json",
+}
+
+# Responses worth retrying, as the WAF did not judge the payload
+RETRY_STATUS = (429, 502, 503, 504)
+
+
+class _Response(object):
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("connection closed by the server")
+    version, status = status_line.decode("latin-1").split(None, 2)[:2]
+    status = int(status)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                # Trailers, up to the empty line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    elif status in (204, 304) or status < 200:
+        body = b""
+    else:
+        # The body ends with the connection
+        body = await reader.read()
+        keep_alive = False
+    return _Response(status, headers, body), keep_alive
+
+
+class HttpWafModel(Model):
+    """WAF evaluated by sending payloads to a protected web application."""
+
+    def __init__(
+        self,
+        url: str,
+        location: str = "query",
+        parameter: str = "q",
+        headers: dict = None,
+        blocked_status: tuple = (403,),
+        blocked_header: tuple = None,
+        blocked_body: str = None,
+        concurrency: int = 8,
+        rate: float = None,
+        retries: int = 2,
+        timeout: float = 10.0,
+    ):
+        """Starts the event loop of the client. Connections are opened on demand.
+
+        Arguments:
+            url (str) : the URL payloads are sent to, http or https
+
+        Keyword Arguments:
+            location (str) : where payloads are injected, one of LOCATIONS (default: ("query"))
+            parameter (str) : name of the parameter, header or cookie holding the payload (default: ("q"))
+            headers (dict) : additional headers of every request (default: (None))
+            blocked_status (tuple) : status codes of blocked requests (default: ((403,)))
+            blocked_header (tuple) : name and regular expression of a header marking blocked requests (default: (None))
+            blocked_body (str) : regular expression of the body of blocked responses (default: (None))
+            concurrency (int) : maximum number of requests in flight, and of open connections (default: (8))
+            rate (float) : maximum number of requests per second, no limit if None (default: (None))
+            retries (int) : attempts after a connection error, a timeout or a status in RETRY_STATUS (default: (2))
+            timeout (float) : seconds to wait for each response (default: (10.0))
+
+        Raises:
+            TypeError: arguments are mistyped
+            ValueError: unknown location, url is not http(s), blocked_header is not a pair,
+                or concurrency or rate are not positive
+        """
+        type_check(url, str, "url")
+        type_check(location, str, "location")
+        type_check(parameter, str, "parameter")
+        if headers is not None:
+            type_check(headers, dict, "headers")
+        type_check(blocked_status, tuple, "blocked_status")
+        if blocked_header is not None:
+            type_check(blocked_header, tuple, "blocked_header")
+            if len(blocked_header) != 2:
+                raise ValueError("blocked_header must be a (name, regular expression) pair")
+        if blocked_body is not None:
+            type_check(blocked_body, str, "blocked_body")
+        type_check(concurrency, int, "concurrency")
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        if rate is not None:
+            type_check(rate, float, "rate")
+            if rate <= 0:
+                raise ValueError("rate must be positive")
+        type_check(retries, int, "retries")
+        type_check(timeout, float, "timeout")
+        if location not in LOCATIONS:
+            raise ValueError("location must be one of {}".format(", ".join(LOCATIONS)))
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError("{} is not a http(s) URL".format(url))
+
+        self._location = location
+        self._parameter = parameter
+        self._blocked_status = set(blocked_status)
+        self._blocked_header = None
+        if blocked_header is not None:
+            self._blocked_header = (blocked_header[0].lower(), re.compile(blocked_header[1]))
+        self._blocked_body = re.compile(blocked_body.encode()) if blocked_body is not None else None
+        self._concurrency = concurrency
+        self._interval = 1.0 / rate if rate is not None else 0.0
+        self._retries = retries
+        self._timeout = timeout
+
+        self._host = parts.hostname
+        self._ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self._port = parts.port or (443 if self._ssl else 80)
+        self._path = parts.path or "/"
+        if parts.query:
+            self._path += "?" + parts.query
+        # Request template, only the payload changes across requests
+        self._method = "POST" if location in _CONTENT_TYPES else "GET"
+        self._headers = {
+            "Host": parts.netloc,
+            "User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64; rv:47.0) Gecko/20100101 Firefox/47.0",
+            "Accept": "*/*",
+            "Connection": "keep-alive",
+        }
+        if location in _CONTENT_TYPES:
+            self._headers["Content-Type"] = _CONTENT_TYPES[location]
+        self._headers.update(headers or {})
+
+        self._stats = {"requests": 0, "retries": 0, "connections": 0}
+        self._idle = []
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._run(self._setup())
+
+    @property
+    def stats(self):
+        """Number of requests sent, of retries, and of connections opened."""
+        return dict(self._stats)
+
+    async def _setup(self):
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._rate_lock = asyncio.Lock()
+        self._next_send = 0.0
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _encode(self, value):
+        """Bytes of the request carrying value."""
+        path = self._path
+        headers = self._headers
+        body = b""
+        if self._location == "query":
+            path += ("&" if "?" in path else "?") + urlencode({self._parameter: value})
+        elif self._location == "urlencoded":
+            body = urlencode({self._parameter: value}).encode()
+        elif self._location == "json":
+            body = json.dumps({self._parameter: value}).encode()
+        elif self._location == "header":
+            # Line breaks would end the header
+            headers = {**headers, self._parameter: value.replace("\r", "%0D").replace("\n", "%0A")}
+        else:
+            headers = {**headers, "Cookie": "{}={}".format(self._parameter, quote(value))}
+        if self._method == "POST":
+            headers = {**headers, "Content-Length": str(len(body))}
+        lines = ["{} {} HTTP/1.1".format(self._method, path)]
+        lines.extend("{}: {}".format(name, header) for name, header in headers.items())
+        return "\r\n".join(lines).encode() + b"\r\n\r\n" + body
+
+    async def _connection(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        self._stats["connections"] += 1
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl)
+
+    async def _throttle(self):
+        if not self._interval:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_send - now
+            self._next_send = max(now, self._next_send) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _send(self, request):
+        reader, writer = await self._connection()
+        try:
+            writer.write(request)
+            await writer.drain()
+            response, keep_alive = await _read_response(reader)
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+    async def _request(self, value):
+        request = self._encode(value)
+        async with self._semaphore:
+            for attempt in range(self._retries + 1):
+                if attempt:
+                    self._stats["retries"] += 1
+                    await asyncio.sleep(0.05 * 2 ** (attempt - 1))
+                await self._throttle()
+                self._stats["requests"] += 1
+                try:
+                    response = await asyncio.wait_for(self._send(request), self._timeout)
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError):
+                    if attempt == self._retries:
+                        raise
+                    continue
+                if response.status not in RETRY_STATUS or attempt == self._retries:
+                    return response
+
+    def confidence(self, response):
+        """Maps a response to the confidence of the WAF that the payload is malicious.
+
+        Arguments:
+            response : the response, with status, headers (lowercase names) and body (bytes)
+
+        Returns:
+            float : 1.0 if the response matches a blocked condition, 0.0 otherwise
+        """
+        if response.status in self._blocked_status:
+            return 1.0
+        if self._blocked_header is not None:
+            name, pattern = self._blocked_header
+            if name in response.headers and pattern.search(response.headers[name]):
+                return 1.0
+        if self._blocked_body is not None and self._blocked_body.search(response.body):
+            return 1.0
+        return 0.0
+
+    async def _classify_all(self, values):
+        responses = await asyncio.gather(*[self._request(value) for value in values])
+        return [self.confidence(response) for response in responses]
+
+    def extract_features(self, value: str):
+        return value
+
+    def classify(self, value: str):
+        return self.classify_many([value])[0]
+
+    def classify_many(self, values: list, parent: str = None):
+        """Sends all the payloads concurrently, within the concurrency and rate limits.
+
+        Arguments:
+            values (list) : the payloads
+
+        Keyword Arguments:
+            parent (str) : unused (default: (None))
+
+        Raises:
+            TypeError: values is not list
+            OSError: a payload could not be sent after all the retries
+            asyncio.TimeoutError: a response did not arrive in time after all the retries
+
+        Returns:
+            list : the confidence of the WAF for each payload
+        """
+        type_check(values, list, "values")
+        return self._run(self._classify_all(values))
+
+    async def _close_connections(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    def close(self):
+        """Closes the connections and stops the event loop."""
+        self._run(self._close_connections())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
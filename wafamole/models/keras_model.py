@@ -11,9 +11,13 @@ from wafamole.exceptions.models_exceptions import (
 )
 from wafamole.utils.check import type_check, file_exists
 
-with redirect_stderr(open(os.devnull, "w")):
-    os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-    import keras
+
+def _import_keras():
+    """Imports keras on first use, so that wrappers that do not need it never load TensorFlow."""
+    with redirect_stderr(open(os.devnull, "w")):
+        os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
+        import keras
+    return keras
 
 
 class KerasModelWrapper(Model):
@@ -82,6 +86,7 @@ class KerasModelWrapper(Model):
         type_check(filepath, str, "filepath")
         file_exists(filepath)
 
+        keras = _import_keras()
         try:
             self._keras_classifier = keras.models.load_model(filepath)
         except Exception as e:
@@ -32,3 +32,42 @@ class Model(metaclass=abc.ABCMeta):
             float : the confidence of the malicious class.
         """
         raise NotImplementedError("classify not implemented in abstract class")
+
+    def classify_many(self, values: list, parent: object = None):
+        """It returns the probability of belonging to the malicious class for each input value.
+        By default it calls classify on each value: override it to score all the values at once.
+
+        Arguments:
+            values (list) : Input values
+
+        Keyword Arguments:
+            parent (object) : the value all the inputs were mutated from, a hint that wrappers may use to reuse work (default: (None))
+
+        Returns:
+            list : the confidence of the malicious class, one for each value.
+        """
+        return [self.classify(v) for v in values]
+
+    def attribution(self, value: object):
+        """It returns the influence of each character of the input value on the confidence.
+        Wrappers of character-level models override it to guide the mutations of the engine.
+
+        Arguments:
+            value (object) : Input value
+
+        Returns:
+            numpy ndarray : non-negative influence of each character, or None if not supported.
+        """
+        return None
+
+    def feature_gradient(self, value: object):
+        """It returns the gradient of the confidence with respect to the features of the input value.
+        Wrappers of models with low-dimensional features override it to guide the choice of the mutations of the engine.
+
+        Arguments:
+            value (object) : Input value
+
+        Returns:
+            numpy ndarray : the gradient, shaped as the output of extract_features, or None if not supported.
+        """
+        return None
@@ -6,14 +6,54 @@ from ModSecurity import RulesSet
 from ModSecurity import Transaction
 from ModSecurity import LogProperty
 
+import numpy as np
+
 from wafamole.models import Model
 
+import json
 import os
 from pathlib import Path
 import re
-from urllib.parse import urlparse, urlencode
+import time
+from functools import lru_cache
+from urllib.parse import urlparse, urlencode, quote, quote_plus
 from enum import Enum
 
+# Where payloads can be injected: query string, urlencoded or JSON body, header, cookie
+LOCATIONS = ("query", "urlencoded", "json", "header", "cookie")
+
+_CONTENT_TYPES = {
+    "urlencoded": "application/x-www-form-urlencoded",
+    "json": "application/json",
+}
+
+# Body chunks of each argument
+_BODY_ENCODERS = {
+    "urlencoded": lambda arguments: [
+        f"{'&' if i else ''}{quote_plus(name)}={quote_plus(value)}" for i, (name, value) in enumerate(arguments.items())
+    ],
+    "json": lambda arguments: [
+        f"{', ' if i else '{'}{json.dumps(name)}: {json.dumps(value)}" for i, (name, value) in enumerate(arguments.items())
+    ] + ["}"],
+}
+
+# CRS anomaly evaluation and reporting rules (949xxx, 959xxx, 980xxx), matching the total
+# anomaly score (TX:ANOMALY_SCORE) of the request rather than a payload
+_ANOMALY_EVALUATION = (949, 959, 980)
+
+# Inbound anomaly score blocking a request, unless set in crs-setup.conf
+_DEFAULT_ANOMALY_THRESHOLD = 5
+
+# Steps of a transaction timed by instrument
+_STEPS = ("uri", "request_headers", "request_body")
+
+# Data logged by CRS rules, as in "Matched Data: union select found within ARGS:q: ..."
+_MATCHED_DATA = re.compile(rb"Matched Data: (.*?) found within ", re.DOTALL)
+
+# Name of the argument of a packed payload, as in ARGS:q3, ARGS_POST:json.q3 or REQUEST_COOKIES:q3.
+# Rule messages expose their match and data as bytes.
+_PACKED_ARGUMENT = re.compile(rb"\b(?:ARGS(?:_GET|_POST)?|REQUEST_COOKIES):(?:json\.)?q(\d+)\b")
+
 
 class Severity(Enum):
     def __new__(cls, *args, **kwds):
@@ -35,75 +75,320 @@ class Severity(Enum):
     DEBUG     = 7, 0 # not used in CRS
 
 
+@lru_cache(maxsize=None)
+def _read_config(path, mtime):
+    with open(path, 'r') as config_file:
+        return config_file.read()
+
+
+def _read(path):
+    return _read_config(str(path), Path(path).stat().st_mtime_ns)
+
+
+def crs_setup(rules_path, pl):
+    """Returns the content of crs-setup.conf with the given blocking paranoia level.
+    Here we assume that the PL is explicitely set using the 900000 rule.
+    The file is read once and cached, until modified.
+
+    Arguments:
+        rules_path (str) : path of the CRS directory
+        pl (int) : the paranoia level
+
+    Returns:
+        str : the patched configuration
+    """
+    config = _read(Path(rules_path) / 'crs-setup.conf')
+    return re.sub(r"setvar:tx.blocking_paranoia_level=\d", "setvar:tx.blocking_paranoia_level={}".format(pl), config)
+
+
+def _anomaly_threshold(config):
+    # Directives span several lines ending with a backslash, commented out ones start with '#'
+    for directive in re.sub(r"\\\n", " ", config).splitlines():
+        threshold = re.search(r"setvar:'?tx\.inbound_anomaly_score_threshold=(\d+)", directive)
+        if threshold is not None and not directive.lstrip().startswith('#'):
+            return int(threshold.group(1))
+    return _DEFAULT_ANOMALY_THRESHOLD
+
+
+def rule_table(rule_files):
+    """Reads the anomaly score and the paranoia level of each rule.
+    Chained rules inherit them from the first rule of the chain, the only one with an ID.
+
+    Arguments:
+        rule_files (list) : paths of the rule files
+
+    Returns:
+        dict : rule ID to (score, paranoia level)
+    """
+    table = {}
+    for rule_file in rule_files:
+        # Directives span several lines ending with a backslash
+        directives = re.sub(r"\\\n", " ", _read(rule_file))
+        for directive in directives.splitlines():
+            rule_id = re.search(r"\bid:(\d+)", directive)
+            if directive.lstrip().startswith('#') or rule_id is None:
+                continue
+            severity = re.search(r"\bseverity:'?(\w+)", directive)
+            score = 0
+            if severity is not None:
+                severity = severity.group(1)
+                score = (Severity(int(severity)) if severity.isdigit() else Severity[severity.upper()]).score
+            pl = re.search(r"tag:'paranoia-level/(\d)", directive)
+            table[int(rule_id.group(1))] = (score, int(pl.group(1)) if pl else 1)
+    return table
+
+
 class PyModSecurityWrapper(Model):
 
-    def __init__(self, rules_path, pl):
+    def __init__(self, rules_path, pl, pack_size=1, location="query", header="User-Agent", instrument=False):
+        """Loads the CRS for the given paranoia level.
+
+        Arguments:
+            rules_path (str) : path of the CRS directory
+            pl (int) : the paranoia level, from 1 to 4
+
+        Keyword Arguments:
+            pack_size (int) : number of payloads packed in the same transaction by classify_many,
+                check packing_parity on the target rule set before raising it (default: (1))
+            location (str) : where payloads are injected, one of LOCATIONS (default: ("query"))
+            header (str) : the header payloads are injected in, with location "header" (default: ("User-Agent"))
+            instrument (bool) : collect the per rule statistics of report, scoring each payload
+                in its own transaction, whatever pack_size (default: (False))
+        """
         assert os.path.isdir(rules_path)
         assert isinstance(pl, int) and 1 <= pl <= 4
+        assert isinstance(pack_size, int) and pack_size >= 1
+        assert location in LOCATIONS
 
         self.rules_path = Path(rules_path)
         self.modsec = ModSecurity()
         self.paranoia_level = pl
+        self.location = location
+        # A header holds a single payload, and rule hits are only exact in unpacked transactions
+        self.pack_size = 1 if location == "header" or instrument else pack_size
 
-        # Ensure the right PL level is set in the CRS config file.
-        # Here we assume that the PL is explicitely set using the 900000 rule.
-        with open(self.rules_path / 'crs-setup.conf', 'r+') as crs_config_file:
-            file_content = crs_config_file.read()
-            file_content = re.sub(r"setvar:tx.blocking_paranoia_level=\d", "setvar:tx.blocking_paranoia_level={}".format(pl), file_content)
-            crs_config_file.seek(0)
-            crs_config_file.write(file_content)
-            crs_config_file.truncate()
+        # Request template, only the arguments change across transactions
+        self._argument = header if location == "header" else "q"
+        self._method = "POST" if location in _BODY_ENCODERS else "GET"
+        self._uri = "http://www.modsecurity.org/test"
+        self._headers = {
+            "Host": urlparse(self._uri).netloc, # Avoid matching rule 920280
+            "Accept": "text/html", # Avoid matching rule 920280
+            "User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64; rv:47.0) Gecko/20100101 Firefox/47.0" # Avoid matching rule 920280
+        }
+        if location in _BODY_ENCODERS:
+            self._headers["Content-Type"] = _CONTENT_TYPES[location]
 
         self.rules = RulesSet()
+        for config in ['modsecurity.conf', 'crs-setup.conf']:
+            if not (self.rules_path / config).exists():
+                raise FileNotFoundError(f"{config} not found in Rules path")
+
+        self._load_rules(self.rules.loadFromUri, str(self.rules_path / 'modsecurity.conf'))
+        # The PL is set in the in-memory copy of the CRS config, the file on disk is never modified,
+        # so that wrappers with different PLs can be created concurrently.
+        config = crs_setup(self.rules_path, pl)
+        self._load_rules(self.rules.load, config)
+        self._anomaly_threshold = _anomaly_threshold(config)
 
-        configs = ['modsecurity.conf', 'crs-setup.conf']
-        for rule in configs:
-            if (self.rules_path / rule).exists():
-                self.rules.loadFromUri(str(self.rules_path / rule))
-            else:
-                raise FileNotFoundError(f"{rule} not found in Rules path")
+        rule_files = sorted((self.rules_path / "rules").glob("*.conf"))
+        for rule in rule_files:
+            self._load_rules(self.rules.loadFromUri, str(rule))
 
-        for rule in sorted((self.rules_path / "rules").glob("*.conf")):
-            self.rules.loadFromUri(str(self.rules_path / "rules" / rule))
+        # Rules above the PL are removed, instead of running and being filtered out of the score
+        self._rule_table = rule_table(rule_files)
+        pruned = sorted(rule_id for rule_id, (_, level) in self._rule_table.items() if level > pl)
+        if pruned:
+            self._load_rules(self.rules.load, "SecRuleRemoveById {}".format(" ".join(map(str, pruned))))
 
         self.modsec.setServerLogCb2(lambda x, y: None, LogProperty.RuleMessageLogProperty)
 
+        self.instrument = instrument
+        self.reset_report()
+
+    def _load_rules(self, load, source):
+        if load(source) < 0:
+            raise ValueError(f"Cannot load rules: {self.rules.getParserError()}")
+
     def extract_features(self, value):
         return value
 
     def _get_paranoia_level(self, rule):
         return next((int(tag.split('/')[1]) for tag in rule.m_tags if 'paranoia-level' in tag), 1)
 
-    # TODO add request body evaluation if needed
-    # Currently only supports GET evaluation
+    def _rule_score(self, rule):
+        entry = self._rule_table.get(rule.m_ruleId)
+        if entry is None:
+            # Rule not found in the rule files, e.g. defined in modsecurity.conf
+            entry = Severity(rule.m_severity).score, self._get_paranoia_level(rule)
+            self._rule_table[rule.m_ruleId] = entry
+        score, level = entry
+        return score if level <= self.paranoia_level else 0
+
     # See https://github.com/AvalZ/modsecurity-cli for more details
-    def classify(self, value):
+    def _process_request(self, arguments, record=True):
+        """Runs a transaction with the given arguments, in the injection location.
+        With instrument, it is recorded in the report unless record is False.
 
-        method = "GET"
-        base_uri = "http://www.modsecurity.org/test"
-        encoded_query = urlencode({'q': value})
-        full_url = f"{base_uri}?{encoded_query}"
-        parsed_url = urlparse(full_url)
+        Returns:
+            list : the messages of the matched rules
+        """
+        uri = self._uri
+        headers = self._headers
+        body = ()
+        if self.location == "query":
+            uri = f"{uri}?{urlencode(arguments)}"
+        elif self.location == "header":
+            headers = {**headers, **arguments}
+        elif self.location == "cookie":
+            headers = {**headers, "Cookie": "; ".join(f"{name}={quote(value)}" for name, value in arguments.items())}
+        else:
+            body = _BODY_ENCODERS[self.location](arguments)
+            headers = {**headers, "Content-Length": str(sum(len(chunk) for chunk in body))}
 
         transaction = Transaction(self.modsec, self.rules)
 
-        transaction.processURI(full_url, method, "2.0")
+        start = time.perf_counter()
+        transaction.processURI(uri, self._method, "2.0")
+        uri_end = time.perf_counter()
 
-        # Headers
-        headers = {
-            "Host": parsed_url.netloc, # Avoid matching rule 920280
-            "Accept": "text/html", # Avoid matching rule 920280
-            "User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64; rv:47.0) Gecko/20100101 Firefox/47.0" # Avoid matching rule 920280
-        }
         for name, value in headers.items():
             transaction.addRequestHeader(name, value)
         transaction.processRequestHeaders()
+        headers_end = time.perf_counter()
 
+        # The body is streamed in chunks, one for each argument
+        for chunk in body:
+            transaction.appendRequestBody(chunk)
         transaction.processRequestBody()
 
-        # Decorate RuleMessages
-        for rule in transaction.m_rulesMessages:
-            rule.m_severity = Severity(rule.m_severity).score
+        messages = transaction.m_rulesMessages
+        if self.instrument and record:
+            self._record(messages, [uri_end - start, headers_end - uri_end, time.perf_counter() - headers_end])
+        return messages
+
+    def _record(self, messages, times):
+        self._transactions += 1
+        for step, seconds in zip(_STEPS, times):
+            self._step_time[step] += seconds
+        for rule in messages:
+            hits = self._rule_hits.setdefault(rule.m_ruleId, {"hits": 0, "score": 0, "phase": rule.m_phase})
+            hits["hits"] += 1
+            hits["score"] += self._rule_score(rule)
+
+    def reset_report(self):
+        """Clears the statistics collected with instrument."""
+        self._transactions = 0
+        self._step_time = dict.fromkeys(_STEPS, 0.0)
+        self._rule_hits = {}
+
+    def report(self):
+        """Statistics collected across the transactions run with instrument, since the last reset_report.
+
+        Returns:
+            dict : number of transactions, total seconds spent in each step of the transactions
+                (URI, request headers, i.e. phase 1, and request body, i.e. phase 2),
+                and hits, contributed score, phase and paranoia level of each matched rule, by decreasing score
+        """
+        rules = []
+        for rule_id, hits in self._rule_hits.items():
+            level = self._rule_table.get(rule_id, (0, 1))[1]
+            rules.append({"id": rule_id, **hits, "paranoia_level": level})
+        rules.sort(key=lambda rule: (-rule["score"], -rule["hits"], rule["id"]))
+        return {"transactions": self._transactions, "time": dict(self._step_time), "rules": rules}
 
-        total_score = sum([ rule.m_severity for rule in transaction.m_rulesMessages if self._get_paranoia_level(rule) <= self.paranoia_level])
+    def attribution(self, value):
+        """Locates the data matched by the scoring rules in the payload, weighting
+        each matched character by the score of the rules matching it.
+        Rules logging data that is not part of the payload (e.g. libinjection
+        fingerprints) do not contribute.
+
+        Arguments:
+            value (str) : the payload
+
+        Returns:
+            numpy ndarray : score of the rules matching each character, normalized to [0, 1]
+        """
+        influence = np.zeros(len(value))
+        lowered = value.lower()
+        # Not a scored candidate, kept out of the report
+        for rule in self._process_request({self._argument: value}, record=False):
+            score = self._rule_score(rule)
+            matched = _MATCHED_DATA.search(rule.m_data)
+            if score == 0 or matched is None:
+                continue
+            data = matched.group(1).decode("utf-8", "replace").lower()
+            start = lowered.find(data) if data else -1
+            while start >= 0:
+                influence[start : start + len(data)] += score
+                start = lowered.find(data, start + len(data))
+        peak = influence.max() if len(influence) else 0
+        return influence / peak if peak > 0 else influence
+
+    def classify(self, value):
+        total_score = sum(self._rule_score(rule) for rule in self._process_request({self._argument: value}))
         return total_score
+
+    def _matched_argument(self, rule):
+        for text in (rule.m_match, rule.m_data):
+            argument = _PACKED_ARGUMENT.search(text)
+            if argument is not None:
+                return int(argument.group(1))
+        return None
+
+    def _classify_packed(self, values):
+        scores = [0] * len(values)
+        evaluation_score = 0
+        for rule in self._process_request({f'{self._argument}{i}': value for i, value in enumerate(values)}):
+            score = self._rule_score(rule)
+            if score == 0:
+                continue
+            if rule.m_ruleId // 1000 in _ANOMALY_EVALUATION:
+                # The rule matched the total score of the pack, it is credited below
+                # to the payloads whose own score reaches the blocking threshold
+                evaluation_score += score
+                continue
+            i = self._matched_argument(rule)
+            if i is None or i >= len(values):
+                # The rule matched the whole request (e.g. its URI): scores are not separable
+                return [self.classify(value) for value in values]
+            scores[i] += score
+        return [score + evaluation_score if score >= self._anomaly_threshold else score for score in scores]
+
+    def classify_many(self, values, parent=None):
+        """Scores many payloads, packing up to pack_size of them in the query arguments
+        (q0, q1, ...) of a single transaction. Each matched rule is attributed to a
+        payload through the name of the matched variable. The anomaly evaluation
+        rules, which match the total score of the request, are credited to each
+        payload reaching the inbound anomaly score threshold on its own.
+        Packing is off by default: libmodsecurity may log a single message for a
+        rule matching many arguments, so that packed scores are lower than the
+        ones of classify. Check packing_parity before raising pack_size.
+
+        Arguments:
+            values (list) : the payloads
+
+        Keyword Arguments:
+            parent (str) : unused (default: (None))
+
+        Returns:
+            list : the anomaly score of each payload
+        """
+        scores = []
+        for i in range(0, len(values), self.pack_size):
+            chunk = values[i : i + self.pack_size]
+            scores.extend(self._classify_packed(chunk) if len(chunk) > 1 else [self.classify(chunk[0])])
+        return scores
+
+    def packing_parity(self, values):
+        """Compares the packed scores of classify_many with the scores of classify.
+
+        Arguments:
+            values (list) : the payloads
+
+        Returns:
+            list : (payload, packed score, single score) of each payload scored differently
+        """
+        packed = self.classify_many(values)
+        single = [self.classify(value) for value in values]
+        return [(v, p, s) for v, p, s in zip(values, packed, single) if p != s]
@@ -0,0 +1,143 @@
+"""Pool of worker processes sharing one loaded model.
+
+The model is loaded once in the parent process: forked workers inherit its
+memory copy-on-write, so large arrays (support vectors, trees, memory-mapped
+weights) are shared by all the workers instead of being loaded by each one.
+TensorFlow does not survive fork: Keras models should use a NumPy engine.
+"""
+import multiprocessing
+import os
+import queue
+from wafamole.models import Model
+from wafamole.utils.check import type_check
+
+# Model of the current worker process, inherited from the parent at fork
+_worker_model = None
+
+
+def _init_worker(model, pids):
+    global _worker_model
+    _worker_model = model
+    pids.put(os.getpid())
+
+
+def _classify_chunk(args):
+    values, parent = args
+    return list(_worker_model.classify_many(values, parent))
+
+
+def process_memory(pid: int = None):
+    """Reads the memory usage of a process from /proc (Linux only).
+    PSS divides shared pages among the processes mapping them, so the PSS of
+    the workers of a pool adds up to their real footprint.
+
+    Keyword Arguments:
+        pid (int) : the process, the current one if None (default: (None))
+
+    Returns:
+        dict : rss, pss, shared and private bytes, None if not available
+    """
+    pid = os.getpid() if pid is None else pid
+    fields = {
+        "Rss": "rss",
+        "Pss": "pss",
+        "Shared_Clean": "shared",
+        "Shared_Dirty": "shared",
+        "Private_Clean": "private",
+        "Private_Dirty": "private",
+    }
+    usage = {"pid": pid, "rss": 0, "pss": 0, "shared": 0, "private": 0}
+    try:
+        with open("/proc/{}/smaps_rollup".format(pid)) as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in fields:
+                    usage[fields[name]] += int(value.split()[0]) * 1024
+    except OSError:
+        return None
+    return usage
+
+
+class ModelPool(Model):
+    """Model scoring batches of values in forked worker processes."""
+
+    def __init__(self, model: Model, processes: int = None):
+        """Forks the workers, which inherit the already loaded model.
+
+        Arguments:
+            model (Model) : the loaded model
+
+        Keyword Arguments:
+            processes (int) : number of workers, the number of CPUs if None (default: (None))
+
+        Raises:
+            TypeError: model is not Model, or processes is not int
+            ValueError: the platform does not support fork
+        """
+        type_check(model, Model, "model")
+        if processes is not None:
+            type_check(processes, int, "processes")
+        self._model = model
+        self._processes = processes or os.cpu_count()
+        context = multiprocessing.get_context("fork")
+        # Each worker reports its PID when it starts, replacements of dead workers included
+        self._pid_queue = context.Queue()
+        # With fork, the initializer arguments are inherited, not pickled
+        self._pool = context.Pool(self._processes, _init_worker, (model, self._pid_queue))
+        self._pids = [self._pid_queue.get() for _ in range(self._processes)]
+
+    def extract_features(self, value: object):
+        return self._model.extract_features(value)
+
+    def classify(self, value: object):
+        return self.classify_many([value])[0]
+
+    def classify_many(self, values: list, parent: object = None):
+        """Splits values among the workers.
+
+        Arguments:
+            values (list) : Input values
+
+        Keyword Arguments:
+            parent (object) : the value all the inputs were mutated from, passed to each worker (default: (None))
+
+        Returns:
+            list : the confidence of the malicious class, one for each value.
+        """
+        if not values:
+            return []
+        size = -(-len(values) // self._processes)
+        chunks = [(values[i : i + size], parent) for i in range(0, len(values), size)]
+        results = self._pool.map(_classify_chunk, chunks)
+        return [confidence for chunk in results for confidence in chunk]
+
+    def attribution(self, value: object):
+        return self._model.attribution(value)
+
+    def feature_gradient(self, value: object):
+        return self._model.feature_gradient(value)
+
+    def memory_usage(self):
+        """Memory usage of each worker, see process_memory.
+
+        Returns:
+            list : one dict for each worker started, None for the ones no longer running
+        """
+        while True:
+            try:
+                self._pids.append(self._pid_queue.get_nowait())
+            except queue.Empty:
+                break
+        return [process_memory(pid) for pid in self._pids]
+
+    def close(self):
+        """Stops the workers."""
+        self._pool.terminate()
+        self._pool.join()
+        self._pid_queue.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
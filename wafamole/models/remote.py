@@ -0,0 +1,216 @@
+"""Model served over a Unix domain socket.
+
+A ModelServer loads a model once and answers the requests of many short-lived
+clients. Concurrent classify requests are grouped in micro-batches by a
+BatchingModel, bounded by a maximum number of values and a maximum wait.
+RemoteModel is the client, usable by the engines as any other Model.
+
+The protocol is one JSON object per line. Requests are
+{"op": "classify_many" | "extract_features" | "attribution" | "feature_gradient", "values" | "value": ..., "parent": ...}
+and responses are {"result": ...} or {"error": "..."}.
+"""
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import numpy as np
+from wafamole.models import Model
+from wafamole.models.batching import BatchingModel
+from wafamole.utils.check import type_check
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = {"result": self.server.model_server.answer(json.loads(line))}
+            except Exception as e:
+                response = {"error": "{}: {}".format(type(e).__name__, e)}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _remove_stale_socket(path):
+    """Removes the socket left at path by a server that is not running anymore."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if stat.S_ISSOCK(mode):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)
+                return
+        raise FileExistsError("a server is already listening on {}".format(path))
+    raise FileExistsError("{} exists and is not a socket".format(path))
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ModelServer(object):
+    """Serves a loaded model on a Unix domain socket."""
+
+    def __init__(self, model: Model, socket_path: str, max_batch_size: int = 64, max_wait: float = 0.005):
+        """Binds the socket, replacing a stale one.
+
+        Arguments:
+            model (Model) : the loaded model
+            socket_path (str) : path of the Unix domain socket
+
+        Keyword Arguments:
+            max_batch_size (int) : maximum number of values scored by a single classify_many call (default: (64))
+            max_wait (float) : seconds a request waits for others to join its batch (default: (0.005))
+
+        Raises:
+            TypeError: arguments are mistyped
+            FileExistsError: socket_path is not a socket, or a server is listening on it
+        """
+        type_check(model, Model, "model")
+        type_check(socket_path, str, "socket_path")
+        type_check(max_batch_size, int, "max_batch_size")
+        type_check(max_wait, float, "max_wait")
+        _remove_stale_socket(socket_path)
+        self._socket_path = socket_path
+        self._model = BatchingModel(model, max_batch_size, max_wait)
+        self._server = _UnixServer(socket_path, _Handler)
+        self._server.model_server = self
+
+    @property
+    def socket_path(self):
+        return self._socket_path
+
+    @property
+    def stats(self):
+        """Number of batches and values scored so far, and their histograms, see BatchingModel.stats."""
+        return self._model.stats
+
+    def answer(self, request: dict):
+        """Executes a request.
+
+        Arguments:
+            request (dict) : the decoded request
+
+        Raises:
+            ValueError: unknown operation
+
+        Returns:
+            the JSON serializable result
+        """
+        op = request.get("op")
+        if op == "classify_many":
+            results = self._model.classify_many(request["values"], request.get("parent"))
+            return [float(confidence) for confidence in results]
+        if op in ("extract_features", "attribution", "feature_gradient"):
+            return _to_json(getattr(self._model, op)(request["value"]))
+        raise ValueError("unknown operation {}".format(op))
+
+    def serve_forever(self):
+        """Answers requests until shutdown is called."""
+        self._server.serve_forever()
+
+    def start(self):
+        """Answers requests in a background thread.
+
+        Returns:
+            self
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def shutdown(self):
+        """Stops serve_forever, running in another thread, and closes the server."""
+        self._server.shutdown()
+        self.close()
+
+    def close(self):
+        """Closes the server and removes the socket."""
+        self._server.server_close()
+        self._model.close()
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+
+
+class RemoteModel(Model):
+    """Client of a ModelServer."""
+
+    def __init__(self, socket_path: str, timeout: float = None):
+        """Connects to a ModelServer.
+
+        Arguments:
+            socket_path (str) : path of the Unix domain socket
+
+        Keyword Arguments:
+            timeout (float) : seconds to wait for each response, no limit if None (default: (None))
+
+        Raises:
+            TypeError: socket_path is not string
+            FileNotFoundError: socket_path not pointing to anything
+        """
+        type_check(socket_path, str, "socket_path")
+        if not os.path.exists(socket_path):
+            raise FileNotFoundError("{} not exists".format(socket_path))
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_path)
+        self._file = self._socket.makefile("rwb")
+        self._lock = threading.Lock()
+
+    def _call(self, request):
+        with self._lock:
+            self._file.write(json.dumps(request).encode() + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            raise ConnectionError("model server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError("model server error: {}".format(response["error"]))
+        return response["result"]
+
+    def extract_features(self, value: str):
+        return np.asarray(self._call({"op": "extract_features", "value": value}))
+
+    def classify(self, value: str):
+        return self.classify_many([value])[0]
+
+    def classify_many(self, values: list, parent: str = None):
+        """Scores values on the server, in a batch shared with the other clients.
+
+        Arguments:
+            values (list) : input queries
+
+        Keyword Arguments:
+            parent (str) : the query all the inputs were mutated from (default: (None))
+
+        Returns:
+            list : the confidence of the malicious class, one for each value.
+        """
+        type_check(values, list, "values")
+        return self._call({"op": "classify_many", "values": values, "parent": parent})
+
+    def attribution(self, value: str):
+        result = self._call({"op": "attribution", "value": value})
+        return None if result is None else np.asarray(result)
+
+    def feature_gradient(self, value: str):
+        result = self._call({"op": "feature_gradient", "value": value})
+        return None if result is None else np.asarray(result)
+
+    def close(self):
+        """Closes the connection."""
+        self._file.close()
+        self._socket.close()
@@ -1,8 +1,11 @@
 """Wrapper for sci-kit learn classifiers.
 """
+import hashlib
 import os
+from collections import OrderedDict
 import joblib
 import numpy as np
+import scipy.sparse as sp
 from wafamole.models import Model
 from wafamole.exceptions.models_exceptions import (
     NotSklearnModelError,
@@ -12,20 +15,47 @@ from wafamole.exceptions.models_exceptions import (
 from wafamole.utils.check import type_check, file_exists
 
 
+def _feature_key(feature_vector):
+    """Hashes the content of a dense or sparse feature vector."""
+    digest = hashlib.blake2b(digest_size=16)
+    if sp.issparse(feature_vector):
+        feature_vector = sp.csr_matrix(feature_vector)
+        feature_vector.sum_duplicates()
+        feature_vector.eliminate_zeros()
+        parts = (feature_vector.data, feature_vector.indices)
+    else:
+        feature_vector = np.ascontiguousarray(feature_vector)
+        parts = (feature_vector,)
+    digest.update("{}{}".format(feature_vector.dtype, feature_vector.shape).encode())
+    for part in parts:
+        digest.update(np.ascontiguousarray(part).tobytes())
+    return digest.digest()
+
+
 class SklearnModelWrapper(Model):
     """Sci-kit learn classifier wrapper class"""
 
-    def __init__(self, sklearn_classifier=None):
+    def __init__(self, sklearn_classifier=None, cache_size: int = 4096):
         """Constructs a wrapper around an scikit-learn classifier, or equivalent.
         It must implement predict_proba function.
         
         Arguments:
             sklearn_classifier (sci-kit learn classifier):  scikit-learn classifier or equivalent
+
+        Keyword Arguments:
+            cache_size (int) : number of feature vectors whose prediction is kept, 0 to disable the cache (default: (4096))
         
         Raises:
             NotSklearnModelError: not implement predict_proba
             NotSklearnModelError: not implement fit
+            TypeError: cache_size is not int
         """
+        type_check(cache_size, int, "cache_size")
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_model = None
+        self._cache_hits = 0
+        self._cache_misses = 0
         if sklearn_classifier is None:
             self._sklearn_classifier = None
         else:
@@ -55,17 +85,95 @@ class SklearnModelWrapper(Model):
             raise ModelNotLoadedError()
         feature_vector = self.extract_features(value)
         try:
-            y_pred = self._sklearn_classifier.predict_proba([feature_vector])
+            y_pred = self._predict_proba([feature_vector])
             return y_pred
         except Exception as e:
             raise SklearnInternalError("Internal sklearn error.") from e
 
-    def load(self, filepath):
+    @property
+    def cache_info(self):
+        """Statistics of the cache of predictions, keyed by feature vector.
+
+        Returns:
+            dict : hits, misses, current and maximum size of the cache
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+        }
+
+    def clear_cache(self):
+        """Empties the cache of predictions."""
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _predict_proba(self, X, predictor=None):
+        """Calls predict_proba only on the feature vectors not already in cache.
+        Mutants that are equivalent in feature space are scored once.
+
+        Arguments:
+            X (list, numpy ndarray or scipy sparse matrix) : the feature vectors
+
+        Keyword Arguments:
+            predictor : the object whose predict_proba scores X, the wrapped classifier if None (default: (None))
+
+        Returns:
+            numpy ndarray : the confidence for each class, one row for each feature vector
+        """
+        if predictor is None:
+            predictor = self._sklearn_classifier
+        if not self._cache_size:
+            return np.asarray(predictor.predict_proba(X))
+        if self._cache_model is not self._sklearn_classifier:
+            self.clear_cache()
+            self._cache_model = self._sklearn_classifier
+
+        rows = X.shape[0] if sp.issparse(X) or isinstance(X, np.ndarray) else len(X)
+        results = [None] * rows
+        missing = OrderedDict()
+        for i in range(rows):
+            key = _feature_key(X[i])
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                results[i] = cached
+                self._cache_hits += 1
+            elif key in missing:
+                missing[key].append(i)
+                self._cache_hits += 1
+            else:
+                missing[key] = [i]
+                self._cache_misses += 1
+
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            if sp.issparse(X) or isinstance(X, np.ndarray):
+                X_missing = X[first]
+            else:
+                X_missing = [X[i] for i in first]
+            y_pred = np.asarray(predictor.predict_proba(X_missing))
+            for (key, indices), row in zip(missing.items(), y_pred):
+                self._cache[key] = row
+                for i in indices:
+                    results[i] = row
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return np.vstack(results)
+
+    def load(self, filepath, mmap_mode=None):
         """Loads a sklearn classifier stored in filepath.
         
         Arguments:
             filepath (string) : The path of the sklearn classifier.
 
+        Keyword Arguments:
+            mmap_mode (str) : "r" to memory-map the arrays of the classifier instead of reading them,
+                so that processes loading the same file share its pages. Only uncompressed
+                joblib dumps can be memory-mapped (default: (None))
+
         Raises:
             TypeError: filepath is not string.
             FileNotFoundError: filepath not pointing to any file.
@@ -77,9 +185,10 @@ class SklearnModelWrapper(Model):
         type_check(filepath, str, "filepath")
         file_exists(filepath)
         try:
-            self._sklearn_classifier = joblib.load(filepath)
+            self._sklearn_classifier = joblib.load(filepath, mmap_mode=mmap_mode)
         except Exception as e:
             raise NotSklearnModelError("Error in loading model.") from e
+        self.clear_cache()
         return self
 
     def extract_features(self, value: np.ndarray):
@@ -1,8 +1,112 @@
 import re
 import random
 import string
+import threading
+from contextlib import contextmanager
 from wafamole.utils.check import type_check
 
+# Influence of each character of the payload being mutated, set by position_weights.
+# Thread local, as engines sharing a model may fuzz different payloads in different threads.
+_POSITION_WEIGHTS = threading.local()
+# Weight added to every candidate position, so that no position is ever excluded
+EXPLORATION_WEIGHT = 0.05
+
+
+@contextmanager
+def position_weights(weights):
+    """Biases the positions chosen by the strategies towards characters with high weights.
+
+    Arguments:
+        weights (sequence) : non-negative weight of each character of the payload, None for uniform choices
+    """
+    previous = getattr(_POSITION_WEIGHTS, "weights", None)
+    _POSITION_WEIGHTS.weights = weights
+    try:
+        yield
+    finally:
+        _POSITION_WEIGHTS.weights = previous
+
+
+def choose_span(candidates, spans):
+    """Chooses one of the candidates, located by spans in the payload.
+    Choices are uniform, unless position_weights is active: then each candidate
+    is chosen with probability proportional to the mean weight of its span.
+
+    Arguments:
+        candidates (list) : the candidates
+        spans (list) : (start, end) of each candidate in the payload
+
+    Returns:
+        object : the chosen candidate
+    """
+    current = getattr(_POSITION_WEIGHTS, "weights", None)
+    if current is None:
+        return random.choice(candidates)
+    weights = []
+    for start, end in spans:
+        span = current[start : max(end, start + 1)]
+        weights.append((sum(span) / len(span) if len(span) else 0.0) + EXPLORATION_WEIGHT)
+    return random.choices(candidates, weights)[0]
+
+
+def choose_match(matches):
+    """Chooses one of the regular expression matches, see choose_span.
+
+    Arguments:
+        matches (list) : the matches
+
+    Returns:
+        re.Match : the chosen match
+    """
+    return choose_span(matches, [m.span() for m in matches])
+
+
+def edit_span(parent, child):
+    """Finds the span of child that differs from parent.
+
+    Arguments:
+        parent (str) : the original payload
+        child (str) : the mutated payload
+
+    Returns:
+        (int, int) : lengths of the common prefix and of the common suffix, not overlapping
+    """
+    limit = min(len(parent), len(child))
+    prefix = 0
+    while prefix < limit and parent[prefix] == child[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and parent[-1 - suffix] == child[-1 - suffix]:
+        suffix += 1
+    return prefix, suffix
+
+
+def realign_weights(weights, parent, child):
+    """Maps the weights of the characters of parent onto child.
+    Characters outside the edit span keep their weight, the edited ones
+    take the mean weight of the characters they replaced.
+
+    Arguments:
+        weights (list) : weight of each character of parent
+        parent (str) : the original payload
+        child (str) : the mutated payload
+
+    Returns:
+        list : weight of each character of child
+    """
+    weights = list(weights)
+    prefix, suffix = edit_span(parent, child)
+    replaced = weights[prefix : len(parent) - suffix]
+    if not replaced:
+        # Insertion: inherit from the neighbouring characters
+        replaced = weights[max(0, prefix - 1) : prefix + 1]
+    fill = sum(replaced) / len(replaced) if replaced else 0.0
+    return (
+        weights[:prefix]
+        + [fill] * (len(child) - prefix - suffix)
+        + weights[len(parent) - suffix :]
+    )
+
 
 def replace_nth(candidate, sub, wanted, n):
     """Replace the n-th occurrence of a portion of the candidate with wanted.
@@ -52,7 +156,7 @@ def replace_random(candidate, sub, wanted):
     if not occurrences:
         return candidate
 
-    match = random.choice(occurrences)
+    match = choose_match(occurrences)
 
     before = candidate[:match.start()]
     after = candidate[match.end():]
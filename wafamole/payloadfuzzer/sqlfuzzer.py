@@ -2,8 +2,13 @@
 
 import random
 import re
+import numpy as np
 import sqlparse
 from wafamole.payloadfuzzer.fuzz_utils import (
+    choose_match,
+    choose_span,
+    position_weights,
+    realign_weights,
     replace_random,
     filter_candidates,
     random_string,
@@ -29,7 +34,7 @@ def reset_inline_comments(payload: str):
     if not positions:
         return payload
 
-    pos = random.choice(positions).span()
+    pos = choose_match(positions).span()
 
     replacements = ["/**/"]
 
@@ -62,7 +67,7 @@ def logical_invariant(payload: str):
     results = num_tautologies_pos + num_tautologies_neg + string_tautologies_pos + string_tautologies_neg
     if not results:
         return payload
-    candidate = random.choice(results)
+    candidate = choose_match(results)
 
     pos = candidate.end()
 
@@ -105,7 +110,7 @@ def change_tautologies(payload: str):
     results = num_tautologies_pos + num_tautologies_neg + string_tautologies_pos + string_tautologies_neg
     if not results:
         return payload
-    candidate = random.choice(results)
+    candidate = choose_match(results)
 
     while True:
         replacements = [num_tautology(), string_tautology()]
@@ -254,7 +259,7 @@ def swap_int_repr(payload: str):
     if not candidates:
         return payload
 
-    candidate_pos = random.choice(candidates).span()
+    candidate_pos = choose_match(candidates).span()
 
     candidate = payload[candidate_pos[0] : candidate_pos[1]]
 
@@ -318,12 +323,49 @@ def swap_keywords(payload: str):
     if not indices:
         return payload
 
-    target_idx = random.choice(indices)
+    offsets = [0]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token.value))
+    target_idx = choose_span(indices, [(offsets[idx], offsets[idx + 1]) for idx in indices])
     new_payload = "".join([random.choice(replacements[token.value]) if idx == target_idx else token.value for idx, token in enumerate(tokens)])
 
     return new_payload
 
 
+def strategy_weights(payload: str, extract_features, gradient, samples: int = 5, exploration: float = 0.05):
+    """Weights the strategies by how much they are expected to lower the confidence of a model.
+    The effect of each strategy on the features of payload is measured by applying it a few
+    times, with no inference, and projected on the gradient of the confidence.
+
+    Arguments:
+        payload (str) : the payload to mutate
+        extract_features (callable) : the feature extraction of the model
+        gradient (numpy ndarray) : gradient of the confidence with respect to the features of payload
+
+    Keyword Arguments:
+        samples (int) : applications of each strategy (default: (5))
+        exploration (float) : fraction of the weight spread uniformly on all the strategies (default: (0.05))
+
+    Returns:
+        list : the weight of each strategy of SqlFuzzer.strategies
+    """
+    features = np.asarray(extract_features(payload), dtype=float)
+    gradient = np.asarray(gradient, dtype=float)
+    gains = []
+    for strategy in SqlFuzzer.strategies:
+        shift = np.mean(
+            [np.asarray(extract_features(strategy(payload)), dtype=float) - features for _ in range(samples)],
+            axis=0,
+        )
+        # First order estimate of how much the confidence drops
+        gains.append(max(0.0, -float(np.dot(gradient, shift))))
+    total = sum(gains)
+    uniform = 1.0 / len(gains)
+    if total == 0:
+        return [uniform] * len(gains)
+    return [exploration * uniform + (1 - exploration) * g / total for g in gains]
+
+
 class SqlFuzzer(object):
     """SqlFuzzer class"""
 
@@ -339,14 +381,45 @@ class SqlFuzzer(object):
         reset_inline_comments
     ]
 
-    def __init__(self, payload):
+    def __init__(self, payload, influence=None, weights=None):
+        """Constructs a fuzzer.
+
+        Arguments:
+            payload (str) : the initial payload
+
+        Keyword Arguments:
+            influence (sequence) : non-negative influence of each character of payload on the target,
+                strategies edit high-influence positions more often (default: (None))
+            weights (sequence) : relative weight of each strategy, uniform if None (default: (None))
+
+        Raises:
+            ValueError: influence and payload, or weights and strategies, have different lengths
+        """
+        if influence is not None:
+            influence = [float(w) for w in influence]
+            if len(influence) != len(payload):
+                raise ValueError("influence must have one weight for each character of payload")
+        if weights is not None and len(weights) != len(self.strategies):
+            raise ValueError("weights must have one weight for each strategy")
         self.initial_payload = payload
         self.payload = payload
+        self.initial_influence = influence
+        self.influence = influence
+        self.weights = weights
 
     def fuzz(self):
-        strategy = random.choice(self.strategies)
+        if self.weights is None:
+            strategy = random.choice(self.strategies)
+        else:
+            strategy = random.choices(self.strategies, self.weights)[0]
 
-        self.payload = strategy(self.payload)
+        if self.influence is None:
+            self.payload = strategy(self.payload)
+        else:
+            with position_weights(self.influence):
+                payload = strategy(self.payload)
+            self.influence = realign_weights(self.influence, self.payload, payload)
+            self.payload = payload
         # print(self.payload)
 
         return self.payload
@@ -356,4 +429,5 @@ class SqlFuzzer(object):
 
     def reset(self):
         self.payload = self.initial_payload
+        self.influence = self.initial_influence
         return self.payload
@@ -0,0 +1,2167 @@
+"""System dictionaries used by allowed_tokens.
+
+Generated by wafamole.tokenizer.allowed_tokens.compile_sys_def, do not edit.
+"""
+SYS_DEF = (
+	('SYS_DB', (
+		'MYSQL',
+		'INFORMATION_SCHEMA',
+		'SYS',
+		'PERFORMANCE_SCHEMA',
+	)),
+	('SYSTBL', (
+		'X$WAIT_CLASSES_GLOBAL_BY_LATENCY',
+		'X$WAIT_CLASSES_GLOBAL_BY_AVG_LATENCY',
+		'X$WAITS_GLOBAL_BY_LATENCY',
+		'X$WAITS_BY_USER_BY_LATENCY',
+		'X$WAITS_BY_HOST_BY_LATENCY',
+		'X$USER_SUMMARY_BY_STATEMENT_TYPE',
+		'X$USER_SUMMARY_BY_STATEMENT_LATENCY',
+		'X$USER_SUMMARY_BY_STAGES',
+		'X$USER_SUMMARY_BY_FILE_IO_TYPE',
+		'X$USER_SUMMARY_BY_FILE_IO',
+		'X$USER_SUMMARY',
+		'X$STATEMENT_ANALYSIS',
+		'X$STATEMENTS_WITH_TEMP_TABLES',
+		'X$STATEMENTS_WITH_SORTING',
+		'X$STATEMENTS_WITH_RUNTIMES_IN_95TH_PERCENTILE',
+		'X$STATEMENTS_WITH_FULL_TABLE_SCANS',
+		'X$STATEMENTS_WITH_ERRORS_OR_WARNINGS',
+		'X$SESSION',
+		'X$SCHEMA_TABLE_STATISTICS_WITH_BUFFER',
+		'X$SCHEMA_TABLE_STATISTICS',
+		'X$SCHEMA_TABLE_LOCK_WAITS',
+		'X$SCHEMA_TABLES_WITH_FULL_TABLE_SCANS',
+		'X$SCHEMA_INDEX_STATISTICS',
+		'X$SCHEMA_FLATTENED_KEYS',
+		'X$PS_SCHEMA_TABLE_STATISTICS_IO',
+		'X$PS_DIGEST_AVG_LATENCY_DISTRIBUTION',
+		'X$PS_DIGEST_95TH_PERCENTILE_BY_AVG_US',
+		'X$PROCESSLIST',
+		'X$MEMORY_GLOBAL_TOTAL',
+		'X$MEMORY_GLOBAL_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_USER_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_THREAD_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_HOST_BY_CURRENT_BYTES',
+		'X$LATEST_FILE_IO',
+		'X$IO_GLOBAL_BY_WAIT_BY_LATENCY',
+		'X$IO_GLOBAL_BY_WAIT_BY_BYTES',
+		'X$IO_GLOBAL_BY_FILE_BY_LATENCY',
+		'X$IO_GLOBAL_BY_FILE_BY_BYTES',
+		'X$IO_BY_THREAD_BY_LATENCY',
+		'X$INNODB_LOCK_WAITS',
+		'X$INNODB_BUFFER_STATS_BY_TABLE',
+		'X$INNODB_BUFFER_STATS_BY_SCHEMA',
+		'X$HOST_SUMMARY_BY_STATEMENT_TYPE',
+		'X$HOST_SUMMARY_BY_STATEMENT_LATENCY',
+		'X$HOST_SUMMARY_BY_STAGES',
+		'X$HOST_SUMMARY_BY_FILE_IO_TYPE',
+		'X$HOST_SUMMARY_BY_FILE_IO',
+		'X$HOST_SUMMARY',
+		'WAIT_CLASSES_GLOBAL_BY_LATENCY',
+		'WAIT_CLASSES_GLOBAL_BY_AVG_LATENCY',
+		'WAITS_GLOBAL_BY_LATENCY',
+		'WAITS_BY_USER_BY_LATENCY',
+		'WAITS_BY_HOST_BY_LATENCY',
+		'VIEW_TABLE_USAGE',
+		'VIEW_ROUTINE_USAGE',
+		'VIEWS',
+		'VERSION',
+		'VARIABLES_INFO',
+		'VARIABLES_BY_THREAD',
+		'USER_VARIABLES_BY_THREAD',
+		'USER_SUMMARY_BY_STATEMENT_TYPE',
+		'USER_SUMMARY_BY_STATEMENT_LATENCY',
+		'USER_SUMMARY_BY_STAGES',
+		'USER_SUMMARY_BY_FILE_IO_TYPE',
+		'USER_SUMMARY_BY_FILE_IO',
+		'USER_SUMMARY',
+		'USER_PRIVILEGES',
+		'USER_DEFINED_FUNCTIONS',
+		'USERS',
+		'USER',
+		'TRIGGERS',
+		'TIME_ZONE_TRANSITION_TYPE',
+		'TIME_ZONE_TRANSITION',
+		'TIME_ZONE_NAME',
+		'TIME_ZONE_LEAP_SECOND',
+		'TIME_ZONE',
+		'THREADS',
+		'TABLE_PRIVILEGES',
+		'TABLE_LOCK_WAITS_SUMMARY_BY_TABLE',
+		'TABLE_IO_WAITS_SUMMARY_BY_TABLE',
+		'TABLE_IO_WAITS_SUMMARY_BY_INDEX_USAGE',
+		'TABLE_HANDLES',
+		'TABLE_CONSTRAINTS',
+		'TABLES_PRIV',
+		'TABLESPACES',
+		'TABLES',
+		'SYS_CONFIG',
+		'ST_UNITS_OF_MEASURE',
+		'ST_SPATIAL_REFERENCE_SYSTEMS',
+		'ST_GEOMETRY_COLUMNS',
+		'STATUS_BY_USER',
+		'STATUS_BY_THREAD',
+		'STATUS_BY_HOST',
+		'STATUS_BY_ACCOUNT',
+		'STATISTICS',
+		'STATEMENT_ANALYSIS',
+		'STATEMENTS_WITH_TEMP_TABLES',
+		'STATEMENTS_WITH_SORTING',
+		'STATEMENTS_WITH_RUNTIMES_IN_95TH_PERCENTILE',
+		'STATEMENTS_WITH_FULL_TABLE_SCANS',
+		'STATEMENTS_WITH_ERRORS_OR_WARNINGS',
+		'SOCKET_SUMMARY_BY_INSTANCE',
+		'SOCKET_SUMMARY_BY_EVENT_NAME',
+		'SOCKET_INSTANCES',
+		'SLOW_LOG',
+		'SLAVE_WORKER_INFO',
+		'SLAVE_RELAY_LOG_INFO',
+		'SLAVE_MASTER_INFO',
+		'SETUP_THREADS',
+		'SETUP_OBJECTS',
+		'SETUP_INSTRUMENTS',
+		'SETUP_CONSUMERS',
+		'SETUP_ACTORS',
+		'SESSION_VARIABLES',
+		'SESSION_STATUS',
+		'SESSION_SSL_STATUS',
+		'SESSION_CONNECT_ATTRS',
+		'SESSION_ACCOUNT_CONNECT_ATTRS',
+		'SESSION',
+		'SERVER_COST',
+		'SERVERS',
+		'SCHEMA_UNUSED_INDEXES',
+		'SCHEMA_TABLE_STATISTICS_WITH_BUFFER',
+		'SCHEMA_TABLE_STATISTICS',
+		'SCHEMA_TABLE_LOCK_WAITS',
+		'SCHEMA_TABLES_WITH_FULL_TABLE_SCANS',
+		'SCHEMA_REDUNDANT_INDEXES',
+		'SCHEMA_PRIVILEGES',
+		'SCHEMA_OBJECT_OVERVIEW',
+		'SCHEMA_INDEX_STATISTICS',
+		'SCHEMA_AUTO_INCREMENT_COLUMNS',
+		'SCHEMATA',
+		'RWLOCK_INSTANCES',
+		'ROUTINES',
+		'ROLE_EDGES',
+		'RESOURCE_GROUPS',
+		'REPLICATION_GROUP_MEMBER_STATS',
+		'REPLICATION_GROUP_MEMBERS',
+		'REPLICATION_CONNECTION_STATUS',
+		'REPLICATION_CONNECTION_CONFIGURATION',
+		'REPLICATION_APPLIER_STATUS_BY_WORKER',
+		'REPLICATION_APPLIER_STATUS_BY_COORDINATOR',
+		'REPLICATION_APPLIER_STATUS',
+		'REPLICATION_APPLIER_GLOBAL_FILTERS',
+		'REPLICATION_APPLIER_FILTERS',
+		'REPLICATION_APPLIER_CONFIGURATION',
+		'REFERENTIAL_CONSTRAINTS',
+		'PS_CHECK_LOST_INSTRUMENTATION',
+		'PROXIES_PRIV',
+		'PROFILING',
+		'PROCS_PRIV',
+		'PROCESSLIST',
+		'PREPARED_STATEMENTS_INSTANCES',
+		'PLUGINS',
+		'PLUGIN',
+		'PERSISTED_VARIABLES',
+		'PERFORMANCE_TIMERS',
+		'PASSWORD_HISTORY',
+		'PARTITIONS',
+		'PARAMETERS',
+		'OPTIMIZER_TRACE',
+		'OBJECTS_SUMMARY_GLOBAL_BY_TYPE',
+		'MUTEX_INSTANCES',
+		'METRICS',
+		'METADATA_LOCKS',
+		'MEMORY_SUMMARY_GLOBAL_BY_EVENT_NAME',
+		'MEMORY_SUMMARY_BY_USER_BY_EVENT_NAME',
+		'MEMORY_SUMMARY_BY_THREAD_BY_EVENT_NAME',
+		'MEMORY_SUMMARY_BY_HOST_BY_EVENT_NAME',
+		'MEMORY_SUMMARY_BY_ACCOUNT_BY_EVENT_NAME',
+		'MEMORY_GLOBAL_TOTAL',
+		'MEMORY_GLOBAL_BY_CURRENT_BYTES',
+		'MEMORY_BY_USER_BY_CURRENT_BYTES',
+		'MEMORY_BY_THREAD_BY_CURRENT_BYTES',
+		'MEMORY_BY_HOST_BY_CURRENT_BYTES',
+		'LOG_STATUS',
+		'LATEST_FILE_IO',
+		'KEY_COLUMN_USAGE',
+		'KEYWORDS',
+		'KEYRING_KEYS',
+		'IO_GLOBAL_BY_WAIT_BY_LATENCY',
+		'IO_GLOBAL_BY_WAIT_BY_BYTES',
+		'IO_GLOBAL_BY_FILE_BY_LATENCY',
+		'IO_GLOBAL_BY_FILE_BY_BYTES',
+		'IO_BY_THREAD_BY_LATENCY',
+		'INNODB_VIRTUAL',
+		'INNODB_TRX',
+		'INNODB_TEMP_TABLE_INFO',
+		'INNODB_TABLE_STATS',
+		'INNODB_TABLESTATS',
+		'INNODB_TABLESPACES_BRIEF',
+		'INNODB_TABLESPACES',
+		'INNODB_TABLES',
+		'INNODB_SESSION_TEMP_TABLESPACES',
+		'INNODB_METRICS',
+		'INNODB_LOCK_WAITS',
+		'INNODB_INDEX_STATS',
+		'INNODB_INDEXES',
+		'INNODB_FT_INDEX_TABLE',
+		'INNODB_FT_INDEX_CACHE',
+		'INNODB_FT_DELETED',
+		'INNODB_FT_DEFAULT_STOPWORD',
+		'INNODB_FT_CONFIG',
+		'INNODB_FT_BEING_DELETED',
+		'INNODB_FOREIGN_COLS',
+		'INNODB_FOREIGN',
+		'INNODB_FIELDS',
+		'INNODB_DATAFILES',
+		'INNODB_COLUMNS',
+		'INNODB_CMP_RESET',
+		'INNODB_CMP_PER_INDEX_RESET',
+		'INNODB_CMP_PER_INDEX',
+		'INNODB_CMPMEM_RESET',
+		'INNODB_CMPMEM',
+		'INNODB_CMP',
+		'INNODB_CACHED_INDEXES',
+		'INNODB_BUFFER_STATS_BY_TABLE',
+		'INNODB_BUFFER_STATS_BY_SCHEMA',
+		'INNODB_BUFFER_POOL_STATS',
+		'INNODB_BUFFER_PAGE_LRU',
+		'INNODB_BUFFER_PAGE',
+		'HOST_SUMMARY_BY_STATEMENT_TYPE',
+		'HOST_SUMMARY_BY_STATEMENT_LATENCY',
+		'HOST_SUMMARY_BY_STAGES',
+		'HOST_SUMMARY_BY_FILE_IO_TYPE',
+		'HOST_SUMMARY_BY_FILE_IO',
+		'HOST_SUMMARY',
+		'HOST_CACHE',
+		'HOSTS',
+		'HELP_TOPIC',
+		'HELP_RELATION',
+		'HELP_KEYWORD',
+		'HELP_CATEGORY',
+		'GTID_EXECUTED',
+		'GLOBAL_VARIABLES',
+		'GLOBAL_STATUS',
+		'GLOBAL_GRANTS',
+		'GENERAL_LOG',
+		'FUNC',
+		'FILE_SUMMARY_BY_INSTANCE',
+		'FILE_SUMMARY_BY_EVENT_NAME',
+		'FILE_INSTANCES',
+		'FILES',
+		'EVENTS_WAITS_SUMMARY_GLOBAL_BY_EVENT_NAME',
+		'EVENTS_WAITS_SUMMARY_BY_USER_BY_EVENT_NAME',
+		'EVENTS_WAITS_SUMMARY_BY_THREAD_BY_EVENT_NAME',
+		'EVENTS_WAITS_SUMMARY_BY_INSTANCE',
+		'EVENTS_WAITS_SUMMARY_BY_HOST_BY_EVENT_NAME',
+		'EVENTS_WAITS_SUMMARY_BY_ACCOUNT_BY_EVENT_NAME',
+		'EVENTS_WAITS_HISTORY_LONG',
+		'EVENTS_WAITS_HISTORY',
+		'EVENTS_WAITS_CURRENT',
+		'EVENTS_TRANSACTIONS_SUMMARY_GLOBAL_BY_EVENT_NAME',
+		'EVENTS_TRANSACTIONS_SUMMARY_BY_USER_BY_EVENT_NAME',
+		'EVENTS_TRANSACTIONS_SUMMARY_BY_THREAD_BY_EVENT_NAME',
+		'EVENTS_TRANSACTIONS_SUMMARY_BY_HOST_BY_EVENT_NAME',
+		'EVENTS_TRANSACTIONS_SUMMARY_BY_ACCOUNT_BY_EVENT_NAME',
+		'EVENTS_TRANSACTIONS_HISTORY_LONG',
+		'EVENTS_TRANSACTIONS_HISTORY',
+		'EVENTS_TRANSACTIONS_CURRENT',
+		'EVENTS_STATEMENTS_SUMMARY_GLOBAL_BY_EVENT_NAME',
+		'EVENTS_STATEMENTS_SUMMARY_BY_USER_BY_EVENT_NAME',
+		'EVENTS_STATEMENTS_SUMMARY_BY_THREAD_BY_EVENT_NAME',
+		'EVENTS_STATEMENTS_SUMMARY_BY_PROGRAM',
+		'EVENTS_STATEMENTS_SUMMARY_BY_HOST_BY_EVENT_NAME',
+		'EVENTS_STATEMENTS_SUMMARY_BY_DIGEST',
+		'EVENTS_STATEMENTS_SUMMARY_BY_ACCOUNT_BY_EVENT_NAME',
+		'EVENTS_STATEMENTS_HISTORY_LONG',
+		'EVENTS_STATEMENTS_HISTORY',
+		'EVENTS_STATEMENTS_HISTOGRAM_GLOBAL',
+		'EVENTS_STATEMENTS_HISTOGRAM_BY_DIGEST',
+		'EVENTS_STATEMENTS_CURRENT',
+		'EVENTS_STAGES_SUMMARY_GLOBAL_BY_EVENT_NAME',
+		'EVENTS_STAGES_SUMMARY_BY_USER_BY_EVENT_NAME',
+		'EVENTS_STAGES_SUMMARY_BY_THREAD_BY_EVENT_NAME',
+		'EVENTS_STAGES_SUMMARY_BY_HOST_BY_EVENT_NAME',
+		'EVENTS_STAGES_SUMMARY_BY_ACCOUNT_BY_EVENT_NAME',
+		'EVENTS_STAGES_HISTORY_LONG',
+		'EVENTS_STAGES_HISTORY',
+		'EVENTS_STAGES_CURRENT',
+		'EVENTS_ERRORS_SUMMARY_GLOBAL_BY_ERROR',
+		'EVENTS_ERRORS_SUMMARY_BY_USER_BY_ERROR',
+		'EVENTS_ERRORS_SUMMARY_BY_THREAD_BY_ERROR',
+		'EVENTS_ERRORS_SUMMARY_BY_HOST_BY_ERROR',
+		'EVENTS_ERRORS_SUMMARY_BY_ACCOUNT_BY_ERROR',
+		'EVENTS',
+		'ENGINE_COST',
+		'ENGINES',
+		'DEFAULT_ROLES',
+		'DB',
+		'DATA_LOCK_WAITS',
+		'DATA_LOCKS',
+		'COND_INSTANCES',
+		'COMPONENT',
+		'COLUMN_STATISTICS',
+		'COLUMN_PRIVILEGES',
+		'COLUMNS_PRIV',
+		'COLUMNS',
+		'COLLATION_CHARACTER_SET_APPLICABILITY',
+		'COLLATIONS',
+		'CHECK_CONSTRAINTS',
+		'CHARACTER_SETS',
+		'ACCOUNTS',
+	)),
+	('SYSCOL', (
+		'ZIP_PAGE_SIZE',
+		'YOUNG_MAKE_PER_THOUSAND_GETS',
+		'XID_GTRID',
+		'XID_FORMAT_ID',
+		'XID_BQUAL',
+		'XA_STATE',
+		'XA',
+		'X509_SUBJECT',
+		'X509_ISSUER',
+		'WRITE_PCT',
+		'WRITE_LOCKED_BY_THREAD_ID',
+		'WRITE_LATENCY',
+		'WRAPPER',
+		'WORK_ESTIMATED',
+		'WORK_COMPLETED',
+		'WORKER_ID',
+		'WORD',
+		'WITH_GRANT_OPTION',
+		'WITH_GRANT',
+		'WITH_ADMIN_OPTION',
+		'WARN_COUNT',
+		'WARNING_PCT',
+		'WARNINGS',
+		'WAIT_STARTED',
+		'WAIT_AGE_SECS',
+		'WAIT_AGE',
+		'WAITING_TRX_STARTED',
+		'WAITING_TRX_ROWS_MODIFIED',
+		'WAITING_TRX_ROWS_LOCKED',
+		'WAITING_TRX_ID',
+		'WAITING_TRX_AGE',
+		'WAITING_THREAD_ID',
+		'WAITING_QUERY_SECS',
+		'WAITING_QUERY_ROWS_EXAMINED',
+		'WAITING_QUERY_ROWS_AFFECTED',
+		'WAITING_QUERY',
+		'WAITING_PID',
+		'WAITING_LOCK_TYPE',
+		'WAITING_LOCK_MODE',
+		'WAITING_LOCK_ID',
+		'WAITING_LOCK_DURATION',
+		'WAITING_ACCOUNT',
+		'VOLATILITY',
+		'VIEW_SCHEMA',
+		'VIEW_NAME',
+		'VIEW_ID',
+		'VIEW_DEFINITION',
+		'VIEW_CATALOG',
+		'VERSION',
+		'VCPU_IDS',
+		'VARIABLE_VALUE',
+		'VARIABLE_SOURCE',
+		'VARIABLE_PATH',
+		'VARIABLE_NAME',
+		'VARIABLE',
+		'VALUE',
+		'UUID',
+		'USE_LEAP_SECONDS',
+		'USER_PASSWORD',
+		'USER_NAME',
+		'USER_HOST',
+		'USER_ATTRIBUTES',
+		'USERNAME',
+		'USER',
+		'URL',
+		'UPDATE_TIME',
+		'UPDATE_RULE',
+		'UPDATE_PRIV',
+		'UPDATE_LATENCY',
+		'UPDATE_COUNT',
+		'UNIT_TYPE',
+		'UNIT_NAME',
+		'UNIQUE_USERS',
+		'UNIQUE_HOSTS',
+		'UNIQUE_CONSTRAINT_SCHEMA',
+		'UNIQUE_CONSTRAINT_NAME',
+		'UNIQUE_CONSTRAINT_CATALOG',
+		'UNCOMPRESS_TOTAL',
+		'UNCOMPRESS_TIME',
+		'UNCOMPRESS_OPS',
+		'UNCOMPRESS_CURRENT',
+		'UDF_USAGE_COUNT',
+		'UDF_TYPE',
+		'UDF_RETURN_TYPE',
+		'UDF_NAME',
+		'UDF_LIBRARY',
+		'TYPE',
+		'TRX_WEIGHT',
+		'TRX_WAIT_STARTED',
+		'TRX_UNIQUE_CHECKS',
+		'TRX_TABLES_LOCKED',
+		'TRX_TABLES_IN_USE',
+		'TRX_STATE',
+		'TRX_STARTED',
+		'TRX_ROWS_MODIFIED',
+		'TRX_ROWS_LOCKED',
+		'TRX_REQUESTED_LOCK_ID',
+		'TRX_QUERY',
+		'TRX_OPERATION_STATE',
+		'TRX_MYSQL_THREAD_ID',
+		'TRX_LOCK_STRUCTS',
+		'TRX_LOCK_MEMORY_BYTES',
+		'TRX_LATENCY',
+		'TRX_LAST_FOREIGN_KEY_ERROR',
+		'TRX_IS_READ_ONLY',
+		'TRX_ISOLATION_LEVEL',
+		'TRX_ID',
+		'TRX_FOREIGN_KEY_CHECKS',
+		'TRX_CONCURRENCY_TICKETS',
+		'TRX_AUTOCOMMIT_NON_LOCKING',
+		'TRX_AUTOCOMMIT',
+		'TRX_ADAPTIVE_HASH_TIMEOUT',
+		'TRX_ADAPTIVE_HASH_LATCHED',
+		'TRIGGER_SCHEMA',
+		'TRIGGER_PRIV',
+		'TRIGGER_NAME',
+		'TRIGGER_CATALOG',
+		'TRANSITION_TYPE_ID',
+		'TRANSITION_TIME',
+		'TRANSACTION_COUNTER',
+		'TRANSACTIONS_COMMITTED_ALL_MEMBERS',
+		'TRANSACTIONS',
+		'TRACE',
+		'TO_USER',
+		'TO_HOST',
+		'TOTAL_WRITTEN',
+		'TOTAL_REQUESTED',
+		'TOTAL_READ',
+		'TOTAL_MEMORY_ALLOCATED',
+		'TOTAL_LATENCY',
+		'TOTAL_EXTENTS',
+		'TOTAL_CONNECTIONS',
+		'TOTAL_ALLOCATED',
+		'TOTAL',
+		'TMP_TABLES_TO_DISK_PCT',
+		'TMP_TABLES',
+		'TMP_DISK_TABLES',
+		'TLS_VERSION',
+		'TIME_ZONE_ID',
+		'TIME_ZONE',
+		'TIME_RESET',
+		'TIME_ENABLED',
+		'TIME_ELAPSED',
+		'TIME_DISABLED',
+		'TIMESTAMP',
+		'TIMER_WAIT',
+		'TIMER_START',
+		'TIMER_RESOLUTION',
+		'TIMER_PREPARE',
+		'TIMER_OVERHEAD',
+		'TIMER_NAME',
+		'TIMER_FREQUENCY',
+		'TIMER_END',
+		'TIMED',
+		'TIME',
+		'THREAD_PRIORITY',
+		'THREAD_OS_ID',
+		'THREAD_ID',
+		'THREAD',
+		'THD_ID',
+		'TABLE_TYPE',
+		'TABLE_SCHEMA',
+		'TABLE_SCANS',
+		'TABLE_ROWS',
+		'TABLE_PRIV',
+		'TABLE_NAME',
+		'TABLE_ID',
+		'TABLE_COMMENT',
+		'TABLE_COLLATION',
+		'TABLE_CATALOG',
+		'TABLESPACE_TYPE',
+		'TABLESPACE_NAME',
+		'TABLESPACE_COMMENT',
+		'SYS_VERSION',
+		'SWAPS',
+		'SUPPORT',
+		'SUPER_PRIV',
+		'SUM_WARNINGS',
+		'SUM_TIMER_WRITE_NORMAL',
+		'SUM_TIMER_WRITE_LOW_PRIORITY',
+		'SUM_TIMER_WRITE_EXTERNAL',
+		'SUM_TIMER_WRITE_CONCURRENT_INSERT',
+		'SUM_TIMER_WRITE_ALLOW_WRITE',
+		'SUM_TIMER_WRITE',
+		'SUM_TIMER_WAIT',
+		'SUM_TIMER_UPDATE',
+		'SUM_TIMER_READ_WRITE',
+		'SUM_TIMER_READ_WITH_SHARED_LOCKS',
+		'SUM_TIMER_READ_ONLY',
+		'SUM_TIMER_READ_NO_INSERT',
+		'SUM_TIMER_READ_NORMAL',
+		'SUM_TIMER_READ_HIGH_PRIORITY',
+		'SUM_TIMER_READ_EXTERNAL',
+		'SUM_TIMER_READ',
+		'SUM_TIMER_MISC',
+		'SUM_TIMER_INSERT',
+		'SUM_TIMER_FETCH',
+		'SUM_TIMER_EXECUTE',
+		'SUM_TIMER_DELETE',
+		'SUM_STATEMENTS_WAIT',
+		'SUM_SORT_SCAN',
+		'SUM_SORT_ROWS',
+		'SUM_SORT_RANGE',
+		'SUM_SORT_MERGE_PASSES',
+		'SUM_SELECT_SCAN',
+		'SUM_SELECT_RANGE_CHECK',
+		'SUM_SELECT_RANGE',
+		'SUM_SELECT_FULL_RANGE_JOIN',
+		'SUM_SELECT_FULL_JOIN',
+		'SUM_ROWS_SENT',
+		'SUM_ROWS_EXAMINED',
+		'SUM_ROWS_AFFECTED',
+		'SUM_OF_OTHER_INDEX_SIZES',
+		'SUM_NUMBER_OF_BYTES_WRITE',
+		'SUM_NUMBER_OF_BYTES_READ',
+		'SUM_NUMBER_OF_BYTES_FREE',
+		'SUM_NUMBER_OF_BYTES_ALLOC',
+		'SUM_NO_INDEX_USED',
+		'SUM_NO_GOOD_INDEX_USED',
+		'SUM_LOCK_TIME',
+		'SUM_ERROR_RAISED',
+		'SUM_ERROR_HANDLED',
+		'SUM_ERRORS',
+		'SUM_CREATED_TMP_TABLES',
+		'SUM_CREATED_TMP_DISK_TABLES',
+		'SUM_CONNECT_ERRORS',
+		'SUB_PART',
+		'SUBSYSTEM',
+		'SUBPART_EXISTS',
+		'SUBPARTITION_ORDINAL_POSITION',
+		'SUBPARTITION_NAME',
+		'SUBPARTITION_METHOD',
+		'SUBPARTITION_EXPRESSION',
+		'STORAGE_ENGINES',
+		'STAT_VALUE',
+		'STAT_NAME',
+		'STAT_DESCRIPTION',
+		'STATUS',
+		'STATS_INITIALIZED',
+		'STATEMENT_NAME',
+		'STATEMENT_LATENCY',
+		'STATEMENT_ID',
+		'STATEMENT_AVG_LATENCY',
+		'STATEMENTS',
+		'STATEMENT',
+		'STATE',
+		'START_TIME',
+		'STARTS',
+		'SSL_VERSION',
+		'SSL_VERIFY_SERVER_CERTIFICATE',
+		'SSL_VERIFY_SERVER_CERT',
+		'SSL_TYPE',
+		'SSL_SESSIONS_REUSED',
+		'SSL_KEY',
+		'SSL_CRL_PATH',
+		'SSL_CRL_FILE',
+		'SSL_CRLPATH',
+		'SSL_CRL',
+		'SSL_CIPHER',
+		'SSL_CERTIFICATE',
+		'SSL_CERT',
+		'SSL_CA_PATH',
+		'SSL_CA_FILE',
+		'SSL_CAPATH',
+		'SSL_CA',
+		'SSL_ALLOWED',
+		'SRS_NAME',
+		'SRS_ID',
+		'SQL_TEXT',
+		'SQL_STATE',
+		'SQL_PATH',
+		'SQL_MODE',
+		'SQL_KILL_BLOCKING_QUERY',
+		'SQL_KILL_BLOCKING_CONNECTION',
+		'SQL_DROP_INDEX',
+		'SQL_DELAY',
+		'SQL_DATA_ACCESS',
+		'SPINS',
+		'SPECIFIC_SCHEMA',
+		'SPECIFIC_NAME',
+		'SPECIFIC_CATALOG',
+		'SPACE_VERSION',
+		'SPACE_TYPE',
+		'SPACE_ID',
+		'SPACE',
+		'SOURCE_UUID',
+		'SOURCE_LINE',
+		'SOURCE_FUNCTION',
+		'SOURCE_FILE',
+		'SOURCE',
+		'SORT_USING_RANGE',
+		'SORT_SCAN',
+		'SORT_ROWS',
+		'SORT_RANGE',
+		'SORT_MERGE_PASSES',
+		'SORTS_USING_SCANS',
+		'SORTLEN',
+		'SOCKET_ID',
+		'SOCKET',
+		'SIZE',
+		'SHUTDOWN_PRIV',
+		'SHOW_VIEW_PRIV',
+		'SHOW_DB_PRIV',
+		'SET_USER',
+		'SET_TIME',
+		'SET_HOST',
+		'SET_BY',
+		'SERVICE_STATE',
+		'SERVER_VERSION',
+		'SERVER_UUID',
+		'SERVER_NAME',
+		'SERVER_ID',
+		'SEQ_IN_INDEX',
+		'SEQ',
+		'SELECT_SCAN',
+		'SELECT_RANGE_CHECK',
+		'SELECT_RANGE',
+		'SELECT_PRIV',
+		'SELECT_LATENCY',
+		'SELECT_FULL_RANGE_JOIN',
+		'SELECT_FULL_JOIN',
+		'SECURITY_TYPE',
+		'SCHEMA_NAME',
+		'SAVEPOINTS',
+		'SAMPLE_SIZE',
+		'ROW_FORMAT',
+		'ROWS_UPDATED',
+		'ROWS_SORTED',
+		'ROWS_SENT_AVG',
+		'ROWS_SENT',
+		'ROWS_SELECTED',
+		'ROWS_INSERTED',
+		'ROWS_FULL_SCANNED',
+		'ROWS_FETCHED',
+		'ROWS_EXAMINED_AVG',
+		'ROWS_EXAMINED',
+		'ROWS_DELETED',
+		'ROWS_CACHED',
+		'ROWS_AFFECTED_AVG',
+		'ROWS_AFFECTED',
+		'ROUTINE_TYPE',
+		'ROUTINE_SCHEMA',
+		'ROUTINE_NAME',
+		'ROUTINE_DEFINITION',
+		'ROUTINE_COMMENT',
+		'ROUTINE_CATALOG',
+		'ROUTINE_BODY',
+		'ROLE',
+		'RETURNED_SQLSTATE',
+		'RETRY_COUNT',
+		'RET',
+		'RESOURCE_GROUP_TYPE',
+		'RESOURCE_GROUP_NAME',
+		'RESOURCE_GROUP_ENABLED',
+		'RESOURCE_GROUP',
+		'RESERVED',
+		'REQUESTING_THREAD_ID',
+		'REQUESTING_OBJECT_INSTANCE_BEGIN',
+		'REQUESTING_EVENT_ID',
+		'REQUESTING_ENGINE_TRANSACTION_ID',
+		'REQUESTING_ENGINE_LOCK_ID',
+		'REQUESTED',
+		'REPL_SLAVE_PRIV',
+		'REPL_CLIENT_PRIV',
+		'REPLICATION',
+		'REMAINING_DELAY',
+		'RELOCATION_TIME',
+		'RELOCATION_OPS',
+		'RELOAD_PRIV',
+		'RELAY_LOG_POS',
+		'RELAY_LOG_NAME',
+		'REF_NAME',
+		'REF_COUNT',
+		'REF_COL_NAME',
+		'REFERENCES_PRIV',
+		'REFERENCED_TABLE_SCHEMA',
+		'REFERENCED_TABLE_NAME',
+		'REFERENCED_COLUMN_NAME',
+		'REDUNDANT_INDEX_NON_UNIQUE',
+		'REDUNDANT_INDEX_NAME',
+		'REDUNDANT_INDEX_COLUMNS',
+		'RECOVER_TIME',
+		'RECEIVED_TRANSACTION_SET',
+		'READ_LOCKED_BY_COUNT',
+		'READ_LATENCY',
+		'READ_AHEAD_RATE',
+		'READ_AHEAD_EVICTED_RATE',
+		'QUEUEING_TRANSACTION_START_QUEUE_TIMESTAMP',
+		'QUEUEING_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'QUEUEING_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'QUEUEING_TRANSACTION',
+		'QUERY_TIME',
+		'QUERY_SAMPLE_TIMER_WAIT',
+		'QUERY_SAMPLE_TEXT',
+		'QUERY_SAMPLE_SEEN',
+		'QUERY_ID',
+		'QUERY',
+		'QUANTILE_999',
+		'QUANTILE_99',
+		'QUANTILE_95',
+		'PURPOSE',
+		'PUBLIC_KEY_PATH',
+		'PRTYPE',
+		'PROXIED_USER',
+		'PROXIED_HOST',
+		'PROPERTIES',
+		'PROGRESS',
+		'PROGRAM_NAME',
+		'PROC_PRIV',
+		'PROCESS_PRIV',
+		'PROCESSLIST_USER',
+		'PROCESSLIST_TIME',
+		'PROCESSLIST_STATE',
+		'PROCESSLIST_INFO',
+		'PROCESSLIST_ID',
+		'PROCESSLIST_HOST',
+		'PROCESSLIST_DB',
+		'PROCESSLIST_COMMAND',
+		'PROCESSING_TRANSACTION_START_BUFFER_TIMESTAMP',
+		'PROCESSING_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'PROCESSING_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'PROCESSING_TRANSACTION',
+		'PRIVILEGE_TYPE',
+		'PRIVILEGES',
+		'PRIV',
+		'POSITION_IN_UNIQUE_CONSTRAINT',
+		'POSITION',
+		'POS',
+		'PORT',
+		'POOL_SIZE',
+		'POOL_ID',
+		'PLUGIN_VERSION',
+		'PLUGIN_TYPE_VERSION',
+		'PLUGIN_TYPE',
+		'PLUGIN_STATUS',
+		'PLUGIN_NAME',
+		'PLUGIN_LICENSE',
+		'PLUGIN_LIBRARY_VERSION',
+		'PLUGIN_LIBRARY',
+		'PLUGIN_DESCRIPTION',
+		'PLUGIN_AUTHOR',
+		'PLUGIN',
+		'PID',
+		'PERCENTILE',
+		'PENDING_READS',
+		'PENDING_FLUSH_LRU',
+		'PENDING_FLUSH_LIST',
+		'PENDING_DECOMPRESS',
+		'PATH',
+		'PASSWORD_TIMESTAMP',
+		'PASSWORD_REUSE_TIME',
+		'PASSWORD_REUSE_HISTORY',
+		'PASSWORD_REQUIRE_CURRENT',
+		'PASSWORD_LIFETIME',
+		'PASSWORD_LAST_CHANGED',
+		'PASSWORD_EXPIRED',
+		'PASSWORD',
+		'PARTITION_ORDINAL_POSITION',
+		'PARTITION_NAME',
+		'PARTITION_METHOD',
+		'PARTITION_EXPRESSION',
+		'PARTITION_DESCRIPTION',
+		'PARTITION_COMMENT',
+		'PARENT_THREAD_ID',
+		'PARENT_CATEGORY_ID',
+		'PARAMETER_STYLE',
+		'PARAMETER_NAME',
+		'PARAMETER_MODE',
+		'PAGE_TYPE',
+		'PAGE_STATE',
+		'PAGE_SIZE',
+		'PAGE_NUMBER',
+		'PAGE_NO',
+		'PAGE_FAULTS_MINOR',
+		'PAGE_FAULTS_MAJOR',
+		'PAGES_WRITTEN_RATE',
+		'PAGES_USED',
+		'PAGES_READ_RATE',
+		'PAGES_OLD',
+		'PAGES_NOT_MADE_YOUNG',
+		'PAGES_MADE_YOUNG_RATE',
+		'PAGES_MADE_YOUNG',
+		'PAGES_MADE_NOT_YOUNG_RATE',
+		'PAGES_HASHED',
+		'PAGES_FREE',
+		'PAGES_CREATE_RATE',
+		'PAGES',
+		'PAD_ATTRIBUTE',
+		'PACKED',
+		'OWNER_THREAD_ID',
+		'OWNER_OBJECT_TYPE',
+		'OWNER_OBJECT_SCHEMA',
+		'OWNER_OBJECT_NAME',
+		'OWNER_EVENT_ID',
+		'OWNER',
+		'OTHER_INDEX_SIZE',
+		'ORIGINATOR',
+		'ORGANIZATION_COORDSYS_ID',
+		'ORGANIZATION',
+		'ORDINAL_POSITION',
+		'OPERATION',
+		'OPEN_COUNT',
+		'ON_COMPLETION',
+		'OLD_DATABASE_PAGES',
+		'OLDEST_MODIFICATION',
+		'OFFSET',
+		'OBJECT_TYPE',
+		'OBJECT_SCHEMA',
+		'OBJECT_NAME',
+		'OBJECT_INSTANCE_BEGIN',
+		'N_ROWS',
+		'N_FIELDS',
+		'N_COLS',
+		'N_CACHED_PAGES',
+		'NUM_ROWS',
+		'NUMERIC_SCALE',
+		'NUMERIC_PRECISION',
+		'NUMBER_RECORDS',
+		'NUMBER_READ_AHEAD_EVICTED',
+		'NUMBER_PAGES_WRITTEN',
+		'NUMBER_PAGES_READ_AHEAD',
+		'NUMBER_PAGES_READ',
+		'NUMBER_PAGES_GET',
+		'NUMBER_PAGES_CREATED',
+		'NUMBER_OF_WORKERS',
+		'NUMBER_OF_SAVEPOINTS',
+		'NUMBER_OF_ROLLBACK_TO_SAVEPOINT',
+		'NUMBER_OF_RELEASE_SAVEPOINT',
+		'NUMBER_OF_LINES',
+		'NUMBER_OF_BYTES',
+		'NULLABLE',
+		'NO_INDEX_USED_PCT',
+		'NO_INDEX_USED_COUNT',
+		'NO_INDEX_USED',
+		'NO_GOOD_INDEX_USED_COUNT',
+		'NO_GOOD_INDEX_USED',
+		'NOT_YOUNG_MAKE_PER_THOUSAND_GETS',
+		'NON_UNIQUE',
+		'NODEGROUP_ID',
+		'NODEGROUP',
+		'NEWEST_MODIFICATION',
+		'NETWORK_NAMESPACE',
+		'NETWORK_INTERFACE',
+		'NESTING_EVENT_TYPE',
+		'NESTING_EVENT_LEVEL',
+		'NESTING_EVENT_ID',
+		'NAME',
+		'MYSQL_VERSION',
+		'MYSQL_ERRNO',
+		'MTYPE',
+		'MODIFIED_DATABASE_PAGES',
+		'MODIFIED_COUNTER',
+		'MISSING_BYTES_BEYOND_MAX_MEM_SIZE',
+		'MISC_LATENCY',
+		'MIN_VALUE',
+		'MIN_TIMER_WRITE_NORMAL',
+		'MIN_TIMER_WRITE_LOW_PRIORITY',
+		'MIN_TIMER_WRITE_EXTERNAL',
+		'MIN_TIMER_WRITE_CONCURRENT_INSERT',
+		'MIN_TIMER_WRITE_ALLOW_WRITE',
+		'MIN_TIMER_WRITE',
+		'MIN_TIMER_WAIT',
+		'MIN_TIMER_UPDATE',
+		'MIN_TIMER_READ_WRITE',
+		'MIN_TIMER_READ_WITH_SHARED_LOCKS',
+		'MIN_TIMER_READ_ONLY',
+		'MIN_TIMER_READ_NO_INSERT',
+		'MIN_TIMER_READ_NORMAL',
+		'MIN_TIMER_READ_HIGH_PRIORITY',
+		'MIN_TIMER_READ_EXTERNAL',
+		'MIN_TIMER_READ',
+		'MIN_TIMER_MISC',
+		'MIN_TIMER_INSERT',
+		'MIN_TIMER_FETCH',
+		'MIN_TIMER_EXECUTE',
+		'MIN_TIMER_DELETE',
+		'MIN_STATEMENTS_WAIT',
+		'MIN_LATENCY',
+		'MIN_COUNT_RESET',
+		'MIN_COUNT',
+		'MESSAGE_TEXT',
+		'MESSAGES_SENT',
+		'MESSAGES_RECEIVED',
+		'MERGE_THRESHOLD',
+		'MEMORY_TMP_TABLES',
+		'MEMBER_VERSION',
+		'MEMBER_STATE',
+		'MEMBER_ROLE',
+		'MEMBER_PORT',
+		'MEMBER_ID',
+		'MEMBER_HOST',
+		'MAX_VALUE',
+		'MAX_USER_CONNECTIONS',
+		'MAX_UPDATES',
+		'MAX_TIMER_WRITE_NORMAL',
+		'MAX_TIMER_WRITE_LOW_PRIORITY',
+		'MAX_TIMER_WRITE_EXTERNAL',
+		'MAX_TIMER_WRITE_CONCURRENT_INSERT',
+		'MAX_TIMER_WRITE_ALLOW_WRITE',
+		'MAX_TIMER_WRITE',
+		'MAX_TIMER_WAIT',
+		'MAX_TIMER_UPDATE',
+		'MAX_TIMER_READ_WRITE',
+		'MAX_TIMER_READ_WITH_SHARED_LOCKS',
+		'MAX_TIMER_READ_ONLY',
+		'MAX_TIMER_READ_NO_INSERT',
+		'MAX_TIMER_READ_NORMAL',
+		'MAX_TIMER_READ_HIGH_PRIORITY',
+		'MAX_TIMER_READ_EXTERNAL',
+		'MAX_TIMER_READ',
+		'MAX_TIMER_MISC',
+		'MAX_TIMER_INSERT',
+		'MAX_TIMER_FETCH',
+		'MAX_TIMER_EXECUTE',
+		'MAX_TIMER_DELETE',
+		'MAX_STATEMENTS_WAIT',
+		'MAX_QUESTIONS',
+		'MAX_LATENCY',
+		'MAX_DATA_LENGTH',
+		'MAX_COUNT_RESET',
+		'MAX_COUNT',
+		'MAX_CONNECTIONS',
+		'MAXLEN',
+		'MAXIMUM_SIZE',
+		'MATCH_OPTION',
+		'MASTER_LOG_POS',
+		'MASTER_LOG_NAME',
+		'LRU_POSITION',
+		'LRU_IO_TOTAL',
+		'LRU_IO_CURRENT',
+		'LOW_NUMBER_OF_BYTES_USED',
+		'LOW_COUNT_USED',
+		'LOGFILE_GROUP_NUMBER',
+		'LOGFILE_GROUP_NAME',
+		'LOCK_TYPE',
+		'LOCK_TIME',
+		'LOCK_TABLES_PRIV',
+		'LOCK_STATUS',
+		'LOCK_MODE',
+		'LOCK_LATENCY',
+		'LOCK_DURATION',
+		'LOCK_DATA',
+		'LOCKED_TYPE',
+		'LOCKED_TABLE_SUBPARTITION',
+		'LOCKED_TABLE_SCHEMA',
+		'LOCKED_TABLE_PARTITION',
+		'LOCKED_TABLE_NAME',
+		'LOCKED_TABLE',
+		'LOCKED_INDEX',
+		'LOCKED_BY_THREAD_ID',
+		'LOCAL',
+		'LOAD_OPTION',
+		'LEN',
+		'LATENCY',
+		'LAST_WAIT_LATENCY',
+		'LAST_WAIT',
+		'LAST_UPDATE_TIME',
+		'LAST_UPDATE',
+		'LAST_STATEMENT_LATENCY',
+		'LAST_STATEMENT',
+		'LAST_SEEN',
+		'LAST_QUEUED_TRANSACTION_START_QUEUE_TIMESTAMP',
+		'LAST_QUEUED_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'LAST_QUEUED_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'LAST_QUEUED_TRANSACTION_END_QUEUE_TIMESTAMP',
+		'LAST_QUEUED_TRANSACTION',
+		'LAST_PROCESSED_TRANSACTION_START_BUFFER_TIMESTAMP',
+		'LAST_PROCESSED_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'LAST_PROCESSED_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'LAST_PROCESSED_TRANSACTION_END_BUFFER_TIMESTAMP',
+		'LAST_PROCESSED_TRANSACTION',
+		'LAST_INSERT_ID',
+		'LAST_HEARTBEAT_TIMESTAMP',
+		'LAST_EXECUTED',
+		'LAST_ERROR_TIMESTAMP',
+		'LAST_ERROR_SEEN',
+		'LAST_ERROR_NUMBER',
+		'LAST_ERROR_MESSAGE',
+		'LAST_DOC_ID',
+		'LAST_CONFLICT_FREE_TRANSACTION',
+		'LAST_APPLIED_TRANSACTION_START_APPLY_TIMESTAMP',
+		'LAST_APPLIED_TRANSACTION_RETRIES_COUNT',
+		'LAST_APPLIED_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'LAST_APPLIED_TRANSACTION_LAST_TRANSIENT_ERROR_TIMESTAMP',
+		'LAST_APPLIED_TRANSACTION_LAST_TRANSIENT_ERROR_NUMBER',
+		'LAST_APPLIED_TRANSACTION_LAST_TRANSIENT_ERROR_MESSAGE',
+		'LAST_APPLIED_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'LAST_APPLIED_TRANSACTION_END_APPLY_TIMESTAMP',
+		'LAST_APPLIED_TRANSACTION',
+		'LAST_ALTERED',
+		'LAST_ACCESS_TIME',
+		'KEY_OWNER',
+		'KEY_ID',
+		'KEY',
+		'IS_VISIBLE',
+		'IS_UPDATABLE',
+		'IS_UNSIGNED',
+		'IS_SIGNED',
+		'IS_OLD',
+		'IS_NULLABLE',
+		'IS_HASHED',
+		'IS_GRANTABLE',
+		'IS_DST',
+		'IS_DETERMINISTIC',
+		'IS_DEFAULT',
+		'IS_COMPILED',
+		'ISOLATION_LEVEL',
+		'IP',
+		'IO_WRITE_REQUESTS',
+		'IO_WRITE_LATENCY',
+		'IO_WRITE',
+		'IO_READ_REQUESTS',
+		'IO_READ_LATENCY',
+		'IO_READ',
+		'IO_MISC_REQUESTS',
+		'IO_MISC_LATENCY',
+		'IO_LATENCY',
+		'IO_FIX',
+		'IOS',
+		'INTERVAL_VALUE',
+		'INTERVAL_START',
+		'INTERVAL_FIELD',
+		'INTERVAL_END',
+		'INTERNAL_LOCK',
+		'INSUFFICIENT_PRIVILEGES',
+		'INSTRUMENTED',
+		'INSTANT_COLS',
+		'INSERT_PRIV',
+		'INSERT_LATENCY',
+		'INSERT_ID',
+		'INNODB_BUFFER_ROWS_CACHED',
+		'INNODB_BUFFER_PAGES_OLD',
+		'INNODB_BUFFER_PAGES_HASHED',
+		'INNODB_BUFFER_PAGES',
+		'INNODB_BUFFER_FREE',
+		'INNODB_BUFFER_DATA',
+		'INNODB_BUFFER_ALLOCATED',
+		'INITIAL_SIZE',
+		'INFO',
+		'INDEX_TYPE',
+		'INDEX_SCHEMA',
+		'INDEX_PRIV',
+		'INDEX_NAME',
+		'INDEX_LENGTH',
+		'INDEX_ID',
+		'INDEX_COMMENT',
+		'INDEX_COLUMNS',
+		'IGNORED_SERVER_IDS',
+		'ID',
+		'HOST_VALIDATED',
+		'HOST',
+		'HIT_RATE',
+		'HISTORY',
+		'HISTOGRAM',
+		'HIGH_NUMBER_OF_BYTES_USED',
+		'HIGH_COUNT_USED',
+		'HIGH_COUNT',
+		'HIGH_AVG_ALLOC',
+		'HIGH_ALLOC',
+		'HELP_TOPIC_ID',
+		'HELP_KEYWORD_ID',
+		'HELP_CATEGORY_ID',
+		'HEARTBEAT_INTERVAL',
+		'HEARTBEAT',
+		'HAS_DEFAULT',
+		'GTID',
+		'GROUP_NAME',
+		'GRANT_PRIV',
+		'GRANTOR',
+		'GRANTEE',
+		'GET_PUBLIC_KEY',
+		'GEOMETRY_TYPE_NAME',
+		'GENERATION_EXPRESSION',
+		'FULL_SCANS',
+		'FULL_SCAN',
+		'FULLTEXT_KEYS',
+		'FS_BLOCK_SIZE',
+		'FROM_USER',
+		'FROM_HOST',
+		'FREE_PAGE_CLOCK',
+		'FREE_EXTENTS',
+		'FREE_BUFFERS',
+		'FOR_NAME',
+		'FOR_COL_NAME',
+		'FLUSH_TYPE',
+		'FLAGS',
+		'FLAG',
+		'FIX_COUNT',
+		'FIRST_SEEN',
+		'FIRST_ERROR_SEEN',
+		'FIRST_DOC_ID',
+		'FILTER_RULE',
+		'FILTER_NAME',
+		'FILE_TYPE',
+		'FILE_SIZE',
+		'FILE_PRIV',
+		'FILE_NAME',
+		'FILE_IO_LATENCY',
+		'FILE_IOS',
+		'FILE_ID',
+		'FILE',
+		'FETCH_LATENCY',
+		'EXTRA',
+		'EXTERNAL_NAME',
+		'EXTERNAL_LOCK',
+		'EXTERNAL_LANGUAGE',
+		'EXTENT_SIZE',
+		'EXPRESSION',
+		'EXEC_COUNT',
+		'EXECUTE_PRIV',
+		'EXECUTE_AT',
+		'EXAMPLE',
+		'EVENT_TYPE',
+		'EVENT_TIME',
+		'EVENT_SCHEMA',
+		'EVENT_PRIV',
+		'EVENT_OBJECT_TABLE',
+		'EVENT_OBJECT_SCHEMA',
+		'EVENT_OBJECT_CATALOG',
+		'EVENT_NAME',
+		'EVENT_MANIPULATION',
+		'EVENT_ID',
+		'EVENT_DEFINITION',
+		'EVENT_COMMENT',
+		'EVENT_CLASS',
+		'EVENT_CATALOG',
+		'EVENT_BODY',
+		'EVENTS',
+		'EVENT',
+		'ERR_COUNT',
+		'ERROR_PCT',
+		'ERROR_NUMBER',
+		'ERROR_NAME',
+		'ERRORS',
+		'ENGINE_TRANSACTION_ID',
+		'ENGINE_NAME',
+		'ENGINE_LOCK_ID',
+		'ENGINE',
+		'ENFORCED',
+		'END_EVENT_ID',
+		'ENDS',
+		'ENCRYPTION',
+		'ENABLED_SSL',
+		'ENABLED_AUTO_POSITION',
+		'ENABLED',
+		'DURATION',
+		'DTD_IDENTIFIER',
+		'DROP_ROLE_PRIV',
+		'DROP_PRIV',
+		'DOMINANT_INDEX_NON_UNIQUE',
+		'DOMINANT_INDEX_NAME',
+		'DOMINANT_INDEX_COLUMNS',
+		'DOC_ID',
+		'DOC_COUNT',
+		'DOCUMENTATION',
+		'DL',
+		'DISK_TMP_TABLES',
+		'DIGEST_TEXT',
+		'DIGEST',
+		'DEVICE_TYPE',
+		'DESIRED_DELAY',
+		'DESCRIPTION',
+		'DELETE_RULE',
+		'DELETE_PRIV',
+		'DELETE_LATENCY',
+		'DELETED_ROWS',
+		'DEFINITION',
+		'DEFINER',
+		'DEFAULT_VALUE',
+		'DEFAULT_ROLE_USER',
+		'DEFAULT_ROLE_HOST',
+		'DEFAULT_ENCRYPTION',
+		'DEFAULT_COLLATION_NAME',
+		'DEFAULT_COLLATE_NAME',
+		'DEFAULT_CHARACTER_SET_NAME',
+		'DB',
+		'DATETIME_PRECISION',
+		'DATA_TYPE',
+		'DATA_SIZE',
+		'DATA_LENGTH',
+		'DATA_FREE',
+		'DATABASE_PAGES',
+		'DATABASE_NAME',
+		'DATABASE_COLLATION',
+		'DATA',
+		'CURRENT_STATEMENT',
+		'CURRENT_SCHEMA',
+		'CURRENT_NUMBER_OF_BYTES_USED',
+		'CURRENT_MEMORY',
+		'CURRENT_MAX_ALLOC',
+		'CURRENT_COUNT_USED',
+		'CURRENT_COUNT',
+		'CURRENT_CONNECTIONS',
+		'CURRENT_AVG_ALLOC',
+		'CURRENT_ALLOCATED',
+		'CURRENT_ALLOC',
+		'CREATION_TIME',
+		'CREATE_VIEW_PRIV',
+		'CREATE_USER_PRIV',
+		'CREATE_TMP_TABLE_PRIV',
+		'CREATE_TIME',
+		'CREATE_TABLESPACE_PRIV',
+		'CREATE_ROUTINE_PRIV',
+		'CREATE_ROLE_PRIV',
+		'CREATE_PRIV',
+		'CREATE_OPTIONS',
+		'CREATED_TMP_TABLES',
+		'CREATED_TMP_DISK_TABLES',
+		'CREATED',
+		'CPU_USER',
+		'CPU_SYSTEM',
+		'COUNT_WRITE_NORMAL',
+		'COUNT_WRITE_LOW_PRIORITY',
+		'COUNT_WRITE_EXTERNAL',
+		'COUNT_WRITE_CONCURRENT_INSERT',
+		'COUNT_WRITE_ALLOW_WRITE',
+		'COUNT_WRITE',
+		'COUNT_UPDATE',
+		'COUNT_UNKNOWN_ERRORS',
+		'COUNT_TRANSACTIONS_ROWS_VALIDATING',
+		'COUNT_TRANSACTIONS_RETRIES',
+		'COUNT_TRANSACTIONS_REMOTE_IN_APPLIER_QUEUE',
+		'COUNT_TRANSACTIONS_REMOTE_APPLIED',
+		'COUNT_TRANSACTIONS_LOCAL_ROLLBACK',
+		'COUNT_TRANSACTIONS_LOCAL_PROPOSED',
+		'COUNT_TRANSACTIONS_IN_QUEUE',
+		'COUNT_TRANSACTIONS_CHECKED',
+		'COUNT_STATEMENTS',
+		'COUNT_STAR',
+		'COUNT_SSL_ERRORS',
+		'COUNT_RESET',
+		'COUNT_REPREPARE',
+		'COUNT_RECEIVED_HEARTBEATS',
+		'COUNT_READ_WRITE',
+		'COUNT_READ_WITH_SHARED_LOCKS',
+		'COUNT_READ_ONLY',
+		'COUNT_READ_NO_INSERT',
+		'COUNT_READ_NORMAL',
+		'COUNT_READ_HIGH_PRIORITY',
+		'COUNT_READ_EXTERNAL',
+		'COUNT_READ',
+		'COUNT_PROXY_USER_ERRORS',
+		'COUNT_PROXY_USER_ACL_ERRORS',
+		'COUNT_NO_AUTH_PLUGIN_ERRORS',
+		'COUNT_NAMEINFO_TRANSIENT_ERRORS',
+		'COUNT_NAMEINFO_PERMANENT_ERRORS',
+		'COUNT_MISC',
+		'COUNT_MAX_USER_CONNECTIONS_PER_HOUR_ERRORS',
+		'COUNT_MAX_USER_CONNECTIONS_ERRORS',
+		'COUNT_LOCAL_ERRORS',
+		'COUNT_INSERT',
+		'COUNT_INIT_CONNECT_ERRORS',
+		'COUNT_HOST_BLOCKED_ERRORS',
+		'COUNT_HOST_ACL_ERRORS',
+		'COUNT_HANDSHAKE_ERRORS',
+		'COUNT_FREE',
+		'COUNT_FORMAT_ERRORS',
+		'COUNT_FETCH',
+		'COUNT_FCRDNS_ERRORS',
+		'COUNT_EXECUTE',
+		'COUNT_DELETE',
+		'COUNT_DEFAULT_DATABASE_ERRORS',
+		'COUNT_CONFLICTS_DETECTED',
+		'COUNT_BUCKET_AND_LOWER',
+		'COUNT_BUCKET',
+		'COUNT_AUTH_PLUGIN_ERRORS',
+		'COUNT_AUTHENTICATION_ERRORS',
+		'COUNT_ALLOC',
+		'COUNT_ADDRINFO_TRANSIENT_ERRORS',
+		'COUNT_ADDRINFO_PERMANENT_ERRORS',
+		'COUNTER',
+		'COUNT',
+		'COST_VALUE',
+		'COST_NAME',
+		'CORRECTION',
+		'CONVERSION_FACTOR',
+		'CONTEXT_VOLUNTARY',
+		'CONTEXT_INVOLUNTARY',
+		'CONSTRAINT_TYPE',
+		'CONSTRAINT_SCHEMA',
+		'CONSTRAINT_NAME',
+		'CONSTRAINT_CATALOG',
+		'CONN_ID',
+		'CONNECT_RETRY',
+		'CONNECTION_TYPE',
+		'CONNECTION_RETRY_INTERVAL',
+		'CONNECTION_RETRY_COUNT',
+		'CONFIGURED_BY',
+		'COMPRESS_TIME',
+		'COMPRESS_OPS_OK',
+		'COMPRESS_OPS',
+		'COMPRESSED_SIZE',
+		'COMPRESSED',
+		'COMPONENT_URN',
+		'COMPONENT_ID',
+		'COMPONENT_GROUP_ID',
+		'COMMENT',
+		'COMMAND_TYPE',
+		'COMMAND',
+		'COLUMN_TYPE',
+		'COLUMN_PRIV',
+		'COLUMN_NAME',
+		'COLUMN_KEY',
+		'COLUMN_DEFAULT',
+		'COLUMN_COMMENT',
+		'COLLATION_NAME',
+		'COLLATION_CONNECTION',
+		'COLLATION',
+		'CNT',
+		'CLUST_INDEX_SIZE',
+		'CLUSTERED_INDEX_SIZE',
+		'CHECK_TIME',
+		'CHECK_OPTION',
+		'CHECK_CLAUSE',
+		'CHECKSUM',
+		'CHECKPOINT_SEQNO',
+		'CHECKPOINT_RELAY_LOG_POS',
+		'CHECKPOINT_RELAY_LOG_NAME',
+		'CHECKPOINT_MASTER_LOG_POS',
+		'CHECKPOINT_MASTER_LOG_NAME',
+		'CHECKPOINT_GROUP_SIZE',
+		'CHECKPOINT_GROUP_BITMAP',
+		'CHARACTER_SET_NAME',
+		'CHARACTER_SET_CLIENT',
+		'CHARACTER_OCTET_LENGTH',
+		'CHARACTER_MAXIMUM_LENGTH',
+		'CHANNEL_NAME',
+		'CATALOG_NAME',
+		'CARDINALITY',
+		'BUFFER_POOL_INSTANCE',
+		'BUCKET_TIMER_LOW',
+		'BUCKET_TIMER_HIGH',
+		'BUCKET_QUANTILE',
+		'BUCKET_NUMBER',
+		'BLOCK_OPS_OUT',
+		'BLOCK_OPS_IN',
+		'BLOCK_ID',
+		'BLOCKING_TRX_STARTED',
+		'BLOCKING_TRX_ROWS_MODIFIED',
+		'BLOCKING_TRX_ROWS_LOCKED',
+		'BLOCKING_TRX_ID',
+		'BLOCKING_TRX_AGE',
+		'BLOCKING_THREAD_ID',
+		'BLOCKING_QUERY',
+		'BLOCKING_PID',
+		'BLOCKING_OBJECT_INSTANCE_BEGIN',
+		'BLOCKING_LOCK_TYPE',
+		'BLOCKING_LOCK_MODE',
+		'BLOCKING_LOCK_ID',
+		'BLOCKING_LOCK_DURATION',
+		'BLOCKING_EVENT_ID',
+		'BLOCKING_ENGINE_TRANSACTION_ID',
+		'BLOCKING_ENGINE_LOCK_ID',
+		'BLOCKING_ACCOUNT',
+		'BIND',
+		'BASE_POS',
+		'BACKEND_KEY_ID',
+		'AVG_WRITTEN',
+		'AVG_WRITE',
+		'AVG_US',
+		'AVG_TMP_TABLES_PER_QUERY',
+		'AVG_TIMER_WRITE_NORMAL',
+		'AVG_TIMER_WRITE_LOW_PRIORITY',
+		'AVG_TIMER_WRITE_EXTERNAL',
+		'AVG_TIMER_WRITE_CONCURRENT_INSERT',
+		'AVG_TIMER_WRITE_ALLOW_WRITE',
+		'AVG_TIMER_WRITE',
+		'AVG_TIMER_WAIT',
+		'AVG_TIMER_UPDATE',
+		'AVG_TIMER_READ_WRITE',
+		'AVG_TIMER_READ_WITH_SHARED_LOCKS',
+		'AVG_TIMER_READ_ONLY',
+		'AVG_TIMER_READ_NO_INSERT',
+		'AVG_TIMER_READ_NORMAL',
+		'AVG_TIMER_READ_HIGH_PRIORITY',
+		'AVG_TIMER_READ_EXTERNAL',
+		'AVG_TIMER_READ',
+		'AVG_TIMER_MISC',
+		'AVG_TIMER_INSERT',
+		'AVG_TIMER_FETCH',
+		'AVG_TIMER_EXECUTE',
+		'AVG_TIMER_DELETE',
+		'AVG_STATEMENTS_WAIT',
+		'AVG_SORT_MERGES',
+		'AVG_ROW_LENGTH',
+		'AVG_ROWS_SORTED',
+		'AVG_READ',
+		'AVG_LATENCY',
+		'AVG_COUNT_RESET',
+		'AVG_COUNT',
+		'AUTO_POSITION',
+		'AUTO_INCREMENT_RATIO',
+		'AUTO_INCREMENT',
+		'AUTOINC',
+		'AUTOEXTEND_SIZE',
+		'AUTOCOMMIT',
+		'AUTHENTICATION_STRING',
+		'ATTR_VALUE',
+		'ATTR_NAME',
+		'ARGUMENT',
+		'APPLYING_TRANSACTION_START_APPLY_TIMESTAMP',
+		'APPLYING_TRANSACTION_RETRIES_COUNT',
+		'APPLYING_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP',
+		'APPLYING_TRANSACTION_LAST_TRANSIENT_ERROR_TIMESTAMP',
+		'APPLYING_TRANSACTION_LAST_TRANSIENT_ERROR_NUMBER',
+		'APPLYING_TRANSACTION_LAST_TRANSIENT_ERROR_MESSAGE',
+		'APPLYING_TRANSACTION_IMMEDIATE_COMMIT_TIMESTAMP',
+		'APPLYING_TRANSACTION',
+		'ALTER_ROUTINE_PRIV',
+		'ALTER_PRIV',
+		'ALLOCATED_SIZE',
+		'ALLOCATED',
+		'ACTIVE_SINCE',
+		'ACTION_TIMING',
+		'ACTION_STATEMENT',
+		'ACTION_REFERENCE_OLD_TABLE',
+		'ACTION_REFERENCE_OLD_ROW',
+		'ACTION_REFERENCE_NEW_TABLE',
+		'ACTION_REFERENCE_NEW_ROW',
+		'ACTION_ORIENTATION',
+		'ACTION_ORDER',
+		'ACTION_CONDITION',
+		'ACCOUNT_LOCKED',
+		'ACCESS_TIME',
+		'ACCESS_MODE',
+		'ABBREVIATION',
+	)),
+	('SYSVAR', (
+		'WINDOWING_USE_HIGH_PRECISION',
+		'WARNING_COUNT',
+		'WAIT_TIMEOUT',
+		'VERSION_COMPILE_ZLIB',
+		'VERSION_COMPILE_OS',
+		'VERSION_COMPILE_MACHINE',
+		'VERSION_COMMENT',
+		'VERSION',
+		'USE_SECONDARY_ENGINE',
+		'UPDATABLE_VIEWS_WITH_LIMIT',
+		'UNIQUE_CHECKS',
+		'TRANSACTION_WRITE_SET_EXTRACTION',
+		'TRANSACTION_READ_ONLY',
+		'TRANSACTION_PREALLOC_SIZE',
+		'TRANSACTION_ISOLATION',
+		'TRANSACTION_ALLOW_BATCHING',
+		'TRANSACTION_ALLOC_BLOCK_SIZE',
+		'TMP_TABLE_SIZE',
+		'TMPDIR',
+		'TLS_VERSION',
+		'TLS_CIPHERSUITES',
+		'TIME_ZONE',
+		'TIMESTAMP',
+		'THREAD_STACK',
+		'THREAD_HANDLING',
+		'THREAD_CACHE_SIZE',
+		'TEMPTABLE_USE_MMAP',
+		'TEMPTABLE_MAX_RAM',
+		'TABLE_OPEN_CACHE_INSTANCES',
+		'TABLE_OPEN_CACHE',
+		'TABLE_ENCRYPTION_PRIVILEGE_CHECK',
+		'TABLE_DEFINITION_CACHE',
+		'TABLESPACE_DEFINITION_CACHE',
+		'SYSTEM_TIME_ZONE',
+		'SYNC_RELAY_LOG_INFO',
+		'SYNC_RELAY_LOG',
+		'SYNC_MASTER_INFO',
+		'SYNC_BINLOG',
+		'SUPER_READ_ONLY',
+		'STORED_PROGRAM_DEFINITION_CACHE',
+		'STORED_PROGRAM_CACHE',
+		'SSL_KEY',
+		'SSL_FIPS_MODE',
+		'SSL_CRLPATH',
+		'SSL_CRL',
+		'SSL_CIPHER',
+		'SSL_CERT',
+		'SSL_CAPATH',
+		'SSL_CA',
+		'SQL_WARNINGS',
+		'SQL_SLAVE_SKIP_COUNTER',
+		'SQL_SELECT_LIMIT',
+		'SQL_SAFE_UPDATES',
+		'SQL_REQUIRE_PRIMARY_KEY',
+		'SQL_QUOTE_SHOW_CREATE',
+		'SQL_NOTES',
+		'SQL_MODE',
+		'SQL_LOG_OFF',
+		'SQL_LOG_BIN',
+		'SQL_BUFFER_RESULT',
+		'SQL_BIG_SELECTS',
+		'SQL_AUTO_IS_NULL',
+		'SORT_BUFFER_SIZE',
+		'SOCKET',
+		'SLOW_QUERY_LOG_FILE',
+		'SLOW_QUERY_LOG',
+		'SLOW_LAUNCH_TIME',
+		'SLAVE_TYPE_CONVERSIONS',
+		'SLAVE_TRANSACTION_RETRIES',
+		'SLAVE_SQL_VERIFY_CHECKSUM',
+		'SLAVE_SKIP_ERRORS',
+		'SLAVE_ROWS_SEARCH_ALGORITHMS',
+		'SLAVE_PRESERVE_COMMIT_ORDER',
+		'SLAVE_PENDING_JOBS_SIZE_MAX',
+		'SLAVE_PARALLEL_WORKERS',
+		'SLAVE_PARALLEL_TYPE',
+		'SLAVE_NET_TIMEOUT',
+		'SLAVE_MAX_ALLOWED_PACKET',
+		'SLAVE_LOAD_TMPDIR',
+		'SLAVE_EXEC_MODE',
+		'SLAVE_COMPRESSED_PROTOCOL',
+		'SLAVE_CHECKPOINT_PERIOD',
+		'SLAVE_CHECKPOINT_GROUP',
+		'SLAVE_ALLOW_BATCHING',
+		'SKIP_SHOW_DATABASE',
+		'SKIP_NETWORKING',
+		'SKIP_NAME_RESOLVE',
+		'SKIP_EXTERNAL_LOCKING',
+		'SHOW_OLD_TEMPORALS',
+		'SHOW_CREATE_TABLE_VERBOSITY',
+		'SHA256_PASSWORD_PUBLIC_KEY_PATH',
+		'SHA256_PASSWORD_PROXY_USERS',
+		'SHA256_PASSWORD_PRIVATE_KEY_PATH',
+		'SHA256_PASSWORD_AUTO_GENERATE_RSA_KEYS',
+		'SESSION_TRACK_TRANSACTION_INFO',
+		'SESSION_TRACK_SYSTEM_VARIABLES',
+		'SESSION_TRACK_STATE_CHANGE',
+		'SESSION_TRACK_SCHEMA',
+		'SESSION_TRACK_GTIDS',
+		'SERVER_UUID',
+		'SERVER_ID_BITS',
+		'SERVER_ID',
+		'SECURE_FILE_PRIV',
+		'SECONDARY_ENGINE_COST_THRESHOLD',
+		'SCHEMA_DEFINITION_CACHE',
+		'RPL_STOP_SLAVE_TIMEOUT',
+		'RPL_READ_SIZE',
+		'RESULTSET_METADATA',
+		'REQUIRE_SECURE_TRANSPORT',
+		'REPORT_USER',
+		'REPORT_PORT',
+		'REPORT_PASSWORD',
+		'REPORT_HOST',
+		'RELAY_LOG_SPACE_LIMIT',
+		'RELAY_LOG_RECOVERY',
+		'RELAY_LOG_PURGE',
+		'RELAY_LOG_INFO_REPOSITORY',
+		'RELAY_LOG_INFO_FILE',
+		'RELAY_LOG_INDEX',
+		'RELAY_LOG_BASENAME',
+		'RELAY_LOG',
+		'REGEXP_TIME_LIMIT',
+		'REGEXP_STACK_LIMIT',
+		'READ_RND_BUFFER_SIZE',
+		'READ_ONLY',
+		'READ_BUFFER_SIZE',
+		'RBR_EXEC_MODE',
+		'RANGE_OPTIMIZER_MAX_MEM_SIZE',
+		'RANGE_ALLOC_BLOCK_SIZE',
+		'RAND_SEED2',
+		'RAND_SEED1',
+		'QUERY_PREALLOC_SIZE',
+		'QUERY_ALLOC_BLOCK_SIZE',
+		'PSEUDO_THREAD_ID',
+		'PSEUDO_SLAVE_MODE',
+		'PROXY_USER',
+		'PROTOCOL_VERSION',
+		'PROFILING_HISTORY_SIZE',
+		'PROFILING',
+		'PRELOAD_BUFFER_SIZE',
+		'PORT',
+		'PLUGIN_DIR',
+		'PID_FILE',
+		'PERSIST_ONLY_ADMIN_X509_SUBJECT',
+		'PERSISTED_GLOBALS_LOAD',
+		'PERFORMANCE_SCHEMA_USERS_SIZE',
+		'PERFORMANCE_SCHEMA_SETUP_OBJECTS_SIZE',
+		'PERFORMANCE_SCHEMA_SETUP_ACTORS_SIZE',
+		'PERFORMANCE_SCHEMA_SESSION_CONNECT_ATTRS_SIZE',
+		'PERFORMANCE_SCHEMA_MAX_THREAD_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_THREAD_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_TABLE_LOCK_STAT',
+		'PERFORMANCE_SCHEMA_MAX_TABLE_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_TABLE_HANDLES',
+		'PERFORMANCE_SCHEMA_MAX_STATEMENT_STACK',
+		'PERFORMANCE_SCHEMA_MAX_STATEMENT_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_STAGE_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_SQL_TEXT_LENGTH',
+		'PERFORMANCE_SCHEMA_MAX_SOCKET_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_SOCKET_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_RWLOCK_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_RWLOCK_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_PROGRAM_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_PREPARED_STATEMENTS_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_MUTEX_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_MUTEX_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_METADATA_LOCKS',
+		'PERFORMANCE_SCHEMA_MAX_MEMORY_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_INDEX_STAT',
+		'PERFORMANCE_SCHEMA_MAX_FILE_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_FILE_HANDLES',
+		'PERFORMANCE_SCHEMA_MAX_FILE_CLASSES',
+		'PERFORMANCE_SCHEMA_MAX_DIGEST_SAMPLE_AGE',
+		'PERFORMANCE_SCHEMA_MAX_DIGEST_LENGTH',
+		'PERFORMANCE_SCHEMA_MAX_COND_INSTANCES',
+		'PERFORMANCE_SCHEMA_MAX_COND_CLASSES',
+		'PERFORMANCE_SCHEMA_HOSTS_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_WAITS_HISTORY_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_WAITS_HISTORY_LONG_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_TRANSACTIONS_HISTORY_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_TRANSACTIONS_HISTORY_LONG_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_STATEMENTS_HISTORY_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_STATEMENTS_HISTORY_LONG_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_STAGES_HISTORY_SIZE',
+		'PERFORMANCE_SCHEMA_EVENTS_STAGES_HISTORY_LONG_SIZE',
+		'PERFORMANCE_SCHEMA_ERROR_SIZE',
+		'PERFORMANCE_SCHEMA_DIGESTS_SIZE',
+		'PERFORMANCE_SCHEMA_ACCOUNTS_SIZE',
+		'PERFORMANCE_SCHEMA',
+		'PASSWORD_REUSE_INTERVAL',
+		'PASSWORD_REQUIRE_CURRENT',
+		'PASSWORD_HISTORY',
+		'PARTIAL_REVOKES',
+		'PARSER_MAX_MEM_SIZE',
+		'ORIGINAL_SERVER_VERSION',
+		'ORIGINAL_COMMIT_TIMESTAMP',
+		'OPTIMIZER_TRACE_OFFSET',
+		'OPTIMIZER_TRACE_MAX_MEM_SIZE',
+		'OPTIMIZER_TRACE_LIMIT',
+		'OPTIMIZER_TRACE_FEATURES',
+		'OPTIMIZER_TRACE',
+		'OPTIMIZER_SWITCH',
+		'OPTIMIZER_SEARCH_DEPTH',
+		'OPTIMIZER_PRUNE_LEVEL',
+		'OPEN_FILES_LIMIT',
+		'OLD_ALTER_TABLE',
+		'OLD',
+		'OFFLINE_MODE',
+		'NGRAM_TOKEN_SIZE',
+		'NEW',
+		'NET_WRITE_TIMEOUT',
+		'NET_RETRY_COUNT',
+		'NET_READ_TIMEOUT',
+		'NET_BUFFER_LENGTH',
+		'MYSQL_NATIVE_PASSWORD_PROXY_USERS',
+		'MYSQLX_WRITE_TIMEOUT',
+		'MYSQLX_WAIT_TIMEOUT',
+		'MYSQLX_SSL_KEY',
+		'MYSQLX_SSL_CRLPATH',
+		'MYSQLX_SSL_CRL',
+		'MYSQLX_SSL_CIPHER',
+		'MYSQLX_SSL_CERT',
+		'MYSQLX_SSL_CAPATH',
+		'MYSQLX_SSL_CA',
+		'MYSQLX_SOCKET',
+		'MYSQLX_READ_TIMEOUT',
+		'MYSQLX_PORT_OPEN_TIMEOUT',
+		'MYSQLX_PORT',
+		'MYSQLX_MIN_WORKER_THREADS',
+		'MYSQLX_MAX_CONNECTIONS',
+		'MYSQLX_MAX_ALLOWED_PACKET',
+		'MYSQLX_INTERACTIVE_TIMEOUT',
+		'MYSQLX_IDLE_WORKER_THREAD_TIMEOUT',
+		'MYSQLX_ENABLE_HELLO_NOTICE',
+		'MYSQLX_DOCUMENT_ID_UNIQUE_PREFIX',
+		'MYSQLX_CONNECT_TIMEOUT',
+		'MYSQLX_BIND_ADDRESS',
+		'MYISAM_USE_MMAP',
+		'MYISAM_STATS_METHOD',
+		'MYISAM_SORT_BUFFER_SIZE',
+		'MYISAM_REPAIR_THREADS',
+		'MYISAM_RECOVER_OPTIONS',
+		'MYISAM_MMAP_SIZE',
+		'MYISAM_MAX_SORT_FILE_SIZE',
+		'MYISAM_DATA_POINTER_SIZE',
+		'MIN_EXAMINED_ROW_LIMIT',
+		'MAX_WRITE_LOCK_COUNT',
+		'MAX_USER_CONNECTIONS',
+		'MAX_SP_RECURSION_DEPTH',
+		'MAX_SORT_LENGTH',
+		'MAX_SEEKS_FOR_KEY',
+		'MAX_RELAY_LOG_SIZE',
+		'MAX_PREPARED_STMT_COUNT',
+		'MAX_POINTS_IN_GEOMETRY',
+		'MAX_LENGTH_FOR_SORT_DATA',
+		'MAX_JOIN_SIZE',
+		'MAX_INSERT_DELAYED_THREADS',
+		'MAX_HEAP_TABLE_SIZE',
+		'MAX_EXECUTION_TIME',
+		'MAX_ERROR_COUNT',
+		'MAX_DIGEST_LENGTH',
+		'MAX_DELAYED_THREADS',
+		'MAX_CONNECT_ERRORS',
+		'MAX_CONNECTIONS',
+		'MAX_BINLOG_STMT_CACHE_SIZE',
+		'MAX_BINLOG_SIZE',
+		'MAX_BINLOG_CACHE_SIZE',
+		'MAX_ALLOWED_PACKET',
+		'MASTER_VERIFY_CHECKSUM',
+		'MASTER_INFO_REPOSITORY',
+		'MANDATORY_ROLES',
+		'LOW_PRIORITY_UPDATES',
+		'LOWER_CASE_TABLE_NAMES',
+		'LOWER_CASE_FILE_SYSTEM',
+		'LONG_QUERY_TIME',
+		'LOG_TIMESTAMPS',
+		'LOG_THROTTLE_QUERIES_NOT_USING_INDEXES',
+		'LOG_STATEMENTS_UNSAFE_FOR_BINLOG',
+		'LOG_SLOW_SLAVE_STATEMENTS',
+		'LOG_SLOW_EXTRA',
+		'LOG_SLOW_ADMIN_STATEMENTS',
+		'LOG_SLAVE_UPDATES',
+		'LOG_QUERIES_NOT_USING_INDEXES',
+		'LOG_OUTPUT',
+		'LOG_ERROR_VERBOSITY',
+		'LOG_ERROR_SUPPRESSION_LIST',
+		'LOG_ERROR_SERVICES',
+		'LOG_ERROR',
+		'LOG_BIN_USE_V1_ROW_EVENTS',
+		'LOG_BIN_TRUST_FUNCTION_CREATORS',
+		'LOG_BIN_INDEX',
+		'LOG_BIN_BASENAME',
+		'LOG_BIN',
+		'LOCK_WAIT_TIMEOUT',
+		'LOCKED_IN_MEMORY',
+		'LOCAL_INFILE',
+		'LICENSE',
+		'LC_TIME_NAMES',
+		'LC_MESSAGES_DIR',
+		'LC_MESSAGES',
+		'LAST_INSERT_ID',
+		'LARGE_PAGE_SIZE',
+		'LARGE_PAGES',
+		'LARGE_FILES_SUPPORT',
+		'KEY_CACHE_DIVISION_LIMIT',
+		'KEY_CACHE_BLOCK_SIZE',
+		'KEY_CACHE_AGE_THRESHOLD',
+		'KEY_BUFFER_SIZE',
+		'KEYRING_OPERATIONS',
+		'KEYRING_FILE_DATA',
+		'KEEP_FILES_ON_CREATE',
+		'JOIN_BUFFER_SIZE',
+		'INTERNAL_TMP_MEM_STORAGE_ENGINE',
+		'INTERACTIVE_TIMEOUT',
+		'INSERT_ID',
+		'INNODB_WRITE_IO_THREADS',
+		'INNODB_VERSION',
+		'INNODB_USE_NATIVE_AIO',
+		'INNODB_UNDO_TABLESPACES',
+		'INNODB_UNDO_LOG_TRUNCATE',
+		'INNODB_UNDO_LOG_ENCRYPT',
+		'INNODB_UNDO_DIRECTORY',
+		'INNODB_TMPDIR',
+		'INNODB_THREAD_SLEEP_DELAY',
+		'INNODB_THREAD_CONCURRENCY',
+		'INNODB_TEMP_TABLESPACES_DIR',
+		'INNODB_TEMP_DATA_FILE_PATH',
+		'INNODB_TABLE_LOCKS',
+		'INNODB_SYNC_SPIN_LOOPS',
+		'INNODB_SYNC_ARRAY_SIZE',
+		'INNODB_STRICT_MODE',
+		'INNODB_STATUS_OUTPUT_LOCKS',
+		'INNODB_STATUS_OUTPUT',
+		'INNODB_STATS_TRANSIENT_SAMPLE_PAGES',
+		'INNODB_STATS_PERSISTENT_SAMPLE_PAGES',
+		'INNODB_STATS_PERSISTENT',
+		'INNODB_STATS_ON_METADATA',
+		'INNODB_STATS_METHOD',
+		'INNODB_STATS_INCLUDE_DELETE_MARKED',
+		'INNODB_STATS_AUTO_RECALC',
+		'INNODB_SPIN_WAIT_PAUSE_MULTIPLIER',
+		'INNODB_SPIN_WAIT_DELAY',
+		'INNODB_SORT_BUFFER_SIZE',
+		'INNODB_ROLLBACK_SEGMENTS',
+		'INNODB_ROLLBACK_ON_TIMEOUT',
+		'INNODB_REPLICATION_DELAY',
+		'INNODB_REDO_LOG_ENCRYPT',
+		'INNODB_READ_ONLY',
+		'INNODB_READ_IO_THREADS',
+		'INNODB_READ_AHEAD_THRESHOLD',
+		'INNODB_RANDOM_READ_AHEAD',
+		'INNODB_PURGE_THREADS',
+		'INNODB_PURGE_RSEG_TRUNCATE_FREQUENCY',
+		'INNODB_PURGE_BATCH_SIZE',
+		'INNODB_PRINT_DDL_LOGS',
+		'INNODB_PRINT_ALL_DEADLOCKS',
+		'INNODB_PARALLEL_READ_THREADS',
+		'INNODB_PAGE_SIZE',
+		'INNODB_PAGE_CLEANERS',
+		'INNODB_OPTIMIZE_FULLTEXT_ONLY',
+		'INNODB_OPEN_FILES',
+		'INNODB_ONLINE_ALTER_LOG_MAX_SIZE',
+		'INNODB_OLD_BLOCKS_TIME',
+		'INNODB_OLD_BLOCKS_PCT',
+		'INNODB_MONITOR_RESET_ALL',
+		'INNODB_MONITOR_RESET',
+		'INNODB_MONITOR_ENABLE',
+		'INNODB_MONITOR_DISABLE',
+		'INNODB_MAX_UNDO_LOG_SIZE',
+		'INNODB_MAX_PURGE_LAG_DELAY',
+		'INNODB_MAX_PURGE_LAG',
+		'INNODB_MAX_DIRTY_PAGES_PCT_LWM',
+		'INNODB_MAX_DIRTY_PAGES_PCT',
+		'INNODB_LRU_SCAN_DEPTH',
+		'INNODB_LOG_WRITE_AHEAD_SIZE',
+		'INNODB_LOG_WAIT_FOR_FLUSH_SPIN_HWM',
+		'INNODB_LOG_SPIN_CPU_PCT_HWM',
+		'INNODB_LOG_SPIN_CPU_ABS_LWM',
+		'INNODB_LOG_GROUP_HOME_DIR',
+		'INNODB_LOG_FILE_SIZE',
+		'INNODB_LOG_FILES_IN_GROUP',
+		'INNODB_LOG_COMPRESSED_PAGES',
+		'INNODB_LOG_CHECKSUMS',
+		'INNODB_LOG_BUFFER_SIZE',
+		'INNODB_LOCK_WAIT_TIMEOUT',
+		'INNODB_IO_CAPACITY_MAX',
+		'INNODB_IO_CAPACITY',
+		'INNODB_FT_USER_STOPWORD_TABLE',
+		'INNODB_FT_TOTAL_CACHE_SIZE',
+		'INNODB_FT_SORT_PLL_DEGREE',
+		'INNODB_FT_SERVER_STOPWORD_TABLE',
+		'INNODB_FT_RESULT_CACHE_LIMIT',
+		'INNODB_FT_NUM_WORD_OPTIMIZE',
+		'INNODB_FT_MIN_TOKEN_SIZE',
+		'INNODB_FT_MAX_TOKEN_SIZE',
+		'INNODB_FT_ENABLE_STOPWORD',
+		'INNODB_FT_ENABLE_DIAG_PRINT',
+		'INNODB_FT_CACHE_SIZE',
+		'INNODB_FT_AUX_TABLE',
+		'INNODB_FSYNC_THRESHOLD',
+		'INNODB_FORCE_RECOVERY',
+		'INNODB_FORCE_LOAD_CORRUPTED',
+		'INNODB_FLUSH_SYNC',
+		'INNODB_FLUSH_NEIGHBORS',
+		'INNODB_FLUSH_METHOD',
+		'INNODB_FLUSH_LOG_AT_TRX_COMMIT',
+		'INNODB_FLUSH_LOG_AT_TIMEOUT',
+		'INNODB_FLUSHING_AVG_LOOPS',
+		'INNODB_FILL_FACTOR',
+		'INNODB_FILE_PER_TABLE',
+		'INNODB_FAST_SHUTDOWN',
+		'INNODB_DOUBLEWRITE',
+		'INNODB_DISABLE_SORT_FILE_CACHE',
+		'INNODB_DIRECTORIES',
+		'INNODB_DEFAULT_ROW_FORMAT',
+		'INNODB_DEDICATED_SERVER',
+		'INNODB_DEADLOCK_DETECT',
+		'INNODB_DATA_HOME_DIR',
+		'INNODB_DATA_FILE_PATH',
+		'INNODB_CONCURRENCY_TICKETS',
+		'INNODB_COMPRESSION_PAD_PCT_MAX',
+		'INNODB_COMPRESSION_LEVEL',
+		'INNODB_COMPRESSION_FAILURE_THRESHOLD_PCT',
+		'INNODB_COMMIT_CONCURRENCY',
+		'INNODB_CMP_PER_INDEX_ENABLED',
+		'INNODB_CHECKSUM_ALGORITHM',
+		'INNODB_CHANGE_BUFFER_MAX_SIZE',
+		'INNODB_CHANGE_BUFFERING',
+		'INNODB_BUFFER_POOL_SIZE',
+		'INNODB_BUFFER_POOL_LOAD_NOW',
+		'INNODB_BUFFER_POOL_LOAD_AT_STARTUP',
+		'INNODB_BUFFER_POOL_LOAD_ABORT',
+		'INNODB_BUFFER_POOL_IN_CORE_FILE',
+		'INNODB_BUFFER_POOL_INSTANCES',
+		'INNODB_BUFFER_POOL_FILENAME',
+		'INNODB_BUFFER_POOL_DUMP_PCT',
+		'INNODB_BUFFER_POOL_DUMP_NOW',
+		'INNODB_BUFFER_POOL_DUMP_AT_SHUTDOWN',
+		'INNODB_BUFFER_POOL_CHUNK_SIZE',
+		'INNODB_AUTOINC_LOCK_MODE',
+		'INNODB_AUTOEXTEND_INCREMENT',
+		'INNODB_API_TRX_LEVEL',
+		'INNODB_API_ENABLE_MDL',
+		'INNODB_API_ENABLE_BINLOG',
+		'INNODB_API_DISABLE_ROWLOCK',
+		'INNODB_API_BK_COMMIT_INTERVAL',
+		'INNODB_ADAPTIVE_MAX_SLEEP_DELAY',
+		'INNODB_ADAPTIVE_HASH_INDEX_PARTS',
+		'INNODB_ADAPTIVE_HASH_INDEX',
+		'INNODB_ADAPTIVE_FLUSHING_LWM',
+		'INNODB_ADAPTIVE_FLUSHING',
+		'INIT_SLAVE',
+		'INIT_FILE',
+		'INIT_CONNECT',
+		'INFORMATION_SCHEMA_STATS_EXPIRY',
+		'IMMEDIATE_SERVER_VERSION',
+		'IDENTITY',
+		'HOST_CACHE_SIZE',
+		'HOSTNAME',
+		'HISTOGRAM_GENERATION_MAX_MEM_SIZE',
+		'HAVE_SYMLINK',
+		'HAVE_STATEMENT_TIMEOUT',
+		'HAVE_SSL',
+		'HAVE_RTREE_KEYS',
+		'HAVE_QUERY_CACHE',
+		'HAVE_PROFILING',
+		'HAVE_OPENSSL',
+		'HAVE_GEOMETRY',
+		'HAVE_DYNAMIC_LOADING',
+		'HAVE_COMPRESS',
+		'GTID_PURGED',
+		'GTID_OWNED',
+		'GTID_NEXT',
+		'GTID_MODE',
+		'GTID_EXECUTED_COMPRESSION_PERIOD',
+		'GTID_EXECUTED',
+		'GROUP_REPLICATION_CONSISTENCY',
+		'GROUP_CONCAT_MAX_LEN',
+		'GENERAL_LOG_FILE',
+		'GENERAL_LOG',
+		'FT_STOPWORD_FILE',
+		'FT_QUERY_EXPANSION_LIMIT',
+		'FT_MIN_WORD_LEN',
+		'FT_MAX_WORD_LEN',
+		'FT_BOOLEAN_SYNTAX',
+		'FOREIGN_KEY_CHECKS',
+		'FLUSH_TIME',
+		'FLUSH',
+		'EXTERNAL_USER',
+		'EXPLICIT_DEFAULTS_FOR_TIMESTAMP',
+		'EXPIRE_LOGS_DAYS',
+		'EVENT_SCHEDULER',
+		'ERROR_COUNT',
+		'EQ_RANGE_INDEX_DIVE_LIMIT',
+		'ENFORCE_GTID_CONSISTENCY',
+		'END_MARKERS_IN_JSON',
+		'DIV_PRECISION_INCREMENT',
+		'DISCONNECT_ON_EXPIRED_PASSWORD',
+		'DISABLED_STORAGE_ENGINES',
+		'DELAY_KEY_WRITE',
+		'DELAYED_QUEUE_SIZE',
+		'DELAYED_INSERT_TIMEOUT',
+		'DELAYED_INSERT_LIMIT',
+		'DEFAULT_WEEK_FORMAT',
+		'DEFAULT_TMP_STORAGE_ENGINE',
+		'DEFAULT_TABLE_ENCRYPTION',
+		'DEFAULT_STORAGE_ENGINE',
+		'DEFAULT_PASSWORD_LIFETIME',
+		'DEFAULT_COLLATION_FOR_UTF8MB4',
+		'DEFAULT_AUTHENTICATION_PLUGIN',
+		'DATADIR',
+		'CTE_MAX_RECURSION_DEPTH',
+		'CREATE_ADMIN_LISTENER_THREAD',
+		'CORE_FILE',
+		'CONNECT_TIMEOUT',
+		'CONCURRENT_INSERT',
+		'COMPLETION_TYPE',
+		'COLLATION_SERVER',
+		'COLLATION_DATABASE',
+		'COLLATION_CONNECTION',
+		'CHECK_PROXY_USERS',
+		'CHARACTER_SET_SYSTEM',
+		'CHARACTER_SET_SERVER',
+		'CHARACTER_SET_RESULTS',
+		'CHARACTER_SET_FILESYSTEM',
+		'CHARACTER_SET_DATABASE',
+		'CHARACTER_SET_CONNECTION',
+		'CHARACTER_SET_CLIENT',
+		'CHARACTER_SETS_DIR',
+		'CACHING_SHA2_PASSWORD_PUBLIC_KEY_PATH',
+		'CACHING_SHA2_PASSWORD_PRIVATE_KEY_PATH',
+		'CACHING_SHA2_PASSWORD_AUTO_GENERATE_RSA_KEYS',
+		'BULK_INSERT_BUFFER_SIZE',
+		'BLOCK_ENCRYPTION_MODE',
+		'BINLOG_TRANSACTION_DEPENDENCY_TRACKING',
+		'BINLOG_TRANSACTION_DEPENDENCY_HISTORY_SIZE',
+		'BINLOG_STMT_CACHE_SIZE',
+		'BINLOG_ROW_VALUE_OPTIONS',
+		'BINLOG_ROW_METADATA',
+		'BINLOG_ROW_IMAGE',
+		'BINLOG_ROW_EVENT_MAX_SIZE',
+		'BINLOG_ROWS_QUERY_LOG_EVENTS',
+		'BINLOG_ROTATE_ENCRYPTION_MASTER_KEY_AT_STARTUP',
+		'BINLOG_ORDER_COMMITS',
+		'BINLOG_MAX_FLUSH_QUEUE_TIME',
+		'BINLOG_GTID_SIMPLE_RECOVERY',
+		'BINLOG_GROUP_COMMIT_SYNC_NO_DELAY_COUNT',
+		'BINLOG_GROUP_COMMIT_SYNC_DELAY',
+		'BINLOG_FORMAT',
+		'BINLOG_EXPIRE_LOGS_SECONDS',
+		'BINLOG_ERROR_ACTION',
+		'BINLOG_ENCRYPTION',
+		'BINLOG_DIRECT_NON_TRANSACTIONAL_UPDATES',
+		'BINLOG_CHECKSUM',
+		'BINLOG_CACHE_SIZE',
+		'BIND_ADDRESS',
+		'BIG_TABLES',
+		'BASEDIR',
+		'BACK_LOG',
+		'AVOID_TEMPORAL_UPGRADE',
+		'AUTO_INCREMENT_OFFSET',
+		'AUTO_INCREMENT_INCREMENT',
+		'AUTO_GENERATE_CERTS',
+		'AUTOMATIC_SP_PRIVILEGES',
+		'AUTOCOMMIT',
+		'ADMIN_PORT',
+		'ADMIN_ADDRESS',
+		'ACTIVATE_ALL_ROLES_ON_LOGIN',
+	)),
+	('SYSVIEW', (
+		'X$WAIT_CLASSES_GLOBAL_BY_LATENCY',
+		'X$WAIT_CLASSES_GLOBAL_BY_AVG_LATENCY',
+		'X$WAITS_GLOBAL_BY_LATENCY',
+		'X$WAITS_BY_USER_BY_LATENCY',
+		'X$WAITS_BY_HOST_BY_LATENCY',
+		'X$USER_SUMMARY_BY_STATEMENT_TYPE',
+		'X$USER_SUMMARY_BY_STATEMENT_LATENCY',
+		'X$USER_SUMMARY_BY_STAGES',
+		'X$USER_SUMMARY_BY_FILE_IO_TYPE',
+		'X$USER_SUMMARY_BY_FILE_IO',
+		'X$USER_SUMMARY',
+		'X$STATEMENT_ANALYSIS',
+		'X$STATEMENTS_WITH_TEMP_TABLES',
+		'X$STATEMENTS_WITH_SORTING',
+		'X$STATEMENTS_WITH_RUNTIMES_IN_95TH_PERCENTILE',
+		'X$STATEMENTS_WITH_FULL_TABLE_SCANS',
+		'X$STATEMENTS_WITH_ERRORS_OR_WARNINGS',
+		'X$SESSION',
+		'X$SCHEMA_TABLE_STATISTICS_WITH_BUFFER',
+		'X$SCHEMA_TABLE_STATISTICS',
+		'X$SCHEMA_TABLE_LOCK_WAITS',
+		'X$SCHEMA_TABLES_WITH_FULL_TABLE_SCANS',
+		'X$SCHEMA_INDEX_STATISTICS',
+		'X$SCHEMA_FLATTENED_KEYS',
+		'X$PS_SCHEMA_TABLE_STATISTICS_IO',
+		'X$PS_DIGEST_AVG_LATENCY_DISTRIBUTION',
+		'X$PS_DIGEST_95TH_PERCENTILE_BY_AVG_US',
+		'X$PROCESSLIST',
+		'X$MEMORY_GLOBAL_TOTAL',
+		'X$MEMORY_GLOBAL_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_USER_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_THREAD_BY_CURRENT_BYTES',
+		'X$MEMORY_BY_HOST_BY_CURRENT_BYTES',
+		'X$LATEST_FILE_IO',
+		'X$IO_GLOBAL_BY_WAIT_BY_LATENCY',
+		'X$IO_GLOBAL_BY_WAIT_BY_BYTES',
+		'X$IO_GLOBAL_BY_FILE_BY_LATENCY',
+		'X$IO_GLOBAL_BY_FILE_BY_BYTES',
+		'X$IO_BY_THREAD_BY_LATENCY',
+		'X$INNODB_LOCK_WAITS',
+		'X$INNODB_BUFFER_STATS_BY_TABLE',
+		'X$INNODB_BUFFER_STATS_BY_SCHEMA',
+		'X$HOST_SUMMARY_BY_STATEMENT_TYPE',
+		'X$HOST_SUMMARY_BY_STATEMENT_LATENCY',
+		'X$HOST_SUMMARY_BY_STAGES',
+		'X$HOST_SUMMARY_BY_FILE_IO_TYPE',
+		'X$HOST_SUMMARY_BY_FILE_IO',
+		'X$HOST_SUMMARY',
+		'WAIT_CLASSES_GLOBAL_BY_LATENCY',
+		'WAIT_CLASSES_GLOBAL_BY_AVG_LATENCY',
+		'WAITS_GLOBAL_BY_LATENCY',
+		'WAITS_BY_USER_BY_LATENCY',
+		'WAITS_BY_HOST_BY_LATENCY',
+		'VERSION',
+		'USER_SUMMARY_BY_STATEMENT_TYPE',
+		'USER_SUMMARY_BY_STATEMENT_LATENCY',
+		'USER_SUMMARY_BY_STAGES',
+		'USER_SUMMARY_BY_FILE_IO_TYPE',
+		'USER_SUMMARY_BY_FILE_IO',
+		'USER_SUMMARY',
+		'STATEMENT_ANALYSIS',
+		'STATEMENTS_WITH_TEMP_TABLES',
+		'STATEMENTS_WITH_SORTING',
+		'STATEMENTS_WITH_RUNTIMES_IN_95TH_PERCENTILE',
+		'STATEMENTS_WITH_FULL_TABLE_SCANS',
+		'STATEMENTS_WITH_ERRORS_OR_WARNINGS',
+		'SESSION_SSL_STATUS',
+		'SESSION',
+		'SCHEMA_UNUSED_INDEXES',
+		'SCHEMA_TABLE_STATISTICS_WITH_BUFFER',
+		'SCHEMA_TABLE_STATISTICS',
+		'SCHEMA_TABLE_LOCK_WAITS',
+		'SCHEMA_TABLES_WITH_FULL_TABLE_SCANS',
+		'SCHEMA_REDUNDANT_INDEXES',
+		'SCHEMA_OBJECT_OVERVIEW',
+		'SCHEMA_INDEX_STATISTICS',
+		'SCHEMA_AUTO_INCREMENT_COLUMNS',
+		'PS_CHECK_LOST_INSTRUMENTATION',
+		'PROCESSLIST',
+		'METRICS',
+		'MEMORY_GLOBAL_TOTAL',
+		'MEMORY_GLOBAL_BY_CURRENT_BYTES',
+		'MEMORY_BY_USER_BY_CURRENT_BYTES',
+		'MEMORY_BY_THREAD_BY_CURRENT_BYTES',
+		'MEMORY_BY_HOST_BY_CURRENT_BYTES',
+		'LATEST_FILE_IO',
+		'IO_GLOBAL_BY_WAIT_BY_LATENCY',
+		'IO_GLOBAL_BY_WAIT_BY_BYTES',
+		'IO_GLOBAL_BY_FILE_BY_LATENCY',
+		'IO_GLOBAL_BY_FILE_BY_BYTES',
+		'IO_BY_THREAD_BY_LATENCY',
+		'INNODB_LOCK_WAITS',
+		'INNODB_BUFFER_STATS_BY_TABLE',
+		'INNODB_BUFFER_STATS_BY_SCHEMA',
+		'HOST_SUMMARY_BY_STATEMENT_TYPE',
+		'HOST_SUMMARY_BY_STATEMENT_LATENCY',
+		'HOST_SUMMARY_BY_STAGES',
+		'HOST_SUMMARY_BY_FILE_IO_TYPE',
+		'HOST_SUMMARY_BY_FILE_IO',
+		'HOST_SUMMARY',
+	)),
+	('SYSSTORED', (
+		'VERSION_PATCH',
+		'VERSION_MINOR',
+		'VERSION_MAJOR',
+		'TABLE_EXISTS',
+		'SYS_GET_CONFIG',
+		'STATEMENT_PERFORMANCE_ANALYZER',
+		'QUOTE_IDENTIFIER',
+		'PS_TRUNCATE_ALL_TABLES',
+		'PS_TRACE_THREAD',
+		'PS_TRACE_STATEMENT_DIGEST',
+		'PS_THREAD_TRX_INFO',
+		'PS_THREAD_STACK',
+		'PS_THREAD_ID',
+		'PS_THREAD_ACCOUNT',
+		'PS_STATEMENT_AVG_LATENCY_HISTOGRAM',
+		'PS_SETUP_SHOW_ENABLED_INSTRUMENTS',
+		'PS_SETUP_SHOW_ENABLED_CONSUMERS',
+		'PS_SETUP_SHOW_ENABLED',
+		'PS_SETUP_SHOW_DISABLED_INSTRUMENTS',
+		'PS_SETUP_SHOW_DISABLED_CONSUMERS',
+		'PS_SETUP_SHOW_DISABLED',
+		'PS_SETUP_SAVE',
+		'PS_SETUP_RESET_TO_DEFAULT',
+		'PS_SETUP_RELOAD_SAVED',
+		'PS_SETUP_ENABLE_THREAD',
+		'PS_SETUP_ENABLE_INSTRUMENT',
+		'PS_SETUP_ENABLE_CONSUMER',
+		'PS_SETUP_ENABLE_BACKGROUND_THREADS',
+		'PS_SETUP_DISABLE_THREAD',
+		'PS_SETUP_DISABLE_INSTRUMENT',
+		'PS_SETUP_DISABLE_CONSUMER',
+		'PS_SETUP_DISABLE_BACKGROUND_THREADS',
+		'PS_IS_THREAD_INSTRUMENTED',
+		'PS_IS_INSTRUMENT_DEFAULT_TIMED',
+		'PS_IS_INSTRUMENT_DEFAULT_ENABLED',
+		'PS_IS_CONSUMER_ENABLED',
+		'PS_IS_ACCOUNT_ENABLED',
+		'LIST_DROP',
+		'LIST_ADD',
+		'FORMAT_TIME',
+		'FORMAT_STATEMENT',
+		'FORMAT_PATH',
+		'FORMAT_BYTES',
+		'EXTRACT_TABLE_FROM_FILE_NAME',
+		'EXTRACT_SCHEMA_FROM_FILE_NAME',
+		'EXECUTE_PREPARED_STMT',
+		'DIAGNOSTICS',
+		'CREATE_SYNONYM_DB',
+	)),
+)
@@ -1,5 +1,6 @@
 import re
 import os
+import numpy as np
 
 PUNCTATION_SUB = [
 	("&&", "AND"),
@@ -704,15 +705,80 @@ def extract_fields_fromfile(filename):
 
 
 # query su mysql per estrarli tutti
-SYS_DEF = [
+SYS_DEF_SOURCES = [
 	("SYS_DB", ["MYSQL", "INFORMATION_SCHEMA", "SYS", "PERFORMANCE_SCHEMA"]),
-	("SYSTBL", extract_fields_fromfile("systables")),
-	("SYSCOL", extract_fields_fromfile("info_schema_columns")),
-	("SYSVAR", extract_fields_fromfile("mysql_variables")),
-	("SYSVIEW", extract_fields_fromfile("sysviews")),
-	("SYSSTORED", extract_fields_fromfile("sysroutines")),
+	("SYSTBL", "systables"),
+	("SYSCOL", "info_schema_columns"),
+	("SYSVAR", "mysql_variables"),
+	("SYSVIEW", "sysviews"),
+	("SYSSTORED", "sysroutines"),
 ]
 
+
+def build_sys_def():
+	"""Builds the system dictionaries by reading the text files of the tokenizer package.
+
+	Returns:
+		list : (token, fields) pairs, with fields sorted in reverse order
+	"""
+	return [
+		(token, source if isinstance(source, list) else extract_fields_fromfile(source))
+		for token, source in SYS_DEF_SOURCES
+	]
+
+
+def compile_sys_def(output_path=None):
+	"""Writes the system dictionaries as a precompiled python module.
+	It must be run again whenever one of the dictionary files changes.
+
+	Keyword Arguments:
+		output_path (str) : where to write the module (default: (the _sys_def module of this package))
+
+	Returns:
+		str : the path of the written module
+	"""
+	if output_path is None:
+		output_path = os.path.join(os.path.dirname(__file__), "_sys_def.py")
+	lines = [
+		'"""System dictionaries used by allowed_tokens.',
+		"",
+		"Generated by wafamole.tokenizer.allowed_tokens.compile_sys_def, do not edit.",
+		'"""',
+		"SYS_DEF = (",
+	]
+	for token, fields in build_sys_def():
+		lines.append("\t({!r}, (".format(token))
+		lines.extend("\t\t{!r},".format(f) for f in fields)
+		lines.append("\t)),")
+	lines.append(")")
+	with open(output_path, "w") as f:
+		f.write("\n".join(lines) + "\n")
+	return output_path
+
+
+def _load_sys_def():
+	try:
+		from wafamole.tokenizer._sys_def import SYS_DEF as sys_def
+	except ImportError:
+		sys_def = build_sys_def()
+	return sys_def
+
+
+def _get_sys_def():
+	# SYS_DEF is loaded on first use, so that importing this module does not
+	# pay for the system dictionaries when they are never needed.
+	sys_def = globals().get("SYS_DEF")
+	if sys_def is None:
+		sys_def = globals()["SYS_DEF"] = _load_sys_def()
+	return sys_def
+
+
+def __getattr__(name):
+	if name == "SYS_DEF":
+		return _get_sys_def()
+	raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 USR_DEF = [
 	# ("USR_DB",[]), not in our db
 	("USRTBL", ["TAB"]),
@@ -727,7 +793,7 @@ NUMB_TOKENS = ["DECIMAL", "INT", "HEX", "IP_ADDR"]
 TOKENS = SYMBOLS + SQL_FUNC
 for i in PUNCTATION_SUB:
 	TOKENS.append(i[1])
-for i in SYS_DEF:
+for i in SYS_DEF_SOURCES:
 	TOKENS.append(i[0])
 for i in USR_DEF:
 	TOKENS.append(i[0])
@@ -736,6 +802,31 @@ for i in NUMB_TOKENS:
 TOKENS.append("STR")
 TOKENS.append("CHR")
 
+# Interned vocabulary: each token string is mapped to the index of its first
+# occurrence inside TOKENS (same result of TOKENS.index, without the scan).
+TOKEN_IDS = {}
+for i, t in enumerate(TOKENS):
+	TOKEN_IDS.setdefault(t, i)
+
+TOKEN_DTYPE = np.int16
+
+
+def encode_tokens(tokens):
+	"""Converts a sequence of tokens into a compact array of token ids.
+
+	Arguments:
+		tokens (list) : tokens belonging to TOKENS
+
+	Raises:
+		KeyError: a token is not part of the vocabulary
+
+	Returns:
+		numpy ndarray : the token ids, one for each input token
+	"""
+	return np.fromiter(
+		(TOKEN_IDS[t] for t in tokens), dtype=TOKEN_DTYPE, count=len(tokens)
+	)
+
 
 def _substitute_list_token(token_list, query, insert_space=False):
 	for sys_token in token_list:
@@ -748,7 +839,7 @@ def _substitute_list_token(token_list, query, insert_space=False):
 
 
 def substitute_sysinfo(query, insert_space=False):
-	query = _substitute_list_token(SYS_DEF, query, insert_space=True)
+	query = _substitute_list_token(_get_sys_def(), query, insert_space=True)
 	query = _substitute_list_token(USR_DEF, query, insert_space=True)
 	return query
 